@@ -18,6 +18,7 @@ from __future__ import annotations
 import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 PROJECT_DIR = Path(__file__).resolve().parents[2]
@@ -27,6 +28,8 @@ if str(PROJECT_DIR) not in sys.path:
 from clawbox.config import vm_base_name
 from clawbox.tart import TartClient, TartError
 
+IP_LOOKUP_MAX_WORKERS = 8
+
 
 def vm_pattern() -> re.Pattern[str]:
     base_name = vm_base_name()
@@ -59,15 +62,22 @@ def build_inventory(tart: TartClient | None = None):
     tart_client = tart or TartClient()
 
     pattern = vm_pattern()
+    candidates = []
     for vm_name, running in get_tart_vms(tart_client):
         match = pattern.match(vm_name)
         if not match:
             continue
         if not running:
             continue
+        candidates.append((vm_name, int(match.group(1))))
+
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=min(IP_LOOKUP_MAX_WORKERS, len(candidates))) as pool:
+            ips = list(pool.map(lambda candidate: get_tart_ip(tart_client, candidate[0]), candidates))
+    else:
+        ips = [get_tart_ip(tart_client, vm_name) for vm_name, _ in candidates]
 
-        vm_number = int(match.group(1))
-        ip = get_tart_ip(tart_client, vm_name)
+    for (vm_name, vm_number), ip in zip(candidates, ips):
         if not ip:
             print(f"Warning: Could not resolve IP for {vm_name}, skipping", file=sys.stderr)
             continue
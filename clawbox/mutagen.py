@@ -4,7 +4,9 @@ import json
 import re
 import shutil
 import subprocess
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from clawbox.io_utils import atomic_write_text, read_text_or_empty
@@ -33,6 +35,7 @@ class SessionSpec:
     ready_required: bool = True
 
 
+@lru_cache(maxsize=1)
 def mutagen_available() -> bool:
     return shutil.which("mutagen") is not None
 
@@ -253,8 +256,7 @@ def _active_vms_registry_path(state_dir: Path) -> Path:
     return state_dir / _MUTAGEN_ACTIVE_VMS_PATH
 
 
-def _read_active_vms(path: Path) -> list[str]:
-    raw = _read_text(path)
+def _parse_active_vms(raw: str | bytes) -> list[str]:
     if not raw:
         return []
     try:
@@ -273,16 +275,21 @@ def _read_active_vms(path: Path) -> list[str]:
     return sorted(set(clean))
 
 
+def _read_active_vms(path: Path) -> list[str]:
+    return _parse_active_vms(_read_text(path))
+
+
 def _write_active_vms(path: Path, vms: list[str]) -> None:
     atomic_write_text(path, json.dumps({"vms": sorted(set(vms))}, sort_keys=True) + "\n")
 
 
-def mark_vm_active(state_dir: Path, vm_name: str) -> None:
+def mark_vms_active(state_dir: Path, vm_names: Iterable[str]) -> None:
     registry = _active_vms_registry_path(state_dir)
-    vms = _read_active_vms(registry)
-    if vm_name not in vms:
-        vms.append(vm_name)
-    _write_active_vms(registry, vms)
+    _write_active_vms(registry, [*_read_active_vms(registry), *vm_names])
+
+
+def mark_vm_active(state_dir: Path, vm_name: str) -> None:
+    mark_vms_active(state_dir, [vm_name])
 
 
 def clear_vm_active(state_dir: Path, vm_name: str) -> None:
@@ -26,12 +26,15 @@ from clawbox.locks import (
 from clawbox.mutagen import (
     MutagenError,
     SessionSpec,
+    clear_vm_active as clear_mutagen_vm_active,
     ensure_mutagen_ssh_alias,
     ensure_vm_sessions,
     mark_vm_active as mark_mutagen_vm_active,
     mutagen_available,
     reconcile_vm_sync,
+    remove_mutagen_ssh_alias,
     teardown_vm_sync,
+    vm_sessions_exist,
     vm_sessions_status,
 )
 from clawbox.secrets import (
@@ -59,8 +62,8 @@ from clawbox.status import (
     status_environment as status_environment_impl,
     status_vm as status_vm_impl,
 )
-from clawbox.state import ProvisionMarker, current_utc_timestamp
-from clawbox.tart import TartClient, TartError, wait_for_vm_running
+from clawbox.state import ProvisionMarker, current_utc_timestamp, marker_path_for
+from clawbox.tart import TartClient, TartError, poll_with_backoff, wait_for_vm_running
 from clawbox.watcher import (
     WatcherError,
     reconcile_vm_watchers,
@@ -312,6 +315,18 @@ def _with_virtualization_limit_hint(message: str) -> str:
     )
 
 
+def _write_marker(path: Path, text: str) -> None:
+    path.write_text(text, encoding="utf-8")
+
+
+def _write_sync_marker(path: Path) -> None:
+    _write_marker(path, "ready\n")
+
+
+def _delete_sync_marker(path: Path) -> None:
+    path.unlink(missing_ok=True)
+
+
 def _ensure_signal_payload_host_marker(signal_payload_host: str, vm_name: str) -> None:
     marker_path = Path(signal_payload_host) / SIGNAL_PAYLOAD_MARKER_FILENAME
     marker_content = (
@@ -319,7 +334,7 @@ def _ensure_signal_payload_host_marker(signal_payload_host: str, vm_name: str) -
         f"vm: {vm_name}\n"
     )
     try:
-        marker_path.write_text(marker_content, encoding="utf-8")
+        _write_marker(marker_path, marker_content)
     except OSError as exc:
         raise UserFacingError(
             f"Error: Could not write signal payload marker file: {marker_path}\n{exc}"
@@ -344,6 +359,10 @@ def _acquire_locks(
         raise UserFacingError(str(exc)) from exc
 
 
+def _is_provisioned(vm_name: str) -> bool:
+    return marker_path_for(STATE_DIR, vm_name).exists()
+
+
 def _mutagen_key_path(vm_name: str) -> Path:
     return STATE_DIR / "mutagen" / "keys" / vm_name / "id_ed25519"
 
@@ -491,7 +510,7 @@ def _wait_for_mutagen_sync_ready(
         host_marker = spec.host_path / marker_name
         guest_marker = f"{spec.guest_path}/{marker_name}"
         try:
-            host_marker.write_text("ready\n", encoding="utf-8")
+            _write_sync_marker(host_marker)
         except OSError as exc:
             raise UserFacingError(
                 "Error: Could not write sync readiness marker on host path.\n"
@@ -530,7 +549,7 @@ def _wait_for_mutagen_sync_ready(
             waited += 2
     finally:
         for host_marker, _required in marker_paths.values():
-            host_marker.unlink(missing_ok=True)
+            _delete_sync_marker(host_marker)
 
     status_lines = _format_mount_statuses(last_statuses)
     hint_lines = [
@@ -692,6 +711,19 @@ def _deactivate_mutagen_sync(vm_name: str, *, flush: bool, reason: str = "unspec
         reason=reason,
         details={"flush": flush},
     )
+    if not vm_sessions_exist(vm_name):
+        # No labelled sessions to flush or terminate; the local registry entry and SSH alias still go.
+        clear_mutagen_vm_active(STATE_DIR, vm_name)
+        remove_mutagen_ssh_alias(vm_name)
+        emit_sync_event(
+            STATE_DIR,
+            vm_name,
+            event="teardown_skipped",
+            actor="orchestrator",
+            reason=reason,
+            details={"flush": flush, "skipped": "no_live_sessions"},
+        )
+        return
     try:
         teardown_vm_sync(STATE_DIR, vm_name, flush=flush)
     except MutagenError as exc:
@@ -753,9 +785,8 @@ def launch_vm(
         )
     if profile == "developer" and not mutagen_available():
         raise UserFacingError("Error: Command not found: mutagen")
-    marker_file = STATE_DIR / f"{vm_name}.provisioned"
     launch_sync_auth_mode: MutagenAuthMode = (
-        "vm_user" if marker_file.exists() else "bootstrap_admin"
+        "vm_user" if _is_provisioned(vm_name) else "bootstrap_admin"
     )
 
     if tart.vm_running(vm_name):
@@ -846,7 +877,7 @@ def launch_vm(
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProvisionOptions:
     vm_number: int
     profile: str
@@ -1201,11 +1232,11 @@ def provision_vm(opts: ProvisionOptions, tart: TartClient) -> None:
         provisioned_at=current_utc_timestamp(),
         sync_backend=REQUIRED_DEVELOPER_SYNC_BACKEND if opts.profile == "developer" else "",
     )
-    marker.write(STATE_DIR / f"{vm_name}.provisioned")
+    marker.write(marker_path_for(STATE_DIR, vm_name))
     print(f"Provisioning completed: {vm_name}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UpOptions:
     vm_number: int
     profile: str
@@ -1221,31 +1252,23 @@ def _stop_vm_and_wait(tart: TartClient, vm_name: str, timeout_seconds: int) -> b
     stop_vm_watcher(STATE_DIR, vm_name)
     _deactivate_mutagen_sync(vm_name, flush=True, reason="_stop_vm_and_wait")
     tart.stop(vm_name)
-    waited = 0
-    while waited < timeout_seconds:
-        if not tart.vm_running(vm_name):
-            return True
-        time.sleep(2)
-        waited += 2
-    return not tart.vm_running(vm_name)
+    return poll_with_backoff(lambda: not tart.vm_running(vm_name), timeout_seconds)
 
 
 def _render_up_command(opts: UpOptions) -> str:
-    cmd = ["clawbox", "up", str(opts.vm_number)]
-    if opts.profile == "developer":
-        cmd.append("--developer")
-        cmd += ["--openclaw-source", opts.openclaw_source]
-        cmd += ["--openclaw-payload", opts.openclaw_payload]
+    developer_args = (
+        ("--developer", "--openclaw-source", opts.openclaw_source, "--openclaw-payload", opts.openclaw_payload)
+        if opts.profile == "developer"
+        else ()
+    )
     enabled_services = enabled_optional_service_keys(
         enable_playwright=opts.enable_playwright,
         enable_tailscale=opts.enable_tailscale,
         enable_signal_cli=opts.enable_signal_cli,
     )
-    for spec in OPTIONAL_SERVICES:
-        if spec.key in enabled_services:
-            cmd.append(spec.cli_flag)
-    if opts.signal_payload:
-        cmd += ["--signal-cli-payload", opts.signal_payload]
+    service_flags = tuple(spec.cli_flag for spec in OPTIONAL_SERVICES if spec.key in enabled_services)
+    signal_args = ("--signal-cli-payload", opts.signal_payload) if opts.signal_payload else ()
+    cmd = ("clawbox", "up", str(opts.vm_number), *developer_args, *service_flags, *signal_args)
     return " ".join(shlex.quote(part) for part in cmd)
 
 
@@ -1430,7 +1453,7 @@ def up(opts: UpOptions, tart: TartClient) -> None:
 
     _validate_dirs([opts.openclaw_source, opts.openclaw_payload, opts.signal_payload])
     vm_name = vm_name_for(opts.vm_number)
-    marker_file = STATE_DIR / f"{vm_name}.provisioned"
+    marker_file = marker_path_for(STATE_DIR, vm_name)
     desired_signal_payload = bool(opts.signal_payload)
 
     ensure_secrets_file(create_if_missing=True)
@@ -1527,13 +1550,7 @@ def recreate(opts: UpOptions, tart: TartClient) -> None:
 
 
 def _wait_for_vm_absent(tart: TartClient, vm_name: str, timeout_seconds: int) -> bool:
-    waited = 0
-    while waited < timeout_seconds:
-        if not tart.vm_exists(vm_name):
-            return True
-        time.sleep(2)
-        waited += 2
-    return not tart.vm_exists(vm_name)
+    return poll_with_backoff(lambda: not tart.vm_exists(vm_name), timeout_seconds)
 
 
 def down_vm(vm_number: int, tart: TartClient) -> None:
@@ -1563,7 +1580,7 @@ def down_vm(vm_number: int, tart: TartClient) -> None:
 
 def delete_vm(vm_number: int, tart: TartClient) -> None:
     vm_name = vm_name_for(vm_number)
-    marker_file = STATE_DIR / f"{vm_name}.provisioned"
+    marker_file = marker_path_for(STATE_DIR, vm_name)
 
     if not tart.vm_exists(vm_name):
         stop_vm_watcher(STATE_DIR, vm_name)
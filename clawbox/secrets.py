@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from clawbox.scalar_parsing import parse_scalar
@@ -39,8 +40,15 @@ def parse_vm_password(text: str) -> str | None:
     return value if value else None
 
 
+@lru_cache(maxsize=8)
+def _read_vm_password_cached(path: str, mtime_ns: int, size: int) -> str | None:
+    # mtime_ns and size only key the cache so an edited secrets file is parsed again.
+    return parse_vm_password(Path(path).read_text(encoding="utf-8"))
+
+
 def read_vm_password(path: Path) -> str:
-    value = parse_vm_password(path.read_text(encoding="utf-8"))
+    stat = path.stat()
+    value = _read_vm_password_cached(str(path), stat.st_mtime_ns, stat.st_size)
     if not value:
         raise ValueError(f"Error: Could not parse vm_password from {path}")
     return value
@@ -2,10 +2,30 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+MARKER_SUFFIX = ".provisioned"
 
-@dataclass
+
+@lru_cache(maxsize=256)
+def _read_marker_fields(marker_path: str, mtime_ns: int, size: int) -> tuple[tuple[str, str], ...]:
+    # mtime_ns and size only key the cache so rewritten markers are parsed again.
+    data: dict[str, str] = {}
+    for line in Path(marker_path).read_text(encoding="utf-8").splitlines():
+        if ":" not in line:
+            continue
+        key, value = line.split(":", 1)
+        data[key.strip()] = value.strip()
+    return tuple(data.items())
+
+
+@lru_cache(maxsize=256)
+def marker_path_for(state_dir: Path, vm_name: str) -> Path:
+    return state_dir / f"{vm_name}{MARKER_SUFFIX}"
+
+
+@dataclass(frozen=True, slots=True)
 class ProvisionMarker:
     vm_name: str
     profile: str
@@ -18,14 +38,11 @@ class ProvisionMarker:
 
     @classmethod
     def from_file(cls, marker_file: Path) -> "ProvisionMarker | None":
-        if not marker_file.exists():
+        try:
+            stat = marker_file.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return None
-        data: dict[str, str] = {}
-        for line in marker_file.read_text(encoding="utf-8").splitlines():
-            if ":" not in line:
-                continue
-            key, value = line.split(":", 1)
-            data[key.strip()] = value.strip()
+        data = dict(_read_marker_fields(str(marker_file), stat.st_mtime_ns, stat.st_size))
         if not data:
             return None
 
@@ -43,9 +60,8 @@ class ProvisionMarker:
             provisioned_at=data.get("provisioned_at", ""),
         )
 
-    def write(self, marker_file: Path) -> None:
-        marker_file.parent.mkdir(parents=True, exist_ok=True)
-        marker_file.write_text(
+    def to_text(self) -> str:
+        return (
             "\n".join(
                 [
                     f"vm_name: {self.vm_name}",
@@ -58,10 +74,14 @@ class ProvisionMarker:
                     f"provisioned_at: {self.provisioned_at}",
                 ]
             )
-            + "\n",
-            encoding="utf-8",
+            + "\n"
         )
 
+    def write(self, marker_file: Path) -> None:
+        marker_file.parent.mkdir(parents=True, exist_ok=True)
+        marker_file.write_text(self.to_text(), encoding="utf-8")
+        _read_marker_fields.cache_clear()
+
 
 def current_utc_timestamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -1,26 +1,35 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import shlex
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, Sequence
+from typing import Any, Literal, Mapping, Sequence
 
 from clawbox.auth import vm_user_credentials
 from clawbox.config import vm_base_name, vm_name_for
 from clawbox.mutagen import MutagenError, mutagen_available, vm_sessions_status
 from clawbox.remote_probe import RemoteShellContext, ansible_shell as ansible_shell_shared
 from clawbox.secrets import missing_secrets_message
-from clawbox.state import ProvisionMarker
+from clawbox.state import MARKER_SUFFIX, ProvisionMarker, marker_path_for
 from clawbox.tart import TartClient
 
 MountProbeState = Literal["not_applicable", "ok", "unavailable"]
 SignalProbeState = Literal["not_applicable"]
 MutagenProbeState = Literal["not_applicable", "ok", "unavailable"]
 
+TartSnapshot = Mapping[str, Mapping[str, Any]]
+
 _MOUNT_STATUS_RE = re.compile(r"['\"]?(?P<path>.+?)['\"]?=(?P<status>mounted|dir|missing|ok)")
+_MUTAGEN_NO_SESSIONS = "No synchronization sessions found"
+_MUTAGEN_SUMMARY_PREFIXES = ("Name: ", "Status: ")
+_MUTAGEN_SUMMARY_LIMIT = 6
+_STATUS_PROBE_MAX_WORKERS = 8
 
 
 @dataclass(frozen=True)
@@ -109,17 +118,16 @@ class VMStatusReport:
 
 
 def build_mount_status_command(mount_paths: Sequence[str]) -> str:
-    clauses: list[str] = []
+    clauses = ["mounts=$(/sbin/mount 2>/dev/null)"]
     for path in mount_paths:
         quoted_path = shlex.quote(path)
         mount_probe = shlex.quote(f" on {path} (")
         clauses.append(
-            "if /sbin/mount | /usr/bin/grep -F -- "
-            f"{mount_probe} >/dev/null 2>&1; then "
-            f"printf '%s=%s\\n' {quoted_path} mounted; "
-            f"elif [ -d {quoted_path} ]; then "
+            f'case "$mounts" in *{mount_probe}*) '
+            f"printf '%s=%s\\n' {quoted_path} mounted;; *) "
+            f"if [ -d {quoted_path} ]; then "
             f"printf '%s=%s\\n' {quoted_path} dir; "
-            f"else printf '%s=%s\\n' {quoted_path} missing; fi"
+            f"else printf '%s=%s\\n' {quoted_path} missing; fi;; esac"
         )
     return "; ".join(clauses)
 
@@ -242,16 +250,23 @@ def _status_report_base(
 
 
 def _summarize_mutagen_status(status_output: str) -> tuple[bool, list[str]]:
-    lines = [line.strip() for line in status_output.splitlines() if line.strip()]
-    filtered = [line for line in lines if set(line) != {"-"}]
-    if not filtered:
-        return False, ["no active sessions found"]
-    if any("No synchronization sessions found" in line for line in filtered):
-        return False, ["no active sessions found"]
-    session_summary = [line for line in filtered if line.startswith("Name: ") or line.startswith("Status: ")]
+    session_summary: list[str] = []
+    head: list[str] = []
+    for raw in status_output.splitlines():
+        line = raw.strip()
+        if not line.strip("-"):
+            continue
+        if _MUTAGEN_NO_SESSIONS in line:
+            return False, ["no active sessions found"]
+        if len(head) < _MUTAGEN_SUMMARY_LIMIT:
+            head.append(line)
+        if len(session_summary) < _MUTAGEN_SUMMARY_LIMIT and line.startswith(_MUTAGEN_SUMMARY_PREFIXES):
+            session_summary.append(line)
     if session_summary:
-        return True, session_summary[:6]
-    return True, filtered[:6]
+        return True, session_summary
+    if head:
+        return True, head
+    return False, ["no active sessions found"]
 
 
 def _probe_mutagen_sync(vm_name: str) -> tuple[MutagenProbeState, bool | None, list[str]]:
@@ -316,7 +331,7 @@ def _render_status_report_text(
     print(f"VM: {vm_name}")
     print(f"  exists: {'yes' if report.exists else 'no'}")
     print(f"  running: {'yes' if report.running else 'no'}")
-    print(f"  provision marker: {'present' if marker_file.exists() else 'missing'}")
+    print(f"  provision marker: {'present' if report.provision_marker.present else 'missing'}")
     if marker:
         print(
             "  marker profile/playwright/tailscale/signal_cli/signal_payload/sync_backend: "
@@ -358,22 +373,33 @@ def _render_status_report_text(
     return
 
 
+def _vm_presence(vm_name: str, tart: TartClient, snapshot: TartSnapshot | None) -> tuple[bool, bool]:
+    if snapshot is None:
+        exists = tart.vm_exists(vm_name)
+        return exists, tart.vm_running(vm_name) if exists else False
+    vm = snapshot.get(vm_name)
+    if vm is None:
+        return False, False
+    return True, vm.get("Running") is True
+
+
 def _build_vm_status_report(
     vm_name: str,
     tart: TartClient,
     *,
     context: StatusContext,
+    snapshot: TartSnapshot | None = None,
 ) -> tuple[Path, ProvisionMarker | None, VMStatusReport]:
-    marker_file = context.state_dir / f"{vm_name}.provisioned"
+    marker_file = marker_path_for(context.state_dir, vm_name)
     marker = ProvisionMarker.from_file(marker_file)
-    exists = tart.vm_exists(vm_name)
-    running = tart.vm_running(vm_name) if exists else False
+    exists, running = _vm_presence(vm_name, tart, snapshot)
 
     report = _status_report_base(vm_name, marker_file, marker, exists, running)
-    if exists:
-        report.ip = tart.ip(vm_name)
+    if not exists:
+        return marker_file, marker, report
+    report.ip = tart.ip(vm_name)
 
-    if exists and running and report.ip:
+    if running and report.ip:
         if report.mutagen_sync.enabled:
             mutagen_probe, mutagen_active, mutagen_lines = _probe_mutagen_sync(vm_name)
             report.mutagen_sync.probe = mutagen_probe
@@ -423,22 +449,28 @@ def _parse_vm_suffix_number(vm_name: str, base_name: str) -> int | None:
     return value
 
 
-def _candidate_vm_names(tart: TartClient, context: StatusContext) -> list[str]:
+def _candidate_vm_names(
+    tart: TartClient, context: StatusContext, snapshot: TartSnapshot | None = None
+) -> list[str]:
     base_name = vm_base_name()
     names: set[str] = set()
 
-    for vm in tart.list_vms_json():
-        name = vm.get("Name")
-        if not isinstance(name, str):
-            continue
+    if snapshot is None:
+        snapshot = tart.vms_by_name()
+    for name in snapshot:
         if _parse_vm_suffix_number(name, base_name) is not None:
             names.add(name)
 
-    if context.state_dir.exists():
-        for marker_file in context.state_dir.glob(f"{base_name}-*.provisioned"):
-            vm_name = marker_file.name.removesuffix(".provisioned")
-            if _parse_vm_suffix_number(vm_name, base_name) is not None:
-                names.add(vm_name)
+    try:
+        with os.scandir(context.state_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(MARKER_SUFFIX) or not entry.is_file():
+                    continue
+                vm_name = entry.name.removesuffix(MARKER_SUFFIX)
+                if _parse_vm_suffix_number(vm_name, base_name) is not None:
+                    names.add(vm_name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
 
     return sorted(
         names,
@@ -446,25 +478,45 @@ def _candidate_vm_names(tart: TartClient, context: StatusContext) -> list[str]:
     )
 
 
-def status_vm(vm_number: int, tart: TartClient, *, as_json: bool, context: StatusContext) -> None:
+def _write_json(payload: dict[str, object]) -> None:
+    json.dump(payload, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def status_vm(
+    vm_number: int,
+    tart: TartClient,
+    *,
+    as_json: bool,
+    context: StatusContext,
+    snapshot: TartSnapshot | None = None,
+) -> None:
     vm_name = vm_name_for(vm_number)
-    marker_file, marker, report = _build_vm_status_report(vm_name, tart, context=context)
+    marker_file, marker, report = _build_vm_status_report(vm_name, tart, context=context, snapshot=snapshot)
 
     if as_json:
-        print(json.dumps(report.as_dict(), indent=2))
+        _write_json(report.as_dict())
         return
 
     _render_status_report_text(vm_name, marker_file, marker, report)
 
 
 def status_environment(tart: TartClient, *, as_json: bool, context: StatusContext) -> None:
-    vm_names = _candidate_vm_names(tart, context)
+    snapshot = tart.vms_by_name()
+    vm_names = _candidate_vm_names(tart, context, snapshot)
     reports: list[VMStatusReport] = []
     marker_files: dict[str, Path] = {}
     markers: dict[str, ProvisionMarker | None] = {}
 
-    for vm_name in vm_names:
-        marker_file, marker, report = _build_vm_status_report(vm_name, tart, context=context)
+    def build(vm_name: str) -> tuple[Path, ProvisionMarker | None, VMStatusReport]:
+        return _build_vm_status_report(vm_name, tart, context=context, snapshot=snapshot)
+
+    results: list[tuple[Path, ProvisionMarker | None, VMStatusReport]] = []
+    if vm_names:
+        with ThreadPoolExecutor(max_workers=min(_STATUS_PROBE_MAX_WORKERS, len(vm_names))) as pool:
+            results = list(pool.map(build, vm_names))
+
+    for vm_name, (marker_file, marker, report) in zip(vm_names, results):
         marker_files[vm_name] = marker_file
         markers[vm_name] = marker
         reports.append(report)
@@ -476,7 +528,7 @@ def status_environment(tart: TartClient, *, as_json: bool, context: StatusContex
             "running_count": sum(1 for report in reports if report.running),
             "vms": [report.as_dict() for report in reports],
         }
-        print(json.dumps(payload, indent=2))
+        _write_json(payload)
         return
 
     print("Clawbox environment:")
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from types import TracebackType
 from typing import Any, Mapping
 
 _SYNC_EVENT_LOG_MAX_BYTES_ENV = "CLAWBOX_SYNC_EVENT_LOG_MAX_BYTES"
@@ -37,13 +43,106 @@ def _rotated_log_path(state_dir: Path) -> Path:
     return state_dir / "logs" / _SYNC_EVENT_LOG_ROTATED_FILE
 
 
-def _maybe_rotate(path: Path, rotated: Path) -> None:
-    if not path.exists():
-        return
-    if path.stat().st_size < _max_log_size_bytes():
-        return
-    rotated.unlink(missing_ok=True)
-    path.replace(rotated)
+@dataclass(frozen=True)
+class _ActiveLog:
+    fd: int
+    identity: tuple[int, int]
+
+
+# Append descriptors stay open per log path until interpreter exit; every write stats the path and reopens
+# when its st_dev/st_ino no longer match (rotated or removed by another process).
+_active_logs: dict[Path, _ActiveLog] = {}
+_active_logs_lock = threading.Lock()
+_HAS_WRITEV = hasattr(os, "writev")
+# Conservative POSIX IOV_MAX floor; larger batches are joined into one buffer instead.
+_WRITEV_MAX_BUFFERS = 1024
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _close_active_log(path: Path) -> None:
+    active = _active_logs.pop(path, None)
+    if active is not None:
+        os.close(active.fd)
+
+
+@atexit.register
+def _close_active_logs() -> None:
+    with _active_logs_lock:
+        for path in list(_active_logs):
+            _close_active_log(path)
+
+
+def _active_log_fd(path: Path, current: os.stat_result | None) -> int:
+    active = _active_logs.get(path)
+    if active is not None and current is not None and active.identity == (current.st_dev, current.st_ino):
+        return active.fd
+    _close_active_log(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_APPEND | os.O_CREAT | os.O_WRONLY, 0o600)
+    opened = os.fstat(fd)
+    _active_logs[path] = _ActiveLog(fd=fd, identity=(opened.st_dev, opened.st_ino))
+    return fd
+
+
+@dataclass(frozen=True)
+class SyncEvent:
+    vm_name: str
+    event: str
+    actor: str
+    reason: str
+    details: Mapping[str, Any] | None = None
+
+
+# Records keep the sorted-key compact layout json.dumps(sort_keys=True) produced; only the values vary.
+_EVENT_TEMPLATE = b'{"actor":%s,"event":%s,"reason":%s,"timestamp":%s,"vm":%s}\n'
+_EVENT_WITH_DETAILS_TEMPLATE = b'{"actor":%s,"details":%s,"event":%s,"reason":%s,"timestamp":%s,"vm":%s}\n'
+
+
+def _encode_json(value: Any) -> bytes:
+    # ensure_ascii keeps lone surrogates (e.g. os.fsdecode'd paths) encodable as \udcxx escapes.
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("ascii")
+
+
+@lru_cache(maxsize=256)
+def _encode_label(value: str) -> bytes:
+    return _encode_json(value)
+
+
+def _encode_event(sync_event: SyncEvent, timestamp: bytes) -> bytes:
+    actor = _encode_label(sync_event.actor)
+    event = _encode_label(sync_event.event)
+    reason = _encode_label(sync_event.reason)
+    vm = _encode_label(sync_event.vm_name)
+    if sync_event.details:
+        details = _encode_json(dict(sync_event.details))
+        return _EVENT_WITH_DETAILS_TEMPLATE % (actor, details, event, reason, timestamp, vm)
+    return _EVENT_TEMPLATE % (actor, event, reason, timestamp, vm)
+
+
+def _write_lines(fd: int, lines: list[bytes]) -> None:
+    if len(lines) == 1:
+        os.write(fd, lines[0])
+    elif _HAS_WRITEV and len(lines) <= _WRITEV_MAX_BUFFERS:
+        os.writev(fd, lines)
+    else:
+        os.write(fd, b"".join(lines))
+
+
+def _append_lines(state_dir: Path, lines: list[bytes]) -> None:
+    path = _log_path(state_dir)
+    with _active_logs_lock:
+        current = _stat_or_none(path)
+        if current is not None and current.st_size >= _max_log_size_bytes():
+            _close_active_log(path)
+            os.replace(path, _rotated_log_path(state_dir))
+            current = None
+        _write_lines(_active_log_fd(path, current), lines)
 
 
 def emit_sync_event(
@@ -56,29 +155,51 @@ def emit_sync_event(
     details: Mapping[str, Any] | None = None,
 ) -> None:
     """Append a best-effort structured sync lifecycle event to a local log."""
+    emit_sync_events(state_dir, [SyncEvent(vm_name, event, actor, reason, details)])
+
+
+def emit_sync_events(state_dir: Path, events: Iterable[SyncEvent]) -> None:
+    """Append several sync lifecycle events with a single write."""
+    timestamp = _encode_json(_timestamp())
+    lines = [_encode_event(sync_event, timestamp) for sync_event in events]
+    if not lines:
+        return
     try:
-        path = _log_path(state_dir)
-        rotated = _rotated_log_path(state_dir)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        _maybe_rotate(path, rotated)
-
-        payload: dict[str, Any] = {
-            "timestamp": _timestamp(),
-            "vm": vm_name,
-            "event": event,
-            "actor": actor,
-            "reason": reason,
-        }
-        if details:
-            payload["details"] = dict(details)
-        encoded = (json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
-
-        fd = os.open(path, os.O_APPEND | os.O_CREAT | os.O_WRONLY, 0o600)
-        try:
-            os.write(fd, encoded)
-        finally:
-            os.close(fd)
+        _append_lines(state_dir, lines)
     except OSError:
         # Event logging is diagnostic only and must not disrupt orchestration.
         return
 
+
+@dataclass
+class SyncEventBatch:
+    """Collect sync events and append them in one write when the block exits."""
+
+    state_dir: Path
+    events: list[SyncEvent] = field(default_factory=list)
+
+    def emit(
+        self,
+        vm_name: str,
+        *,
+        event: str,
+        actor: str,
+        reason: str,
+        details: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.events.append(SyncEvent(vm_name, event, actor, reason, details))
+
+    def flush(self) -> None:
+        events, self.events = self.events, []
+        emit_sync_events(self.state_dir, events)
+
+    def __enter__(self) -> SyncEventBatch:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.flush()
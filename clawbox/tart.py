@@ -1,17 +1,37 @@
 from __future__ import annotations
 
 import json
+import re
 import subprocess
 import time
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 
+_ERE_SPECIAL_RE = re.compile(r"[.^$*+?()\[\]{}|\\]")
+
+
 class TartError(RuntimeError):
     """Raised when a tart command fails in an orchestration-sensitive way."""
 
 
 class TartClient:
+    def __init__(self, *, list_cache_seconds: float = 0.25) -> None:
+        # `tart` has no long-lived server mode, so back-to-back queries share one recent `tart list`.
+        # Shared listings are handed out read-only so no caller can corrupt them for the others.
+        self._list_cache_seconds = list_cache_seconds
+        self._list_cache: tuple[float, int, tuple[Mapping[str, Any], ...]] | None = None
+        self._by_name_cache: (
+            tuple[Sequence[Mapping[str, Any]], Mapping[str, Mapping[str, Any]]] | None
+        ) = None
+        self._generation = 0
+
+    def _invalidate_list_cache(self) -> None:
+        self._generation += 1
+        self._list_cache = None
+
     def _run(
         self,
         args: list[str],
@@ -47,7 +67,15 @@ class TartClient:
             raise TartError(f"Error: Command failed (exit {proc.returncode}): {cmd}")
         return proc
 
-    def list_vms_json(self) -> list[dict[str, Any]]:
+    def list_vms_json(self) -> tuple[Mapping[str, Any], ...]:
+        generation = self._generation
+        cached = self._list_cache
+        if (
+            cached is not None
+            and cached[1] == generation
+            and time.monotonic() - cached[0] < self._list_cache_seconds
+        ):
+            return cached[2]
         proc = self._run(["tart", "list", "--format", "json"])
         try:
             data = json.loads(proc.stdout)
@@ -55,28 +83,42 @@ class TartClient:
             raise TartError(f"Could not parse tart list output: {exc}") from exc
         if not isinstance(data, list):
             raise TartError("Unexpected tart list payload: expected a JSON list")
-        return data
+        vms = tuple(MappingProxyType(vm) if isinstance(vm, dict) else vm for vm in data)
+        if self._generation == generation:
+            self._list_cache = (time.monotonic(), generation, vms)
+        return vms
+
+    def vms_by_name(self) -> Mapping[str, Mapping[str, Any]]:
+        vms = self.list_vms_json()
+        cached = self._by_name_cache
+        if cached is not None and cached[0] is vms:
+            return cached[1]
+        by_name: dict[str, Mapping[str, Any]] = {}
+        for vm in vms:
+            name = vm.get("Name")
+            if isinstance(name, str):
+                by_name.setdefault(name, vm)
+        index = MappingProxyType(by_name)
+        self._by_name_cache = (vms, index)
+        return index
 
     def vm_exists(self, vm_name: str) -> bool:
-        for vm in self.list_vms_json():
-            if vm.get("Name") == vm_name:
-                return True
-        return False
+        return vm_name in self.vms_by_name()
 
     def vm_running(self, vm_name: str) -> bool:
-        for vm in self.list_vms_json():
-            if vm.get("Name") == vm_name:
-                running = vm.get("Running")
-                return bool(running) if isinstance(running, bool) else False
-        return False
+        vm = self.vms_by_name().get(vm_name)
+        return vm is not None and vm.get("Running") is True
 
     def clone(self, base_image: str, vm_name: str) -> None:
+        self._invalidate_list_cache()
         self._run(["tart", "clone", base_image, vm_name], check=True, capture_output=False)
 
     def stop(self, vm_name: str) -> None:
+        self._invalidate_list_cache()
         self._run(["tart", "stop", vm_name], check=False)
 
     def delete(self, vm_name: str) -> None:
+        self._invalidate_list_cache()
         self._run(["tart", "delete", vm_name], check=False)
 
     def ip(self, vm_name: str) -> str | None:
@@ -90,9 +132,22 @@ class TartClient:
                 return ip
         return None
 
+    def vm_pid(self, vm_name: str) -> int | None:
+        escaped_name = _ERE_SPECIAL_RE.sub(r"\\\g<0>", vm_name)
+        pattern = f"(^|/)tart run {escaped_name}( |$)"
+        try:
+            proc = self._run(["pgrep", "-f", pattern], check=False)
+        except TartError:
+            return None
+        pids = (proc.stdout or "").split()
+        if proc.returncode != 0 or len(pids) != 1 or not pids[0].isdigit():
+            return None
+        return int(pids[0])
+
     def run_in_background(
         self, vm_name: str, run_args: list[str], log_file: Path
     ) -> subprocess.Popen[bytes]:
+        self._invalidate_list_cache()
         log_file.parent.mkdir(parents=True, exist_ok=True)
         log_handle = log_file.open("wb")
         try:
@@ -115,10 +170,23 @@ class TartClient:
 def wait_for_vm_running(
     tart: TartClient, vm_name: str, timeout_seconds: int, poll_seconds: int = 1
 ) -> bool:
-    waited = 0
+    return poll_with_backoff(lambda: tart.vm_running(vm_name), timeout_seconds, max_interval=poll_seconds)
+
+
+def poll_with_backoff(
+    check: Callable[[], bool],
+    timeout_seconds: float,
+    *,
+    initial_interval: float = 0.5,
+    max_interval: float = 2.0,
+) -> bool:
+    waited = 0.0
+    interval = initial_interval
     while waited < timeout_seconds:
-        if tart.vm_running(vm_name):
+        if check():
             return True
-        time.sleep(poll_seconds)
-        waited += poll_seconds
-    return tart.vm_running(vm_name)
+        delay = min(interval, max_interval, timeout_seconds - waited)
+        time.sleep(delay)
+        waited += delay
+        interval *= 1.6
+    return check()
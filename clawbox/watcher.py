@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import select
 import shlex
 import signal
 import subprocess
@@ -10,19 +11,34 @@ import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable, TypeVar
 
-from clawbox.io_utils import atomic_write_text, read_text_or_empty, tail_lines
+from clawbox.io_utils import atomic_write_bytes, tail_lines
 from clawbox.locks import cleanup_locks_for_vm
 from clawbox.mutagen import MutagenError, teardown_vm_sync
 from clawbox.sync_events import emit_sync_event
 from clawbox.tart import TartClient, TartError
 
 
+_T = TypeVar("_T")
+
+
 class WatcherError(RuntimeError):
     """Raised for watcher lifecycle failures."""
 
 
 _VM_STOP_CONFIRMATION_POLLS = 3
+_WATCHER_STARTUP_PROBE_SECONDS = 0.15
+_KILLED_CHILD_REAP_SECONDS = 1.0
+_HAS_PIDFD = hasattr(os, "pidfd_open")
+_USE_PROCFS = sys.platform.startswith("linux")
+_HAS_O_TMPFILE = _USE_PROCFS and hasattr(os, "O_TMPFILE")
+# Directories already created by this process; a vanished one is dropped and recreated on write failure.
+_ENSURED_DIRS: set[str] = set()
+# A process's cmdline is fixed for its lifetime; keying on (pid, start ticks) keeps reused PIDs apart.
+# Entries are pruned against each reconcile's /proc snapshot, and the oldest go first past the cap.
+_CMDLINE_CACHE: dict[tuple[int, int], str] = {}
+_CMDLINE_CACHE_MAX_ENTRIES = 256
 
 
 @dataclass(frozen=True)
@@ -31,12 +47,78 @@ class WatcherRecord:
     pid: int
     poll_seconds: int
     started_at: str
+    parent_pid: int | None = None
 
 
 def _watchers_dir(state_dir: Path) -> Path:
     return state_dir / "watchers"
 
 
+def _ensure_dir(path: Path) -> Path:
+    key = str(path)
+    if key not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+    return path
+
+
+def _in_ensured_parent(path: Path, action: Callable[[], _T]) -> _T:
+    _ensure_dir(path.parent)
+    try:
+        return action()
+    except FileNotFoundError:
+        _ENSURED_DIRS.discard(str(path.parent))
+        _ensure_dir(path.parent)
+        return action()
+
+
+def _link_tmpfile(fd: int, path: Path) -> None:
+    source = f"/proc/self/fd/{fd}"
+    # Passing dst_dir_fd makes os.link use linkat(AT_SYMLINK_FOLLOW) rather than link(), which
+    # would try to hard-link the /proc magic symlink itself.
+    dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        try:
+            os.link(source, path.name, dst_dir_fd=dir_fd, follow_symlinks=True)
+            return
+        except FileExistsError:
+            pass
+        # linkat cannot replace an existing entry: link under a unique name, then rename over the target.
+        staged = f".{path.name}.tmp-{os.getpid()}-{fd}"
+        try:
+            os.unlink(staged, dir_fd=dir_fd)
+        except FileNotFoundError:
+            pass
+        os.link(source, staged, dst_dir_fd=dir_fd, follow_symlinks=True)
+        try:
+            os.replace(staged, path.name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+        except OSError:
+            os.unlink(staged, dir_fd=dir_fd)
+            raise
+    finally:
+        os.close(dir_fd)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    if not _HAS_O_TMPFILE:
+        atomic_write_bytes(path, data, make_parents=False)
+        return
+    try:
+        fd = os.open(path.parent, os.O_TMPFILE | os.O_WRONLY, 0o600)
+    except OSError:
+        # Filesystems without O_TMPFILE support (EOPNOTSUPP/EISDIR) take the named temp file route; a missing
+        # directory fails there too, so the caller still sees FileNotFoundError.
+        atomic_write_bytes(path, data, make_parents=False)
+        return
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        _link_tmpfile(fd, path)
+    finally:
+        os.close(fd)
+
+
 def _watcher_record_path(state_dir: Path, vm_name: str) -> Path:
     return _watchers_dir(state_dir) / f"{vm_name}.json"
 
@@ -49,17 +131,17 @@ def _timestamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def _atomic_write_json(path: Path, payload: dict[str, object]) -> None:
-    atomic_write_text(path, json.dumps(payload, sort_keys=True) + "\n")
-
-
-def _read_record(path: Path) -> WatcherRecord | None:
-    raw = read_text_or_empty(path)
+def _read_record(path: Path | str) -> WatcherRecord | None:
+    try:
+        with open(path, "rb") as handle:
+            raw = handle.read()
+    except OSError:
+        return None
     if not raw:
         return None
     try:
         payload = json.loads(raw)
-    except json.JSONDecodeError:
+    except ValueError:
         return None
     if not isinstance(payload, dict):
         return None
@@ -76,17 +158,28 @@ def _read_record(path: Path) -> WatcherRecord | None:
         return None
     if not vm_name or pid <= 0 or poll_seconds <= 0:
         return None
+    parent_pid = payload.get("parent_pid")
     return WatcherRecord(
         vm_name=vm_name,
         pid=pid,
         poll_seconds=poll_seconds,
         started_at=started_at,
+        parent_pid=parent_pid if isinstance(parent_pid, int) and parent_pid > 0 else None,
     )
 
 
 def _pid_running(pid: int) -> bool:
     if pid <= 0:
         return False
+    if _USE_PROCFS:
+        try:
+            os.stat(f"/proc/{pid}")
+        except FileNotFoundError:
+            return False
+        except OSError:
+            pass
+        else:
+            return True
     try:
         os.kill(pid, 0)
     except ProcessLookupError:
@@ -98,9 +191,61 @@ def _pid_running(pid: int) -> bool:
     return True
 
 
-def _pid_cmdline(pid: int) -> str:
-    if not _pid_running(pid):
-        return ""
+def _wait_pid_exit(pid: int, timeout_seconds: float) -> bool:
+    if _HAS_PIDFD:
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pidfd = -1
+        if pidfd >= 0:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                return bool(poller.poll(max(timeout_seconds, 0) * 1000))
+            finally:
+                os.close(pidfd)
+    deadline = time.monotonic() + max(timeout_seconds, 0)
+    while time.monotonic() < deadline:
+        if not _pid_running(pid):
+            return True
+        time.sleep(0.1)
+    return not _pid_running(pid)
+
+
+def _live_pids() -> frozenset[int] | None:
+    try:
+        names = os.listdir("/proc")
+    except OSError:
+        return None
+    return frozenset(int(name) for name in names if name.isdigit())
+
+
+def _read_cmdline_proc(pid: int) -> str | None:
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as handle:
+            raw = handle.read()
+    except OSError:
+        return None
+    return raw.rstrip(b"\x00").replace(b"\x00", b" ").decode(errors="replace")
+
+
+def _proc_start_ticks(pid: int) -> int | None:
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as handle:
+            raw = handle.read()
+    except OSError:
+        return None
+    # Fields after the parenthesised comm start at field 3; starttime is field 22.
+    fields = raw[raw.rfind(b")") + 2 :].split()
+    try:
+        return int(fields[19])
+    except (IndexError, ValueError):
+        return None
+
+
+def _read_cmdline_ps(pid: int) -> str:
     try:
         proc = subprocess.run(
             ["ps", "-o", "command=", "-p", str(pid)],
@@ -115,6 +260,134 @@ def _pid_cmdline(pid: int) -> str:
     return (proc.stdout or "").strip()
 
 
+class _PidExitWaiter:
+    """Block until a process exits: pidfd + epoll on Linux, kqueue NOTE_EXIT on macOS."""
+
+    def __init__(self, poller: Any, pidfd: int = -1) -> None:
+        self._poller = poller
+        self._pidfd = pidfd
+
+    @classmethod
+    def open(cls, pid: int | None) -> _PidExitWaiter | None:
+        if pid is None or pid <= 0:
+            return None
+        if _HAS_PIDFD and hasattr(select, "epoll"):
+            return cls._open_pidfd(pid)
+        if hasattr(select, "kqueue"):
+            return cls._open_kqueue(pid)
+        return None
+
+    @classmethod
+    def _open_pidfd(cls, pid: int) -> _PidExitWaiter | None:
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            return None
+        try:
+            epoll = select.epoll()
+            epoll.register(pidfd, select.EPOLLIN)
+        except OSError:
+            os.close(pidfd)
+            return None
+        return cls(epoll, pidfd)
+
+    @classmethod
+    def _open_kqueue(cls, pid: int) -> _PidExitWaiter | None:
+        kqueue = select.kqueue()
+        event = select.kevent(
+            pid,
+            filter=select.KQ_FILTER_PROC,
+            flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+            fflags=select.KQ_NOTE_EXIT,
+        )
+        try:
+            kqueue.control([event], 0, 0)
+        except OSError:
+            kqueue.close()
+            return None
+        return cls(kqueue)
+
+    def wait(self, timeout_seconds: float) -> bool:
+        if self._pidfd >= 0:
+            return bool(self._poller.poll(timeout_seconds))
+        return bool(self._poller.control(None, 1, timeout_seconds))
+
+    def close(self) -> None:
+        self._poller.close()
+        if self._pidfd >= 0:
+            os.close(self._pidfd)
+
+
+def _reap_child(pid: int) -> bool | None:
+    try:
+        reaped_pid, _status = os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        return None
+    return reaped_pid == pid
+
+
+def _wait_child_exit(pid: int, timeout_seconds: float) -> bool:
+    # Reaping our own watcher child keeps a zombie from looking alive to kill(pid, 0).
+    if _HAS_PIDFD:
+        exited = _wait_pid_exit(pid, timeout_seconds)
+        if exited:
+            _reap_child(pid)
+        return exited
+    deadline = time.monotonic() + max(timeout_seconds, 0)
+    while True:
+        reaped = _reap_child(pid)
+        if reaped is None:
+            return _wait_pid_exit(pid, deadline - time.monotonic())
+        if reaped:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(0.05, remaining))
+
+
+def _child_exited_fast(pid: int, budget_seconds: float = _WATCHER_STARTUP_PROBE_SECONDS) -> bool:
+    # WNOWAIT leaves the exit status for Popen.poll() to collect.
+    if not hasattr(os, "waitid"):
+        time.sleep(budget_seconds)
+        return False
+    deadline = time.monotonic() + budget_seconds
+    while True:
+        try:
+            result = os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+        except ChildProcessError:
+            return False
+        if result is not None:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(0.01, remaining))
+
+
+def _pid_cmdline(pid: int) -> str:
+    if not _pid_running(pid):
+        for key in [key for key in _CMDLINE_CACHE if key[0] == pid]:
+            del _CMDLINE_CACHE[key]
+        return ""
+    start_ticks = _proc_start_ticks(pid)
+    if start_ticks is not None and (pid, start_ticks) in _CMDLINE_CACHE:
+        return _CMDLINE_CACHE[(pid, start_ticks)]
+    cmdline = _read_cmdline_proc(pid)
+    if cmdline is None:
+        cmdline = _read_cmdline_ps(pid)
+    if start_ticks is not None and cmdline:
+        if len(_CMDLINE_CACHE) >= _CMDLINE_CACHE_MAX_ENTRIES:
+            del _CMDLINE_CACHE[next(iter(_CMDLINE_CACHE))]
+        _CMDLINE_CACHE[(pid, start_ticks)] = cmdline
+    return cmdline
+
+
+def _prune_cmdline_cache(live_pids: frozenset[int]) -> None:
+    for key in [key for key in _CMDLINE_CACHE if key[0] not in live_pids]:
+        del _CMDLINE_CACHE[key]
+
+
 def _is_watcher_pid(pid: int, vm_name: str) -> bool:
     cmd = _pid_cmdline(pid)
     if not cmd:
@@ -148,15 +421,16 @@ def _signal_watcher_pid(pid: int, sig: signal.Signals) -> None:
 
 
 def _write_record(state_dir: Path, record: WatcherRecord) -> None:
-    _atomic_write_json(
-        _watcher_record_path(state_dir, record.vm_name),
-        {
-            "vm_name": record.vm_name,
-            "pid": record.pid,
-            "poll_seconds": record.poll_seconds,
-            "started_at": record.started_at,
-        },
-    )
+    payload = {
+        "vm_name": record.vm_name,
+        "pid": record.pid,
+        "poll_seconds": record.poll_seconds,
+        "started_at": record.started_at,
+        "parent_pid": record.parent_pid,
+    }
+    content = json.dumps(payload, sort_keys=True).encode("utf-8") + b"\n"
+    record_path = _watcher_record_path(state_dir, record.vm_name)
+    _in_ensured_parent(record_path, lambda: _atomic_write_bytes(record_path, content))
 
 
 def _remove_record_if_owner(state_dir: Path, vm_name: str, pid: int) -> None:
@@ -181,8 +455,7 @@ def start_vm_watcher(state_dir: Path, vm_name: str, *, poll_seconds: int = 2) ->
         record_path.unlink(missing_ok=True)
 
     log_file = _watcher_log_path(state_dir, vm_name)
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    log_handle = log_file.open("wb")
+    log_handle = _in_ensured_parent(log_file, lambda: log_file.open("wb"))
     cmd = [
         sys.executable,
         "-m",
@@ -209,8 +482,7 @@ def start_vm_watcher(state_dir: Path, vm_name: str, *, poll_seconds: int = 2) ->
     finally:
         log_handle.close()
 
-    time.sleep(0.15)
-    if proc.poll() is not None:
+    if _child_exited_fast(proc.pid) or proc.poll() is not None:
         msg = [f"Error: watcher failed to start for '{vm_name}'."]
         tail = tail_lines(log_file)
         if tail:
@@ -225,6 +497,7 @@ def start_vm_watcher(state_dir: Path, vm_name: str, *, poll_seconds: int = 2) ->
             pid=proc.pid,
             poll_seconds=poll_seconds,
             started_at=_timestamp(),
+            parent_pid=os.getpid(),
         ),
     )
     return proc.pid
@@ -238,14 +511,18 @@ def stop_vm_watcher(state_dir: Path, vm_name: str, *, timeout_seconds: int = 5)
         return False
 
     if _is_watcher_pid(record.pid, vm_name):
-        _signal_watcher_pid(record.pid, signal.SIGTERM)
-        deadline = time.monotonic() + max(timeout_seconds, 0)
-        while time.monotonic() < deadline:
-            if not _pid_running(record.pid):
-                break
-            time.sleep(0.1)
-        if _pid_running(record.pid):
+        owned_child = record.parent_pid == os.getpid()
+        if timeout_seconds <= 0:
+            # No grace period: a SIGTERM would only race the watcher's handler against the kill.
             _signal_watcher_pid(record.pid, signal.SIGKILL)
+            if owned_child:
+                # Bounded: a child stuck in uninterruptible sleep must not hang the stop.
+                _wait_child_exit(record.pid, _KILLED_CHILD_REAP_SECONDS)
+        else:
+            _signal_watcher_pid(record.pid, signal.SIGTERM)
+            wait_exit = _wait_child_exit if owned_child else _wait_pid_exit
+            if not wait_exit(record.pid, timeout_seconds):
+                _signal_watcher_pid(record.pid, signal.SIGKILL)
     record_path.unlink(missing_ok=True)
     return True
 
@@ -257,15 +534,25 @@ def reconcile_vm_watchers(tart: TartClient, state_dir: Path) -> None:
         except TartError:
             return None
 
-    watchers_dir = _watchers_dir(state_dir)
-    if not watchers_dir.exists():
+    try:
+        with os.scandir(_watchers_dir(state_dir)) as entries:
+            record_paths = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
         return
-    for record_path in watchers_dir.glob("*.json"):
+    live_pids = _live_pids()
+    if live_pids is not None:
+        _prune_cmdline_cache(live_pids)
+    for record_path in record_paths:
         record = _read_record(record_path)
         if record is None:
             record_path.unlink(missing_ok=True)
             continue
-        if not _pid_running(record.pid):
+        pid_running = record.pid in live_pids if live_pids is not None else _pid_running(record.pid)
+        if not pid_running:
             record_path.unlink(missing_ok=True)
             running = _vm_running(record.vm_name)
             if running is False:
@@ -286,6 +573,7 @@ def run_vm_watcher_loop(
 ) -> None:
     should_exit = False
     consecutive_not_running = 0
+    vm_exited = False
 
     def _handle_signal(_sig: int, _frame: object) -> None:
         nonlocal should_exit
@@ -294,23 +582,40 @@ def run_vm_watcher_loop(
     signal.signal(signal.SIGTERM, _handle_signal)
     signal.signal(signal.SIGINT, _handle_signal)
 
+    exit_waiter = _PidExitWaiter.open(tart.vm_pid(vm_name))
+
+    def _wait_poll_interval() -> None:
+        nonlocal exit_waiter, vm_exited
+        if exit_waiter is None:
+            time.sleep(poll_seconds)
+            return
+        if exit_waiter.wait(poll_seconds):
+            # The PID is only a pgrep match, so its exit just wakes the next poll; tart still confirms the stop.
+            exit_waiter.close()
+            exit_waiter = None
+            vm_exited = True
+
     try:
         while not should_exit:
             try:
                 running = tart.vm_running(vm_name)
             except TartError:
                 consecutive_not_running = 0
-                time.sleep(poll_seconds)
+                _wait_poll_interval()
                 continue
 
             if running:
                 consecutive_not_running = 0
-                time.sleep(poll_seconds)
+                if vm_exited:
+                    # The exited process was not the VM's `tart run`; watch whatever matches now instead.
+                    vm_exited = False
+                    exit_waiter = _PidExitWaiter.open(tart.vm_pid(vm_name))
+                _wait_poll_interval()
                 continue
 
             consecutive_not_running += 1
             if consecutive_not_running < _VM_STOP_CONFIRMATION_POLLS:
-                time.sleep(poll_seconds)
+                _wait_poll_interval()
                 continue
 
             emit_sync_event(
@@ -322,6 +627,7 @@ def run_vm_watcher_loop(
                 details={
                     "consecutive_not_running_polls": consecutive_not_running,
                     "confirmation_threshold": _VM_STOP_CONFIRMATION_POLLS,
+                    "vm_process_exited": vm_exited,
                 },
             )
             teardown_error = ""
@@ -348,4 +654,6 @@ def run_vm_watcher_loop(
             )
             break
     finally:
+        if exit_waiter is not None:
+            exit_waiter.close()
         _remove_record_if_owner(state_dir, vm_name, os.getpid())
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import shutil
+import sys
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-from clawbox import orchestrator
+from clawbox import orchestrator, sync_events
+from clawbox.state import ProvisionMarker
 
 
 @pytest.fixture(autouse=True)
@@ -22,3 +28,70 @@ def isolate_orchestrator_runtime_paths(tmp_path: Path, monkeypatch: pytest.Monke
     monkeypatch.setattr(orchestrator, "ANSIBLE_DIR", ansible_dir)
     monkeypatch.setattr(orchestrator, "SECRETS_FILE", secrets_file)
     monkeypatch.setattr(orchestrator, "STATE_DIR", state_dir)
+
+
+@pytest.fixture(autouse=True)
+def close_sync_event_logs() -> Iterator[None]:
+    yield
+    sync_events._close_active_logs()
+
+
+_ORCHESTRATOR_RUNTIME_STUBS = {
+    "start_vm_watcher": lambda *_args, **_kwargs: 9999,
+    "stop_vm_watcher": lambda *_args, **_kwargs: False,
+    "mutagen_available": lambda: True,
+    "_activate_mutagen_sync": lambda **_kwargs: None,
+    "_activate_mutagen_sync_from_locks": lambda *_args, **_kwargs: None,
+    "_deactivate_mutagen_sync": lambda *_args, **_kwargs: None,
+}
+
+
+@pytest.fixture
+def isolated_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(orchestrator, "PROJECT_DIR", tmp_path)
+    monkeypatch.setattr(orchestrator, "ANSIBLE_DIR", tmp_path / "ansible")
+    monkeypatch.setattr(orchestrator, "SECRETS_FILE", tmp_path / "ansible" / "secrets.yml")
+    monkeypatch.setattr(orchestrator, "STATE_DIR", tmp_path / ".clawbox" / "state")
+    for name, stub in _ORCHESTRATOR_RUNTIME_STUBS.items():
+        monkeypatch.setattr(orchestrator, name, stub)
+    (tmp_path / "ansible").mkdir(parents=True, exist_ok=True)
+    yield tmp_path
+
+
+@pytest.fixture
+def sync_dirs(tmp_path: Path) -> SimpleNamespace:
+    source, payload, signal = (tmp_path / name for name in ("source", "payload", "signal"))
+    for path in (source, payload, signal):
+        path.mkdir()
+    return SimpleNamespace(source=source, payload=payload, signal=signal)
+
+
+@pytest.fixture(scope="session")
+def developer_marker_text() -> str:
+    return ProvisionMarker(
+        vm_name="clawbox-91",
+        profile="developer",
+        playwright=False,
+        tailscale=False,
+        signal_cli=True,
+        signal_payload=True,
+        provisioned_at="2026-01-01T00:00:00Z",
+    ).to_text()
+
+
+@pytest.fixture(scope="session")
+def _ram_tmp_root(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    shm = Path("/dev/shm")
+    if not sys.platform.startswith("linux") or not shm.is_dir():
+        yield tmp_path_factory.mktemp("ram")
+        return
+    root = Path(tempfile.mkdtemp(prefix="clawbox-tests-", dir=shm))
+    try:
+        yield root
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def ram_tmp_path(_ram_tmp_root: Path) -> Path:
+    return Path(tempfile.mkdtemp(dir=_ram_tmp_root))
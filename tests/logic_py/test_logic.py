@@ -1,11 +1,9 @@
 from __future__ import annotations
 
 import hashlib
-import io
 import json
 import os
 import subprocess
-from contextlib import redirect_stdout
 from pathlib import Path
 
 import pytest
@@ -66,32 +64,10 @@ class FakeTart:
         return "192.168.64.10"
 
 
-@pytest.fixture
-def isolated_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setattr(orchestrator, "PROJECT_DIR", tmp_path)
-    monkeypatch.setattr(orchestrator, "ANSIBLE_DIR", tmp_path / "ansible")
-    monkeypatch.setattr(orchestrator, "SECRETS_FILE", tmp_path / "ansible" / "secrets.yml")
-    monkeypatch.setattr(orchestrator, "STATE_DIR", tmp_path / ".clawbox" / "state")
-    monkeypatch.setattr(orchestrator, "start_vm_watcher", lambda *_args, **_kwargs: 9999)
-    monkeypatch.setattr(orchestrator, "stop_vm_watcher", lambda *_args, **_kwargs: False)
-    monkeypatch.setattr(orchestrator, "mutagen_available", lambda: True)
-    monkeypatch.setattr(orchestrator, "_activate_mutagen_sync", lambda **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_activate_mutagen_sync_from_locks", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
-    (tmp_path / "ansible").mkdir(parents=True, exist_ok=True)
-    yield tmp_path
-
-
-def capture_stdout(fn):
-    buf = io.StringIO()
-    with redirect_stdout(buf):
-        fn()
-    return buf.getvalue()
-
-
-def test_create_vm_success(isolated_paths):
+def test_create_vm_success(isolated_paths, capsys):
     tart = FakeTart()
-    out = capture_stdout(lambda: orchestrator.create_vm(91, tart))
+    orchestrator.create_vm(91, tart)
+    out = capsys.readouterr().out
     assert tart.clone_calls == [(orchestrator.BASE_IMAGE, "clawbox-91")]
     assert "Created VM: clawbox-91" in out
 
@@ -119,21 +95,20 @@ def test_virtualization_hint_includes_tart_system_limit_phrase():
     assert "Virtualization.framework may be refusing another VM" in hinted
 
 
-def test_launch_vm_headless_passes_no_graphics(isolated_paths, monkeypatch):
+def test_launch_vm_headless_passes_no_graphics(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     tart.exists["clawbox-91"] = True
     monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
-    out = capture_stdout(
-        lambda: orchestrator.launch_vm(
-            vm_number=91,
-            profile="standard",
-            openclaw_source="",
-            openclaw_payload="",
-            signal_payload="",
-            headless=True,
-            tart=tart,
-        )
+    orchestrator.launch_vm(
+        vm_number=91,
+        profile="standard",
+        openclaw_source="",
+        openclaw_payload="",
+        signal_payload="",
+        headless=True,
+        tart=tart,
     )
+    out = capsys.readouterr().out
     assert "launch mode:          headless" in out
     assert tart.run_calls
     _, run_args, _ = tart.run_calls[0]
@@ -154,15 +129,12 @@ def test_launch_vm_developer_requires_mounts(isolated_paths):
         )
 
 
-def test_launch_vm_missing_vm_has_no_lock_or_marker_side_effects(isolated_paths, monkeypatch):
+def test_launch_vm_missing_vm_has_no_lock_or_marker_side_effects(isolated_paths, sync_dirs, monkeypatch):
     tart = FakeTart()
     lock_calls: list[str] = []
-    source_dir = isolated_paths / "source"
-    payload_dir = isolated_paths / "payload"
-    marker_dir = isolated_paths / "signal"
-    source_dir.mkdir(parents=True, exist_ok=True)
-    payload_dir.mkdir(parents=True, exist_ok=True)
-    marker_dir.mkdir(parents=True, exist_ok=True)
+    source_dir = sync_dirs.source
+    payload_dir = sync_dirs.payload
+    marker_dir = sync_dirs.signal
 
     monkeypatch.setattr(
         orchestrator,
@@ -223,18 +195,15 @@ def test_launch_vm_surfaces_running_timeout(isolated_paths, monkeypatch):
         )
 
 
-def test_launch_vm_running_vm_refreshes_lock_and_marker_work(isolated_paths, monkeypatch):
+def test_launch_vm_running_vm_refreshes_lock_and_marker_work(isolated_paths, sync_dirs, monkeypatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
     tart.running[vm_name] = True
 
-    source = isolated_paths / "source"
-    payload = isolated_paths / "payload"
-    signal = isolated_paths / "signal"
-    source.mkdir(parents=True, exist_ok=True)
-    payload.mkdir(parents=True, exist_ok=True)
-    signal.mkdir(parents=True, exist_ok=True)
+    source = sync_dirs.source
+    payload = sync_dirs.payload
+    signal = sync_dirs.signal
 
     lock_calls: list[str] = []
     marker_calls: list[str] = []
@@ -249,17 +218,16 @@ def test_launch_vm_running_vm_refreshes_lock_and_marker_work(isolated_paths, mon
         lambda *args, **kwargs: marker_calls.append("called"),
     )
 
-    out = capture_stdout(
-        lambda: orchestrator.launch_vm(
-            vm_number=91,
-            profile="developer",
-            openclaw_source=str(source),
-            openclaw_payload=str(payload),
-            signal_payload=str(signal),
-            headless=False,
-            tart=tart,
-        )
+    orchestrator.launch_vm(
+        vm_number=91,
+        profile="developer",
+        openclaw_source=str(source),
+        openclaw_payload=str(payload),
+        signal_payload=str(signal),
+        headless=False,
+        tart=tart,
     )
+    out = capsys.readouterr().out
     assert "VM 'clawbox-91' is already running." in out
     assert lock_calls == ["called"]
     assert marker_calls == ["called"]
@@ -283,7 +251,7 @@ def test_up_standard_rejects_developer_flags(isolated_paths):
         )
 
 
-def test_up_first_run_uses_headless_then_gui(isolated_paths, monkeypatch):
+def test_up_first_run_uses_headless_then_gui(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     calls: list[str] = []
     orchestrator.ensure_secrets_file(create_if_missing=True)
@@ -323,21 +291,20 @@ def test_up_first_run_uses_headless_then_gui(isolated_paths, monkeypatch):
     monkeypatch.setattr(orchestrator, "provision_vm", fake_provision)
     monkeypatch.setattr(orchestrator, "wait_for_vm_running", lambda *args, **kwargs: True)
 
-    out = capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    orchestrator.up(
+        UpOptions(
+            vm_number=91,
+            profile="standard",
+            openclaw_source="",
+            openclaw_payload="",
+            signal_payload="",
+            enable_playwright=False,
+            enable_tailscale=False,
+            enable_signal_cli=False,
+        ),
+        tart,
     )
+    out = capsys.readouterr().out
 
     assert calls == ["create:91", "launch:headless=true", "provision", "launch:headless=false"]
     assert "Clawbox is ready: clawbox-91" in out
@@ -345,7 +312,7 @@ def test_up_first_run_uses_headless_then_gui(isolated_paths, monkeypatch):
     assert "Wait for 'Clawbox is ready:' before logging in or editing synced files." not in out
 
 
-def test_up_first_run_developer_includes_sync_readiness_note(isolated_paths, monkeypatch):
+def test_up_first_run_developer_includes_sync_readiness_note(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     calls: list[str] = []
     orchestrator.ensure_secrets_file(create_if_missing=True)
@@ -387,21 +354,20 @@ def test_up_first_run_developer_includes_sync_readiness_note(isolated_paths, mon
     monkeypatch.setattr(orchestrator, "provision_vm", fake_provision)
     monkeypatch.setattr(orchestrator, "wait_for_vm_running", lambda *args, **kwargs: True)
 
-    out = capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="developer",
-                openclaw_source=str(isolated_paths),
-                openclaw_payload=str(isolated_paths),
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    orchestrator.up(
+        UpOptions(
+            vm_number=91,
+            profile="developer",
+            openclaw_source=str(isolated_paths),
+            openclaw_payload=str(isolated_paths),
+            signal_payload="",
+            enable_playwright=False,
+            enable_tailscale=False,
+            enable_signal_cli=False,
+        ),
+        tart,
     )
+    out = capsys.readouterr().out
 
     assert calls == ["create:91", "launch:headless=true", "provision", "launch:headless=false"]
     assert "Clawbox is ready: clawbox-91" in out
@@ -409,7 +375,7 @@ def test_up_first_run_developer_includes_sync_readiness_note(isolated_paths, mon
     assert "Wait for 'Clawbox is ready:' before logging in or editing synced files." in out
 
 
-def test_up_marker_match_skips_provision(isolated_paths, monkeypatch):
+def test_up_marker_match_skips_provision(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
@@ -426,26 +392,25 @@ def test_up_marker_match_skips_provision(isolated_paths, monkeypatch):
     ).write(orchestrator.STATE_DIR / f"{vm_name}.provisioned")
     monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
 
-    out = capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    orchestrator.up(
+        UpOptions(
+            vm_number=91,
+            profile="standard",
+            openclaw_source="",
+            openclaw_payload="",
+            signal_payload="",
+            enable_playwright=False,
+            enable_tailscale=False,
+            enable_signal_cli=False,
+        ),
+        tart,
     )
+    out = capsys.readouterr().out
     assert "Provision marker found for 'clawbox-91'; skipping provisioning." in out
     assert "Clawbox is running: clawbox-91 (provisioning skipped)" in out
 
 
-def test_up_marker_match_running_vm_does_not_reacquire_locks(isolated_paths, monkeypatch):
+def test_up_marker_match_running_vm_does_not_reacquire_locks(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
@@ -467,25 +432,24 @@ def test_up_marker_match_running_vm_does_not_reacquire_locks(isolated_paths, mon
         lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("should not lock")),
     )
 
-    out = capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    orchestrator.up(
+        UpOptions(
+            vm_number=91,
+            profile="standard",
+            openclaw_source="",
+            openclaw_payload="",
+            signal_payload="",
+            enable_playwright=False,
+            enable_tailscale=False,
+            enable_signal_cli=False,
+        ),
+        tart,
     )
+    out = capsys.readouterr().out
     assert "Clawbox is running: clawbox-91 (provisioning skipped)" in out
 
 
-def test_recreate_runs_down_delete_then_up(isolated_paths, monkeypatch):
+def test_recreate_runs_down_delete_then_up(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     tart.exists["clawbox-93"] = True
     calls: list[str] = []
@@ -508,21 +472,20 @@ def test_recreate_runs_down_delete_then_up(isolated_paths, monkeypatch):
         ),
     )
 
-    out = capture_stdout(
-        lambda: orchestrator.recreate(
-            UpOptions(
-                vm_number=93,
-                profile="developer",
-                openclaw_source=str(isolated_paths),
-                openclaw_payload=str(isolated_paths),
-                signal_payload="",
-                enable_playwright=True,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    orchestrator.recreate(
+        UpOptions(
+            vm_number=93,
+            profile="developer",
+            openclaw_source=str(isolated_paths),
+            openclaw_payload=str(isolated_paths),
+            signal_payload="",
+            enable_playwright=True,
+            enable_tailscale=False,
+            enable_signal_cli=False,
+        ),
+        tart,
     )
+    out = capsys.readouterr().out
 
     assert "Clean recreate requested for 'clawbox-93'." in out
     assert calls == ["down:93", "delete:93", "up:93:developer:true"]
@@ -1158,7 +1121,7 @@ def test_openclaw_source_lock_prunes_previous_lock_for_same_vm(
             os.environ["HOME"] = old_home
 
 
-def test_down_vm_stops_running_and_cleans_locks(isolated_paths, monkeypatch):
+def test_down_vm_stops_running_and_cleans_locks(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
@@ -1166,14 +1129,15 @@ def test_down_vm_stops_running_and_cleans_locks(isolated_paths, monkeypatch):
     cleaned: list[str] = []
     monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda name: cleaned.append(name))
 
-    out = capture_stdout(lambda: orchestrator.down_vm(91, tart))
+    orchestrator.down_vm(91, tart)
+    out = capsys.readouterr().out
 
     assert vm_name in tart.stop_calls
     assert cleaned == [vm_name]
     assert "VM 'clawbox-91' stopped." in out
 
 
-def test_delete_vm_removes_vm_marker_and_locks(isolated_paths, monkeypatch):
+def test_delete_vm_removes_vm_marker_and_locks(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     marker_file = orchestrator.STATE_DIR / f"{vm_name}.provisioned"
@@ -1184,7 +1148,8 @@ def test_delete_vm_removes_vm_marker_and_locks(isolated_paths, monkeypatch):
     cleaned: list[str] = []
     monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda name: cleaned.append(name))
 
-    out = capture_stdout(lambda: orchestrator.delete_vm(91, tart))
+    orchestrator.delete_vm(91, tart)
+    out = capsys.readouterr().out
 
     assert vm_name in tart.stop_calls
     assert vm_name in tart.delete_calls
@@ -1193,13 +1158,14 @@ def test_delete_vm_removes_vm_marker_and_locks(isolated_paths, monkeypatch):
     assert "Deleted VM: clawbox-91" in out
 
 
-def test_ip_vm_prints_resolved_ip(isolated_paths):
+def test_ip_vm_prints_resolved_ip(isolated_paths, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
     tart.running[vm_name] = True
 
-    out = capture_stdout(lambda: orchestrator.ip_vm(91, tart))
+    orchestrator.ip_vm(91, tart)
+    out = capsys.readouterr().out
     assert out.strip() == "192.168.64.10"
 
 
@@ -1231,7 +1197,7 @@ def test_parse_mount_statuses_handles_wrapped_output():
     assert parsed["/Users/Shared/clawbox-sync/openclaw-payload"] == "dir"
 
 
-def test_status_vm_reports_mounts_without_signal_daemon_probe(isolated_paths, monkeypatch):
+def test_status_vm_reports_mounts_without_signal_daemon_probe(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
@@ -1267,13 +1233,14 @@ def test_status_vm_reports_mounts_without_signal_daemon_probe(isolated_paths, mo
         lambda _vm_name: ("ok", True, ["Name: clawbox-clawbox-91-openclaw-source", "Status: Watching for changes"]),
     )
 
-    out = capture_stdout(lambda: orchestrator.status_vm(91, tart))
+    orchestrator.status_vm(91, tart)
+    out = capsys.readouterr().out
     assert "sync paths:" in out
     assert f"{orchestrator.SIGNAL_PAYLOAD_MOUNT}: dir" in out
     assert "signal payload sync daemon:" not in out
 
 
-def test_status_vm_json_reports_mounts_without_signal_daemon_probe(isolated_paths, monkeypatch):
+def test_status_vm_json_reports_mounts_without_signal_daemon_probe(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
@@ -1289,6 +1256,7 @@ def test_status_vm_json_reports_mounts_without_signal_daemon_probe(isolated_path
     )
     marker.write(orchestrator.STATE_DIR / f"{vm_name}.provisioned")
     orchestrator.ensure_secrets_file(create_if_missing=True)
+    capsys.readouterr()
 
     mount_stdout = "\n".join(
         [
@@ -1309,7 +1277,8 @@ def test_status_vm_json_reports_mounts_without_signal_daemon_probe(isolated_path
         lambda _vm_name: ("ok", True, ["Name: clawbox-clawbox-91-openclaw-source", "Status: Watching for changes"]),
     )
 
-    out = capture_stdout(lambda: orchestrator.status_vm(91, tart, as_json=True))
+    orchestrator.status_vm(91, tart, as_json=True)
+    out = capsys.readouterr().out
     parsed = json.loads(out)
     assert parsed["vm"] == vm_name
     assert parsed["exists"] is True
@@ -1323,7 +1292,7 @@ def test_status_vm_json_reports_mounts_without_signal_daemon_probe(isolated_path
     assert parsed["signal_payload_sync"]["lines"] == []
 
 
-def test_status_vm_skips_remote_probe_when_marker_missing(isolated_paths, monkeypatch):
+def test_status_vm_skips_remote_probe_when_marker_missing(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
@@ -1338,13 +1307,14 @@ def test_status_vm_skips_remote_probe_when_marker_missing(isolated_paths, monkey
         or subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout="", stderr=""),
     )
 
-    out = capture_stdout(lambda: orchestrator.status_vm(91, tart))
+    orchestrator.status_vm(91, tart)
+    out = capsys.readouterr().out
     assert probes["count"] == 0
     assert "note: no marker found; skipping remote sync-path probe" in out
     assert "warnings:" not in out
 
 
-def test_status_vm_json_skips_remote_probe_when_marker_missing(isolated_paths, monkeypatch):
+def test_status_vm_json_skips_remote_probe_when_marker_missing(isolated_paths, monkeypatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
@@ -1359,7 +1329,8 @@ def test_status_vm_json_skips_remote_probe_when_marker_missing(isolated_paths, m
         or subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout="", stderr=""),
     )
 
-    out = capture_stdout(lambda: orchestrator.status_vm(91, tart, as_json=True))
+    orchestrator.status_vm(91, tart, as_json=True)
+    out = capsys.readouterr().out
     parsed = json.loads(out)
     assert probes["count"] == 0
     assert parsed["sync_paths"]["probe"] == "not_applicable"
@@ -9,45 +9,51 @@ import pytest
 from clawbox import mutagen as mutagen_mod
 from clawbox.tart import TartError
 
+MUTAGEN_SUBPROCESS = mutagen_mod.subprocess
 
-def test_ensure_mutagen_ssh_alias_writes_include_and_host_block(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
+
+def _raises(exc: BaseException):
+    def _raise(*_args, **_kwargs):
+        raise exc
+
+    return _raise
+
+
+@pytest.fixture
+def ssh_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     monkeypatch.setattr(mutagen_mod.Path, "home", lambda: tmp_path)
     monkeypatch.setattr(
         mutagen_mod, "_MUTAGEN_SSH_CONFIG_PATH", tmp_path / ".ssh" / "clawbox_mutagen_config"
     )
+    return tmp_path
+
+
+def test_ensure_mutagen_ssh_alias_writes_include_and_host_block(ssh_home: Path) -> None:
     alias = mutagen_mod.ensure_mutagen_ssh_alias(
         "clawbox-91",
         "192.168.64.201",
         "clawbox-91",
-        tmp_path / "id_ed25519",
+        ssh_home / "id_ed25519",
     )
     assert alias == "clawbox-mutagen-clawbox-91"
 
-    main_config = tmp_path / ".ssh" / "config"
-    managed_config = tmp_path / ".ssh" / "clawbox_mutagen_config"
+    main_config = ssh_home / ".ssh" / "config"
+    managed_config = ssh_home / ".ssh" / "clawbox_mutagen_config"
     assert "Include ~/.ssh/clawbox_mutagen_config" in main_config.read_text(encoding="utf-8")
     managed = managed_config.read_text(encoding="utf-8")
     assert "Host clawbox-mutagen-clawbox-91" in managed
     assert "HostName 192.168.64.201" in managed
 
 
-def test_remove_mutagen_ssh_alias_removes_block(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    monkeypatch.setattr(mutagen_mod.Path, "home", lambda: tmp_path)
-    monkeypatch.setattr(
-        mutagen_mod, "_MUTAGEN_SSH_CONFIG_PATH", tmp_path / ".ssh" / "clawbox_mutagen_config"
-    )
+def test_remove_mutagen_ssh_alias_removes_block(ssh_home: Path) -> None:
     mutagen_mod.ensure_mutagen_ssh_alias(
         "clawbox-91",
         "192.168.64.201",
         "clawbox-91",
-        tmp_path / "id_ed25519",
+        ssh_home / "id_ed25519",
     )
     mutagen_mod.remove_mutagen_ssh_alias("clawbox-91")
-    managed = (tmp_path / ".ssh" / "clawbox_mutagen_config").read_text(encoding="utf-8")
+    managed = (ssh_home / ".ssh" / "clawbox_mutagen_config").read_text(encoding="utf-8")
     assert "CLAWBOX MUTAGEN BEGIN clawbox-91" not in managed
 
 
@@ -125,7 +131,7 @@ def test_terminate_vm_sessions_is_noop_without_mutagen(monkeypatch: pytest.Monke
     monkeypatch.setattr(
         mutagen_mod,
         "_run_mutagen",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(AssertionError("should not run mutagen")),
+        _raises(AssertionError("should not run mutagen")),
     )
     mutagen_mod.terminate_vm_sessions("clawbox-91", flush=True)
 
@@ -154,32 +160,19 @@ def test_vm_sessions_exist_uses_label_selector(monkeypatch: pytest.MonkeyPatch)
     ]
 
 
-def test_vm_sessions_status_prefers_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(mutagen_mod, "mutagen_available", lambda: True)
-    monkeypatch.setattr(
-        mutagen_mod,
-        "_run_mutagen",
-        lambda args, **_kwargs: subprocess.CompletedProcess(
-            args=args, returncode=0, stdout="session status", stderr="ignored"
-        ),
-    )
-
-    assert mutagen_mod.vm_sessions_status("clawbox-91") == "session status"
-
-
 def test_run_mutagen_maps_process_errors(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        mutagen_mod.subprocess,
+        MUTAGEN_SUBPROCESS,
         "run",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(FileNotFoundError()),
+        _raises(FileNotFoundError()),
     )
     with pytest.raises(mutagen_mod.MutagenError, match="Command not found: mutagen"):
         mutagen_mod._run_mutagen(["sync", "list"])
 
     monkeypatch.setattr(
-        mutagen_mod.subprocess,
+        MUTAGEN_SUBPROCESS,
         "run",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(OSError("boom")),
+        _raises(OSError("boom")),
     )
     with pytest.raises(mutagen_mod.MutagenError, match="Could not run command"):
         mutagen_mod._run_mutagen(["sync", "list"])
@@ -187,7 +180,7 @@ def test_run_mutagen_maps_process_errors(monkeypatch: pytest.MonkeyPatch) -> Non
 
 def test_run_mutagen_raises_on_nonzero_with_details(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        mutagen_mod.subprocess,
+        MUTAGEN_SUBPROCESS,
         "run",
         lambda *_args, **_kwargs: subprocess.CompletedProcess(
             args=["mutagen", "sync", "list"], returncode=2, stdout="", stderr="bad"
@@ -197,7 +190,7 @@ def test_run_mutagen_raises_on_nonzero_with_details(monkeypatch: pytest.MonkeyPa
         mutagen_mod._run_mutagen(["sync", "list"])
 
     monkeypatch.setattr(
-        mutagen_mod.subprocess,
+        MUTAGEN_SUBPROCESS,
         "run",
         lambda *_args, **_kwargs: subprocess.CompletedProcess(
             args=["mutagen", "sync", "list"], returncode=2, stdout="", stderr=""
@@ -207,11 +200,8 @@ def test_run_mutagen_raises_on_nonzero_with_details(monkeypatch: pytest.MonkeyPa
         mutagen_mod._run_mutagen(["sync", "list"])
 
 
-def test_ensure_main_ssh_config_include_handles_missing_trailing_newline(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    monkeypatch.setattr(mutagen_mod.Path, "home", lambda: tmp_path)
-    ssh_dir = tmp_path / ".ssh"
+def test_ensure_main_ssh_config_include_handles_missing_trailing_newline(ssh_home: Path) -> None:
+    ssh_dir = ssh_home / ".ssh"
     ssh_dir.mkdir(parents=True, exist_ok=True)
     main_config = ssh_dir / "config"
     main_config.write_text("Host *", encoding="utf-8")
@@ -243,41 +233,39 @@ def test_vm_sessions_exist_false_when_mutagen_missing(monkeypatch: pytest.Monkey
     assert mutagen_mod.vm_sessions_exist("clawbox-91") is False
 
 
-def test_vm_sessions_status_fallbacks(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(mutagen_mod, "mutagen_available", lambda: False)
-    assert mutagen_mod.vm_sessions_status("clawbox-91") == "mutagen not available"
-
-    monkeypatch.setattr(mutagen_mod, "mutagen_available", lambda: True)
+@pytest.mark.parametrize(
+    ("available", "stdout", "stderr", "expected"),
+    [
+        (False, "", "", "mutagen not available"),
+        (True, "", "only stderr", "only stderr"),
+        (True, "session status", "ignored", "session status"),
+    ],
+)
+def test_vm_sessions_status_fallbacks(
+    monkeypatch: pytest.MonkeyPatch, available: bool, stdout: str, stderr: str, expected: str
+) -> None:
+    monkeypatch.setattr(mutagen_mod, "mutagen_available", lambda: available)
     monkeypatch.setattr(
         mutagen_mod,
         "_run_mutagen",
         lambda args, **_kwargs: subprocess.CompletedProcess(
-            args=args, returncode=0, stdout="", stderr="only stderr"
+            args=args, returncode=0, stdout=stdout, stderr=stderr
         ),
     )
-    assert mutagen_mod.vm_sessions_status("clawbox-91") == "only stderr"
-
-
-def test_active_vm_registry_handles_invalid_payloads(tmp_path: Path) -> None:
-    path = tmp_path / "mutagen" / "active_vms.json"
-    path.parent.mkdir(parents=True, exist_ok=True)
+    assert mutagen_mod.vm_sessions_status("clawbox-91") == expected
 
-    path.write_text("not-json", encoding="utf-8")
-    assert mutagen_mod._read_active_vms(path) == []
 
-    path.write_text("[]", encoding="utf-8")
-    assert mutagen_mod._read_active_vms(path) == []
-
-    path.write_text(json.dumps({"vms": "bad"}), encoding="utf-8")
-    assert mutagen_mod._read_active_vms(path) == []
-
-    path.write_text(json.dumps({"vms": ["clawbox-92", "", 123, "clawbox-92"]}), encoding="utf-8")
-    assert mutagen_mod._read_active_vms(path) == ["clawbox-92"]
+def test_active_vm_registry_handles_invalid_payloads() -> None:
+    assert mutagen_mod._parse_active_vms("") == []
+    assert mutagen_mod._parse_active_vms("not-json") == []
+    assert mutagen_mod._parse_active_vms("[]") == []
+    assert mutagen_mod._parse_active_vms(json.dumps({"vms": "bad"})) == []
+    assert mutagen_mod._parse_active_vms(json.dumps({"vms": ["clawbox-92", "", 123, "clawbox-92"]})) == ["clawbox-92"]
+    assert mutagen_mod._parse_active_vms(b'{"vms": ["clawbox-91"]}') == ["clawbox-91"]
 
 
 def test_clear_vm_active_and_teardown(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    mutagen_mod.mark_vm_active(tmp_path, "clawbox-91")
-    mutagen_mod.mark_vm_active(tmp_path, "clawbox-92")
+    mutagen_mod.mark_vms_active(tmp_path, ["clawbox-91", "clawbox-92"])
     assert sorted(mutagen_mod.active_vms(tmp_path)) == ["clawbox-91", "clawbox-92"]
 
     mutagen_mod.clear_vm_active(tmp_path, "clawbox-91")
@@ -295,6 +283,23 @@ def test_clear_vm_active_and_teardown(tmp_path: Path, monkeypatch: pytest.Monkey
     assert mutagen_mod.active_vms(tmp_path) == []
 
 
+def test_mark_vms_active_writes_registry_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    mutagen_mod.mark_vm_active(tmp_path, "clawbox-93")
+
+    writes: list[str] = []
+    real_write = mutagen_mod.atomic_write_text
+
+    def _counting_write(path: Path, content: str) -> None:
+        writes.append(content)
+        real_write(path, content)
+
+    monkeypatch.setattr(mutagen_mod, "atomic_write_text", _counting_write)
+    mutagen_mod.mark_vms_active(tmp_path, ["clawbox-91", "clawbox-92", "clawbox-91"])
+
+    assert len(writes) == 1
+    assert mutagen_mod.active_vms(tmp_path) == ["clawbox-91", "clawbox-92", "clawbox-93"]
+
+
 def test_reconcile_vm_sync_ignores_tart_errors(tmp_path: Path) -> None:
     mutagen_mod.mark_vm_active(tmp_path, "clawbox-92")
 
@@ -305,3 +310,15 @@ def test_reconcile_vm_sync_ignores_tart_errors(tmp_path: Path) -> None:
     torn_down: list[str] = []
     mutagen_mod.reconcile_vm_sync(_Tart(), tmp_path)
     assert torn_down == []
+
+
+def test_mutagen_available_caches_which_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+    monkeypatch.setattr(mutagen_mod.shutil, "which", lambda name: lookups.append(name) or "/usr/bin/mutagen")
+    mutagen_mod.mutagen_available.cache_clear()
+    try:
+        assert mutagen_mod.mutagen_available() is True
+        assert mutagen_mod.mutagen_available() is True
+        assert lookups == ["mutagen"]
+    finally:
+        mutagen_mod.mutagen_available.cache_clear()
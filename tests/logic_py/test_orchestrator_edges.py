@@ -1,19 +1,34 @@
 from __future__ import annotations
 
-import io
+import re
 import subprocess
-from contextlib import redirect_stdout
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from clawbox import orchestrator
-from clawbox.locks import LockError
-from clawbox.orchestrator import ProvisionOptions, UpOptions, UserFacingError
+from clawbox.locks import OPENCLAW_PAYLOAD_LOCK, OPENCLAW_SOURCE_LOCK, SIGNAL_PAYLOAD_LOCK, LockError
+from clawbox.mutagen import (
+    MutagenError,
+    SessionSpec,
+    active_vms as active_mutagen_vms,
+    mark_vm_active as mark_mutagen_vm_active,
+)
+from clawbox.orchestrator import (
+    BOOTSTRAP_ADMIN_PASSWORD,
+    BOOTSTRAP_ADMIN_USER,
+    ProvisionOptions,
+    UpOptions,
+    UserFacingError,
+)
 from clawbox.tart import TartError
 
 
 class DummyProcess:
+    __slots__ = ("pid",)
+
     def __init__(self, pid: int = 1000):
         self.pid = pid
 
@@ -21,14 +36,14 @@ class DummyProcess:
         return None
 
 
+@dataclass(slots=True)
 class FakeTart:
-    def __init__(self):
-        self.exists: dict[str, bool] = {}
-        self.running: dict[str, bool] = {}
-        self.ip_map: dict[str, str | None] = {}
-        self.stop_calls: list[str] = []
-        self.delete_calls: list[str] = []
-        self.next_proc = DummyProcess()
+    exists: dict[str, bool] = field(default_factory=dict)
+    running: dict[str, bool] = field(default_factory=dict)
+    ip_map: dict[str, str | None] = field(default_factory=dict)
+    stop_calls: list[str] = field(default_factory=list)
+    delete_calls: list[str] = field(default_factory=list)
+    next_proc: DummyProcess = field(default_factory=DummyProcess)
 
     def vm_exists(self, vm_name: str) -> bool:
         return self.exists.get(vm_name, False)
@@ -53,27 +68,123 @@ class FakeTart:
         return self.ip_map.get(vm_name)
 
 
+@pytest.fixture(scope="module")
+def base_specs() -> tuple[SessionSpec, ...]:
+    return (
+        SessionSpec(
+            kind="openclaw-source",
+            host_path=Path("/tmp/source"),
+            guest_path="/Users/Shared/clawbox-sync/openclaw-source",
+        ),
+        SessionSpec(
+            kind="openclaw-payload",
+            host_path=Path("/tmp/payload"),
+            guest_path="/Users/Shared/clawbox-sync/openclaw-payload",
+        ),
+        SessionSpec(
+            kind="signal-payload",
+            host_path=Path("/tmp/signal"),
+            guest_path="/Users/Shared/clawbox-sync/signal-cli-payload",
+            ready_required=False,
+        ),
+    )
+
+
+SECRETS_MISSING_RE = re.compile("Secrets file not found")
+SECRETS_WRITE_RE = re.compile("Could not write secrets file")
+PROFILE_INVALID_RE = re.compile("--profile must be")
+MISSING_DIR_RE = re.compile("Expected directory does not exist")
+SIGNAL_MARKER_WRITE_RE = re.compile("Could not write signal payload marker file")
+LOCK_HELD_RE = re.compile("lock held")
+LAUNCH_FAILED_RE = re.compile("Failed to launch VM")
+MUTAGEN_KEY_INSTALL_RE = re.compile("Could not install Mutagen SSH key")
+GUEST_DIRS_RE = re.compile("Could not prepare guest directories")
+SYNC_REQUIRES_RUNNING_RE = re.compile("must be running before activating Mutagen sync")
+DEVELOPER_PATHS_RE = re.compile("Could not determine developer source/payload host paths")
+MUTAGEN_BAD_RE = re.compile("mutagen bad")
+SYNC_PREFLIGHT_RE = re.compile("Required synced developer paths failed preflight checks")
+ANSIBLE_MISSING_RE = re.compile("Command not found: ansible-playbook")
+UNPARSEABLE_RE = re.compile("could not be parsed")
+GUI_RELAUNCH_RE = re.compile("after GUI relaunch")
+CREATE_MISSING_RE = re.compile("was not found after create_vm completed")
+NOT_RUNNING_AFTER_UP_RE = re.compile("is not running after orchestration")
+IP_UNRESOLVED_RE = re.compile("Could not resolve IP")
+NOT_RUNNING_RE = re.compile("did not transition to running state")
+HEADLESS_STOP_TIMEOUT_RE = re.compile("Timed out stopping headless VM")
+DELETE_STOP_TIMEOUT_RE = re.compile("Timed out waiting for VM 'clawbox-91' to stop before deletion")
+STOP_TIMEOUT_RE = re.compile("Timed out waiting for VM 'clawbox-91' to stop")
+STILL_EXISTS_RE = re.compile("still exists after delete attempt")
+
+STANDARD_OPTS = UpOptions(
+    vm_number=91,
+    profile="standard",
+    openclaw_source="",
+    openclaw_payload="",
+    signal_payload="",
+    enable_playwright=False,
+    enable_tailscale=False,
+    enable_signal_cli=False,
+)
+OK_CP = subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout="", stderr="")
+
+
+def make_ansible_shell(returncode: int = 0, stderr: str = "", *, probe: SimpleNamespace | None = None):
+    result = (
+        OK_CP
+        if returncode == 0 and not stderr
+        else subprocess.CompletedProcess(args=["ansible"], returncode=returncode, stdout="", stderr=stderr)
+    )
+
+    def _ansible_shell(_target: str, shell_cmd: str, **_kwargs) -> subprocess.CompletedProcess[str]:
+        if probe is not None:
+            probe.first = probe.first or shell_cmd
+            probe.count += 1
+        return result
+
+    return _ansible_shell
+
+
+@pytest.fixture(scope="module")
+def stub_keypair(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    key_path = tmp_path_factory.mktemp("keys") / "id_ed25519"
+    key_path.write_text("private", encoding="utf-8")
+    key_path.with_suffix(".pub").write_text("ssh-ed25519 AAAATEST", encoding="utf-8")
+    return key_path
+
+
+def _raiser(exc: BaseException):
+    def _raise(*_args, **_kwargs):
+        raise exc
+
+    return _raise
+
+
 @pytest.fixture
-def isolated_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setattr(orchestrator, "PROJECT_DIR", tmp_path)
-    monkeypatch.setattr(orchestrator, "ANSIBLE_DIR", tmp_path / "ansible")
-    monkeypatch.setattr(orchestrator, "SECRETS_FILE", tmp_path / "ansible" / "secrets.yml")
-    monkeypatch.setattr(orchestrator, "STATE_DIR", tmp_path / ".clawbox" / "state")
-    monkeypatch.setattr(orchestrator, "start_vm_watcher", lambda *_args, **_kwargs: 9999)
-    monkeypatch.setattr(orchestrator, "stop_vm_watcher", lambda *_args, **_kwargs: False)
-    monkeypatch.setattr(orchestrator, "mutagen_available", lambda: True)
-    monkeypatch.setattr(orchestrator, "_activate_mutagen_sync", lambda **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_activate_mutagen_sync_from_locks", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
-    (tmp_path / "ansible").mkdir(parents=True, exist_ok=True)
-    yield tmp_path
+def tart() -> FakeTart:
+    return FakeTart()
+
+
+def _noop(*_args, **_kwargs) -> None:
+    return None
 
 
-def _capture_stdout(fn):
-    buf = io.StringIO()
-    with redirect_stdout(buf):
-        fn()
-    return buf.getvalue()
+_ORCHESTRATOR_FLOW_STUBS = {
+    "ensure_secrets_file": _noop,
+    "cleanup_locks_for_vm": _noop,
+    "_deactivate_mutagen_sync": _noop,
+    "_compute_up_provision_reason": lambda *_args, **_kwargs: "",
+    "_ensure_vm_running_for_up": lambda *_args, **_kwargs: False,
+    "_ensure_running_after_provision_if_needed": _noop,
+}
+
+
+@pytest.fixture
+def patched_orchestrator(monkeypatch: pytest.MonkeyPatch):
+    def apply(**overrides) -> None:
+        for name, stub in {**_ORCHESTRATOR_FLOW_STUBS, **overrides}.items():
+            monkeypatch.setattr(orchestrator, name, stub)
+
+    return apply
 
 
 def test_env_int_invalid_returns_default(monkeypatch: pytest.MonkeyPatch):
@@ -85,9 +196,9 @@ def test_ensure_secrets_file_maps_missing_error(isolated_paths, monkeypatch: pyt
     monkeypatch.setattr(
         orchestrator,
         "ensure_vm_password_file",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(FileNotFoundError("missing")),
+        _raiser(FileNotFoundError("missing")),
     )
-    with pytest.raises(UserFacingError, match="Secrets file not found"):
+    with pytest.raises(UserFacingError, match=SECRETS_MISSING_RE):
         orchestrator.ensure_secrets_file(create_if_missing=False)
 
 
@@ -95,9 +206,9 @@ def test_ensure_secrets_file_maps_oserror(isolated_paths, monkeypatch: pytest.Mo
     monkeypatch.setattr(
         orchestrator,
         "ensure_vm_password_file",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(OSError("denied")),
+        _raiser(OSError("denied")),
     )
-    with pytest.raises(UserFacingError, match="Could not write secrets file"):
+    with pytest.raises(UserFacingError, match=SECRETS_WRITE_RE):
         orchestrator.ensure_secrets_file(create_if_missing=True)
 
 
@@ -108,12 +219,12 @@ def test_tail_lines_reads_last_lines(isolated_paths):
 
 
 def test_validate_profile_rejects_invalid():
-    with pytest.raises(UserFacingError, match="--profile must be"):
+    with pytest.raises(UserFacingError, match=PROFILE_INVALID_RE):
         orchestrator._validate_profile("bad-profile")
 
 
 def test_validate_dirs_rejects_missing(tmp_path: Path):
-    with pytest.raises(UserFacingError, match="Expected directory does not exist"):
+    with pytest.raises(UserFacingError, match=MISSING_DIR_RE):
         orchestrator._validate_dirs([str(tmp_path / "missing")])
 
 
@@ -121,35 +232,30 @@ def test_signal_payload_host_marker_maps_oserror(tmp_path: Path, monkeypatch: py
     marker_dir = tmp_path / "payload"
     marker_dir.mkdir(parents=True, exist_ok=True)
 
-    def raise_oserror(*_args, **_kwargs):
-        raise OSError("read only")
-
-    monkeypatch.setattr(Path, "write_text", raise_oserror)
-    with pytest.raises(UserFacingError, match="Could not write signal payload marker file"):
+    monkeypatch.setattr(orchestrator, "_write_marker", _raiser(OSError("read only")))
+    with pytest.raises(UserFacingError, match=SIGNAL_MARKER_WRITE_RE):
         orchestrator._ensure_signal_payload_host_marker(str(marker_dir), "clawbox-91")
 
 
-def test_acquire_locks_maps_lock_error(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_acquire_locks_maps_lock_error(monkeypatch: pytest.MonkeyPatch, tart: FakeTart):
     monkeypatch.setattr(
         orchestrator,
         "acquire_path_lock",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(LockError("lock held")),
+        _raiser(LockError("lock held")),
     )
-    with pytest.raises(UserFacingError, match="lock held"):
+    with pytest.raises(UserFacingError, match=LOCK_HELD_RE):
         orchestrator._acquire_locks(tart, "clawbox-91", "/src", "", "")
 
 
-def test_launch_vm_maps_tart_launch_error(isolated_paths, monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_launch_vm_maps_tart_launch_error(isolated_paths, monkeypatch: pytest.MonkeyPatch, tart: FakeTart):
     tart.exists["clawbox-91"] = True
     monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
     monkeypatch.setattr(
-        tart,
+        FakeTart,
         "run_in_background",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(TartError("run failed")),
+        _raiser(TartError("run failed")),
     )
-    with pytest.raises(UserFacingError, match="Failed to launch VM"):
+    with pytest.raises(UserFacingError, match=LAUNCH_FAILED_RE):
         orchestrator.launch_vm(
             vm_number=91,
             profile="standard",
@@ -161,8 +267,9 @@ def test_launch_vm_maps_tart_launch_error(isolated_paths, monkeypatch: pytest.Mo
         )
 
 
-def test_launch_vm_running_vm_starts_watcher(isolated_paths, monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_launch_vm_running_vm_starts_watcher(
+    isolated_paths, monkeypatch: pytest.MonkeyPatch, capsys, tart: FakeTart
+):
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
     tart.running[vm_name] = True
@@ -174,30 +281,30 @@ def test_launch_vm_running_vm_starts_watcher(isolated_paths, monkeypatch: pytest
         lambda state_dir, name: watcher.update({"state_dir": state_dir, "vm_name": name}) or 5150,
     )
 
-    out = _capture_stdout(
-        lambda: orchestrator.launch_vm(
-            vm_number=91,
-            profile="standard",
-            openclaw_source="",
-            openclaw_payload="",
-            signal_payload="",
-            headless=False,
-            tart=tart,
-        )
+    orchestrator.launch_vm(
+        vm_number=91,
+        profile="standard",
+        openclaw_source="",
+        openclaw_payload="",
+        signal_payload="",
+        headless=False,
+        tart=tart,
     )
+    out = capsys.readouterr().out
     assert watcher["vm_name"] == vm_name
     assert "Watcher active (PID 5150)." in out
 
 
-def test_launch_vm_developer_without_marker_uses_bootstrap_auth_mode(
-    isolated_paths, monkeypatch: pytest.MonkeyPatch
+@pytest.mark.parametrize(("has_marker", "expected"), [(False, "bootstrap_admin"), (True, "vm_user")])
+def test_launch_vm_developer_auth_mode_follows_provision_marker(
+    isolated_paths, monkeypatch: pytest.MonkeyPatch, tart: FakeTart, has_marker: bool, expected: str
 ):
-    tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
     tart.running[vm_name] = True
     seen_auth_modes: list[str] = []
 
+    monkeypatch.setattr(orchestrator, "_is_provisioned", lambda _vm_name: has_marker)
     monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(
         orchestrator,
@@ -214,93 +321,42 @@ def test_launch_vm_developer_without_marker_uses_bootstrap_auth_mode(
         headless=False,
         tart=tart,
     )
-    assert seen_auth_modes == ["bootstrap_admin"]
+    assert seen_auth_modes == [expected]
 
 
-def test_launch_vm_developer_with_marker_uses_vm_user_auth_mode(
-    isolated_paths, monkeypatch: pytest.MonkeyPatch
-):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
-    seen_auth_modes: list[str] = []
-    marker_file = orchestrator.STATE_DIR / f"{vm_name}.provisioned"
+def test_is_provisioned_checks_state_marker(isolated_paths):
+    assert orchestrator._is_provisioned("clawbox-91") is False
+    marker_file = orchestrator.STATE_DIR / "clawbox-91.provisioned"
     marker_file.parent.mkdir(parents=True, exist_ok=True)
     marker_file.write_text("profile: developer\n", encoding="utf-8")
+    assert orchestrator._is_provisioned("clawbox-91") is True
 
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(
-        orchestrator,
-        "_activate_mutagen_sync",
-        lambda **kwargs: seen_auth_modes.append(kwargs["auth_mode"]),
-    )
 
-    orchestrator.launch_vm(
-        vm_number=91,
-        profile="developer",
-        openclaw_source=str(isolated_paths),
-        openclaw_payload=str(isolated_paths),
-        signal_payload="",
-        headless=False,
-        tart=tart,
-    )
-    assert seen_auth_modes == ["vm_user"]
-
-
-def test_resolve_vm_ip_returns_when_available():
-    tart = FakeTart()
+def test_resolve_vm_ip_returns_when_available(tart: FakeTart):
     tart.ip_map["clawbox-91"] = "192.168.64.55"
     assert orchestrator._resolve_vm_ip(tart, "clawbox-91", 1) == "192.168.64.55"
 
 
-def test_resolve_mutagen_auth_uses_vm_user_only(monkeypatch: pytest.MonkeyPatch):
-    vm_name = "clawbox-91"
-    vm_ip = "192.168.64.10"
-    attempted_users: list[str] = []
-
-    monkeypatch.setattr(
-        orchestrator,
-        "vm_user_credentials",
-        lambda _vm_name, *, secrets_file: (_vm_name, "dev-pass"),
-    )
-
-    def fake_ansible_shell(
-        target: str,
-        shell_cmd: str,
-        *,
-        ansible_user: str,
-        ansible_password: str,
-        become: bool = False,
-        inventory_path: str = "inventory/tart_inventory.py",
-    ) -> subprocess.CompletedProcess[str]:
-        attempted_users.append(ansible_user)
-        assert target == vm_ip
-        assert shell_cmd == "true"
-        assert become is False
-        assert inventory_path == f"{vm_ip},"
-        if ansible_user == vm_name and ansible_password == "dev-pass":
-            return subprocess.CompletedProcess(
-                args=["ansible"],
-                returncode=0,
-                stdout="",
-                stderr="",
-            )
-        return subprocess.CompletedProcess(
-            args=["ansible"],
-            returncode=1,
-            stdout="",
-            stderr="unexpected",
-        )
-
-    monkeypatch.setattr(orchestrator, "_ansible_shell", fake_ansible_shell)
-
-    resolved = orchestrator._resolve_mutagen_auth(vm_name, vm_ip, auth_mode="vm_user")
-    assert resolved == ("clawbox-91", "dev-pass")
-    assert attempted_users == [vm_name]
-
-
-def test_resolve_mutagen_auth_raises_after_vm_user_auth_fails(monkeypatch: pytest.MonkeyPatch):
+@pytest.mark.parametrize(
+    ("auth_mode", "returncode", "expected_user", "expected"),
+    [
+        ("vm_user", 0, "clawbox-91", ("clawbox-91", "dev-pass")),
+        ("vm_user", 1, "clawbox-91", None),
+        (
+            "bootstrap_admin",
+            0,
+            BOOTSTRAP_ADMIN_USER,
+            (BOOTSTRAP_ADMIN_USER, BOOTSTRAP_ADMIN_PASSWORD),
+        ),
+    ],
+)
+def test_resolve_mutagen_auth(
+    monkeypatch: pytest.MonkeyPatch,
+    auth_mode: str,
+    returncode: int,
+    expected_user: str,
+    expected: tuple[str, str] | None,
+):
     vm_name = "clawbox-91"
     vm_ip = "192.168.64.10"
     attempted_users: list[str] = []
@@ -327,108 +383,65 @@ def test_resolve_mutagen_auth_raises_after_vm_user_auth_fails(monkeypatch: pytes
         assert inventory_path == f"{vm_ip},"
         return subprocess.CompletedProcess(
             args=["ansible"],
-            returncode=1,
-            stdout="",
-            stderr="dev auth failed",
-        )
-
-    monkeypatch.setattr(orchestrator, "_ansible_shell", fake_ansible_shell)
-
-    with pytest.raises(UserFacingError) as exc_info:
-        orchestrator._resolve_mutagen_auth(vm_name, vm_ip, auth_mode="vm_user")
-    assert "Could not establish guest SSH credentials for Mutagen sync setup" in str(exc_info.value)
-    assert "attempted user: clawbox-91" in str(exc_info.value)
-    assert "dev auth failed" in str(exc_info.value)
-    assert attempted_users == [vm_name]
-
-
-def test_resolve_mutagen_auth_uses_bootstrap_admin_when_requested(
-    monkeypatch: pytest.MonkeyPatch,
-):
-    vm_ip = "192.168.64.10"
-    attempted_users: list[str] = []
-
-    def fake_ansible_shell(
-        target: str,
-        shell_cmd: str,
-        *,
-        ansible_user: str,
-        ansible_password: str,
-        become: bool = False,
-        inventory_path: str = "inventory/tart_inventory.py",
-    ) -> subprocess.CompletedProcess[str]:
-        attempted_users.append(ansible_user)
-        assert target == vm_ip
-        assert shell_cmd == "true"
-        assert become is False
-        assert inventory_path == f"{vm_ip},"
-        return subprocess.CompletedProcess(
-            args=["ansible"],
-            returncode=0,
+            returncode=returncode,
             stdout="",
-            stderr="",
+            stderr="dev auth failed" if returncode else "",
         )
 
     monkeypatch.setattr(orchestrator, "_ansible_shell", fake_ansible_shell)
 
-    resolved = orchestrator._resolve_mutagen_auth(
-        "clawbox-91",
-        vm_ip,
-        auth_mode="bootstrap_admin",
-    )
-    assert resolved == (orchestrator.BOOTSTRAP_ADMIN_USER, orchestrator.BOOTSTRAP_ADMIN_PASSWORD)
-    assert attempted_users == [orchestrator.BOOTSTRAP_ADMIN_USER]
+    if expected is None:
+        with pytest.raises(UserFacingError) as exc_info:
+            orchestrator._resolve_mutagen_auth(vm_name, vm_ip, auth_mode=auth_mode)
+        assert "Could not establish guest SSH credentials for Mutagen sync setup" in str(exc_info.value)
+        assert f"attempted user: {expected_user}" in str(exc_info.value)
+        assert "dev auth failed" in str(exc_info.value)
+    else:
+        assert orchestrator._resolve_mutagen_auth(vm_name, vm_ip, auth_mode=auth_mode) == expected
+    assert attempted_users == [expected_user]
 
 
-def test_ensure_mutagen_keypair_returns_existing_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setattr(orchestrator, "STATE_DIR", tmp_path / ".clawbox" / "state")
-    key_path = orchestrator._mutagen_key_path("clawbox-91")
-    key_path.parent.mkdir(parents=True, exist_ok=True)
-    key_path.write_text("private", encoding="utf-8")
-    key_path.with_suffix(".pub").write_text("public", encoding="utf-8")
+def test_ensure_mutagen_keypair_returns_existing_key(stub_keypair: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(orchestrator, "_mutagen_key_path", lambda _vm_name: stub_keypair)
+    monkeypatch.setattr(orchestrator.subprocess, "run", _raiser(AssertionError("should not run ssh-keygen")))
 
     resolved = orchestrator._ensure_mutagen_keypair("clawbox-91")
-    assert resolved == key_path
+    assert resolved == stub_keypair
 
 
+@pytest.mark.parametrize(
+    ("run_stub", "expected_msg"),
+    [
+        pytest.param(
+            _raiser(FileNotFoundError("missing ssh-keygen")),
+            "Command not found: ssh-keygen",
+            id="fnf",
+        ),
+        pytest.param(
+            lambda *_args, **_kwargs: subprocess.CompletedProcess(
+                args=["ssh-keygen"], returncode=1, stdout="", stderr="boom"
+            ),
+            "Could not generate Mutagen SSH key",
+            id="rc1",
+        ),
+    ],
+)
 def test_ensure_mutagen_keypair_maps_generation_errors(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, run_stub, expected_msg: str
 ):
     monkeypatch.setattr(orchestrator, "STATE_DIR", tmp_path / ".clawbox" / "state")
-    monkeypatch.setattr(
-        orchestrator.subprocess,
-        "run",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(FileNotFoundError("missing ssh-keygen")),
-    )
-    with pytest.raises(UserFacingError, match="Command not found: ssh-keygen"):
-        orchestrator._ensure_mutagen_keypair("clawbox-91")
-
-    monkeypatch.setattr(
-        orchestrator.subprocess,
-        "run",
-        lambda *_args, **_kwargs: subprocess.CompletedProcess(
-            args=["ssh-keygen"], returncode=1, stdout="", stderr="boom"
-        ),
-    )
-    with pytest.raises(UserFacingError, match="Could not generate Mutagen SSH key"):
+    monkeypatch.setattr(orchestrator.subprocess, "run", run_stub)
+    with pytest.raises(UserFacingError, match=expected_msg):
         orchestrator._ensure_mutagen_keypair("clawbox-91")
 
 
 def test_ensure_remote_mutagen_authorized_key_success_and_failure(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    stub_keypair: Path, monkeypatch: pytest.MonkeyPatch
 ):
-    key_path = tmp_path / "id_ed25519"
-    key_path.write_text("private", encoding="utf-8")
-    key_path.with_suffix(".pub").write_text("ssh-ed25519 AAAATEST", encoding="utf-8")
-    monkeypatch.setattr(orchestrator, "_ensure_mutagen_keypair", lambda _vm_name: key_path)
+    monkeypatch.setattr(orchestrator, "_ensure_mutagen_keypair", lambda _vm_name: stub_keypair)
 
-    seen_cmds: list[str] = []
-    monkeypatch.setattr(
-        orchestrator,
-        "_ansible_shell",
-        lambda _target, shell_cmd, **_kwargs: seen_cmds.append(shell_cmd)
-        or subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout="", stderr=""),
-    )
+    probe = SimpleNamespace(first="", count=0)
+    monkeypatch.setattr(orchestrator, "_ansible_shell", make_ansible_shell(probe=probe))
 
     orchestrator._ensure_remote_mutagen_authorized_key(
         "clawbox-91",
@@ -436,17 +449,11 @@ def test_ensure_remote_mutagen_authorized_key_success_and_failure(
         ansible_user="clawbox-91",
         ansible_password="pw",
     )
-    assert seen_cmds
-    assert "authorized_keys" in seen_cmds[0]
+    assert probe.count == 1
+    assert "authorized_keys" in probe.first
 
-    monkeypatch.setattr(
-        orchestrator,
-        "_ansible_shell",
-        lambda *_args, **_kwargs: subprocess.CompletedProcess(
-            args=["ansible"], returncode=1, stdout="", stderr="denied"
-        ),
-    )
-    with pytest.raises(UserFacingError, match="Could not install Mutagen SSH key"):
+    monkeypatch.setattr(orchestrator, "_ansible_shell", make_ansible_shell(1, "denied"))
+    with pytest.raises(UserFacingError, match=MUTAGEN_KEY_INSTALL_RE):
         orchestrator._ensure_remote_mutagen_authorized_key(
             "clawbox-91",
             "192.168.64.10",
@@ -455,53 +462,28 @@ def test_ensure_remote_mutagen_authorized_key_success_and_failure(
         )
 
 
-def test_prepare_remote_mutagen_targets_maps_failure(monkeypatch: pytest.MonkeyPatch):
-    specs = [
-        orchestrator.SessionSpec(
-            kind="openclaw-source",
-            host_path=Path("/tmp/source"),
-            guest_path="/Users/Shared/clawbox-sync/openclaw-source",
-        ),
-        orchestrator.SessionSpec(
-            kind="openclaw-payload",
-            host_path=Path("/tmp/payload"),
-            guest_path="/Users/Shared/clawbox-sync/openclaw-payload",
-        ),
-        orchestrator.SessionSpec(
-            kind="signal-payload",
-            host_path=Path("/tmp/signal"),
-            guest_path="/Users/Shared/clawbox-sync/signal-cli-payload",
-        ),
-    ]
-    seen_cmds: list[str] = []
-    monkeypatch.setattr(
-        orchestrator,
-        "_ansible_shell",
-        lambda _target, shell_cmd, **_kwargs: seen_cmds.append(shell_cmd)
-        or subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout="", stderr=""),
-    )
+def test_prepare_remote_mutagen_targets_maps_failure(
+    base_specs: tuple[SessionSpec, ...], monkeypatch: pytest.MonkeyPatch
+):
+    specs = list(base_specs)
+    probe = SimpleNamespace(first="", count=0)
+    monkeypatch.setattr(orchestrator, "_ansible_shell", make_ansible_shell(probe=probe))
     orchestrator._prepare_remote_mutagen_targets(
         "192.168.64.10",
         specs,
         ansible_user="clawbox-91",
         ansible_password="pw",
     )
-    assert seen_cmds
-    assert 'if [ -L "$path" ]; then rm "$path"; fi' in seen_cmds[0]
-    assert 'chmod -R a+rwX "$path"' not in seen_cmds[0]
-    assert 'chmod -R u+rwX,g+rwX,o+rX "$path"' in seen_cmds[0]
-    assert 'chmod -R o-w "$path"' in seen_cmds[0]
-    assert seen_cmds[0].count('chmod -R u+rwX,g+rwX,o+rX "$path"') == len(specs)
-    assert seen_cmds[0].count('chmod -R o-w "$path"') == len(specs)
-
-    monkeypatch.setattr(
-        orchestrator,
-        "_ansible_shell",
-        lambda *_args, **_kwargs: subprocess.CompletedProcess(
-            args=["ansible"], returncode=1, stdout="", stderr="bad"
-        ),
-    )
-    with pytest.raises(UserFacingError, match="Could not prepare guest directories"):
+    assert probe.count == 1
+    assert 'if [ -L "$path" ]; then rm "$path"; fi' in probe.first
+    assert 'chmod -R a+rwX "$path"' not in probe.first
+    assert 'chmod -R u+rwX,g+rwX,o+rX "$path"' in probe.first
+    assert 'chmod -R o-w "$path"' in probe.first
+    assert probe.first.count('chmod -R u+rwX,g+rwX,o+rX "$path"') == len(specs)
+    assert probe.first.count('chmod -R o-w "$path"') == len(specs)
+
+    monkeypatch.setattr(orchestrator, "_ansible_shell", make_ansible_shell(1, "bad"))
+    with pytest.raises(UserFacingError, match=GUEST_DIRS_RE):
         orchestrator._prepare_remote_mutagen_targets(
             "192.168.64.10",
             specs,
@@ -510,33 +492,26 @@ def test_prepare_remote_mutagen_targets_maps_failure(monkeypatch: pytest.MonkeyP
         )
 
 
-def test_activate_mutagen_sync_requires_running_vm(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    source = tmp_path / "source"
-    payload = tmp_path / "payload"
-    source.mkdir(parents=True, exist_ok=True)
-    payload.mkdir(parents=True, exist_ok=True)
-    tart = FakeTart()
+def test_activate_mutagen_sync_requires_running_vm(
+    sync_dirs, monkeypatch: pytest.MonkeyPatch, tart: FakeTart
+):
     tart.running["clawbox-91"] = False
     monkeypatch.setattr(orchestrator, "mutagen_available", lambda: True)
 
-    with pytest.raises(UserFacingError, match="must be running before activating Mutagen sync"):
+    with pytest.raises(UserFacingError, match=SYNC_REQUIRES_RUNNING_RE):
         orchestrator._activate_mutagen_sync(
             vm_name="clawbox-91",
-            openclaw_source=str(source),
-            openclaw_payload=str(payload),
+            openclaw_source=str(sync_dirs.source),
+            openclaw_payload=str(sync_dirs.payload),
             signal_payload="",
             tart=tart,
             auth_mode="bootstrap_admin",
         )
 
 
-def test_activate_mutagen_sync_success_flow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    source = tmp_path / "source"
-    payload = tmp_path / "payload"
-    source.mkdir(parents=True, exist_ok=True)
-    payload.mkdir(parents=True, exist_ok=True)
-
-    tart = FakeTart()
+def test_activate_mutagen_sync_success_flow(
+    tmp_path: Path, sync_dirs, monkeypatch: pytest.MonkeyPatch, capsys, tart: FakeTart
+):
     tart.running["clawbox-91"] = True
     monkeypatch.setattr(orchestrator, "mutagen_available", lambda: True)
     monkeypatch.setattr(orchestrator, "_resolve_vm_ip", lambda *_args, **_kwargs: "192.168.64.10")
@@ -562,16 +537,15 @@ def test_activate_mutagen_sync_success_flow(tmp_path: Path, monkeypatch: pytest.
     marked: list[str] = []
     monkeypatch.setattr(orchestrator, "mark_mutagen_vm_active", lambda _state, vm: marked.append(vm))
 
-    out = _capture_stdout(
-        lambda: orchestrator._activate_mutagen_sync(
-            vm_name="clawbox-91",
-            openclaw_source=str(source),
-            openclaw_payload=str(payload),
-            signal_payload="",
-            tart=tart,
-            auth_mode="vm_user",
-        )
+    orchestrator._activate_mutagen_sync(
+        vm_name="clawbox-91",
+        openclaw_source=str(sync_dirs.source),
+        openclaw_payload=str(sync_dirs.payload),
+        signal_payload="",
+        tart=tart,
+        auth_mode="vm_user",
     )
+    out = capsys.readouterr().out
     assert "Preparing Mutagen sync..." in out
     assert "optional sync paths still warming up (continuing):" in out
     assert "Mutagen sync active (bidirectional):" in out
@@ -585,12 +559,12 @@ def test_activate_mutagen_sync_from_locks_requires_source_and_payload(
         orchestrator,
         "_host_paths_from_locks",
         lambda _vm_name: {
-            orchestrator.OPENCLAW_SOURCE_LOCK: "",
-            orchestrator.OPENCLAW_PAYLOAD_LOCK: "",
-            orchestrator.SIGNAL_PAYLOAD_LOCK: "",
+            OPENCLAW_SOURCE_LOCK: "",
+            OPENCLAW_PAYLOAD_LOCK: "",
+            SIGNAL_PAYLOAD_LOCK: "",
         },
     )
-    with pytest.raises(UserFacingError, match="Could not determine developer source/payload host paths"):
+    with pytest.raises(UserFacingError, match=DEVELOPER_PATHS_RE):
         orchestrator._activate_mutagen_sync_from_locks("clawbox-91", FakeTart())
 
 
@@ -601,9 +575,9 @@ def test_activate_mutagen_sync_from_locks_forwards_expected_values(
         orchestrator,
         "_host_paths_from_locks",
         lambda _vm_name: {
-            orchestrator.OPENCLAW_SOURCE_LOCK: "/tmp/source",
-            orchestrator.OPENCLAW_PAYLOAD_LOCK: "/tmp/payload",
-            orchestrator.SIGNAL_PAYLOAD_LOCK: "/tmp/signal",
+            OPENCLAW_SOURCE_LOCK: "/tmp/source",
+            OPENCLAW_PAYLOAD_LOCK: "/tmp/payload",
+            SIGNAL_PAYLOAD_LOCK: "/tmp/signal",
         },
     )
     seen: dict[str, object] = {}
@@ -621,19 +595,52 @@ def test_deactivate_mutagen_sync_maps_mutagen_error(monkeypatch: pytest.MonkeyPa
     monkeypatch.setattr(
         orchestrator,
         "teardown_vm_sync",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(orchestrator.MutagenError("mutagen bad")),
+        _raiser(MutagenError("mutagen bad")),
     )
-    with pytest.raises(UserFacingError, match="mutagen bad"):
+    monkeypatch.setattr(orchestrator, "vm_sessions_exist", lambda _vm_name: True)
+    with pytest.raises(UserFacingError, match=MUTAGEN_BAD_RE):
         orchestrator._deactivate_mutagen_sync("clawbox-91", flush=False)
 
 
-def test_build_sync_specs_ignores_node_modules_and_dist_for_source() -> None:
+def test_deactivate_mutagen_sync_skips_terminate_without_live_sessions(monkeypatch: pytest.MonkeyPatch):
+    live_sessions = {"clawbox-91": False}
+    torn_down: list[bool] = []
+    removed_aliases: list[str] = []
+    events: list[tuple[str, dict[str, object]]] = []
+    monkeypatch.setattr(orchestrator, "vm_sessions_exist", lambda vm_name: live_sessions[vm_name])
+    monkeypatch.setattr(
+        orchestrator, "teardown_vm_sync", lambda _state_dir, _vm_name, *, flush: torn_down.append(flush)
+    )
+    monkeypatch.setattr(orchestrator, "remove_mutagen_ssh_alias", removed_aliases.append)
+    monkeypatch.setattr(
+        orchestrator,
+        "emit_sync_event",
+        lambda _state_dir, _vm_name, *, event, actor, reason, details=None: events.append((event, details or {})),
+    )
+    mark_mutagen_vm_active(orchestrator.STATE_DIR, "clawbox-91")
+
+    orchestrator._deactivate_mutagen_sync("clawbox-91", flush=True)
+    assert torn_down == []
+    assert removed_aliases == ["clawbox-91"]
+    assert "clawbox-91" not in active_mutagen_vms(orchestrator.STATE_DIR)
+    assert [event for event, _details in events] == ["teardown_start", "teardown_skipped"]
+    assert events[-1][1]["skipped"] == "no_live_sessions"
+
+    live_sessions["clawbox-91"] = True
+    events.clear()
+    orchestrator._deactivate_mutagen_sync("clawbox-91", flush=False)
+    assert torn_down == [False]
+    assert [event for event, _details in events] == ["teardown_start", "teardown_ok"]
+
+
+@pytest.mark.parametrize(("signal_payload", "expected_signal_specs"), [("", 0), ("/tmp/signal", 1)])
+def test_build_sync_specs(signal_payload: str, expected_signal_specs: int) -> None:
     specs = orchestrator._build_sync_specs(
         "clawbox-91",
         {
-            orchestrator.OPENCLAW_SOURCE_LOCK: "/tmp/source",
-            orchestrator.OPENCLAW_PAYLOAD_LOCK: "/tmp/payload",
-            orchestrator.SIGNAL_PAYLOAD_LOCK: "",
+            OPENCLAW_SOURCE_LOCK: "/tmp/source",
+            OPENCLAW_PAYLOAD_LOCK: "/tmp/payload",
+            SIGNAL_PAYLOAD_LOCK: signal_payload,
         },
     )
     source_specs = [spec for spec in specs if spec.kind == "openclaw-source"]
@@ -641,233 +648,148 @@ def test_build_sync_specs_ignores_node_modules_and_dist_for_source() -> None:
     assert source_specs[0].ignored_paths == ("node_modules", "dist")
     assert source_specs[0].ready_required is True
     signal_specs = [spec for spec in specs if spec.kind == "signal-payload"]
-    assert len(signal_specs) == 0
-
+    assert len(signal_specs) == expected_signal_specs
+    assert all(spec.ready_required for spec in signal_specs)
 
-def test_build_sync_specs_requires_signal_ready_when_configured() -> None:
-    specs = orchestrator._build_sync_specs(
-        "clawbox-91",
-        {
-            orchestrator.OPENCLAW_SOURCE_LOCK: "/tmp/source",
-            orchestrator.OPENCLAW_PAYLOAD_LOCK: "/tmp/payload",
-            orchestrator.SIGNAL_PAYLOAD_LOCK: "/tmp/signal",
-        },
-    )
-    signal_specs = [spec for spec in specs if spec.kind == "signal-payload"]
-    assert len(signal_specs) == 1
-    assert signal_specs[0].ready_required is True
 
-
-def test_wait_for_mutagen_sync_ready_success_cleans_markers(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    source_dir = tmp_path / "source"
-    payload_dir = tmp_path / "payload"
-    source_dir.mkdir(parents=True, exist_ok=True)
-    payload_dir.mkdir(parents=True, exist_ok=True)
-    specs = [
-        orchestrator.SessionSpec(
-            kind="openclaw-source",
-            host_path=source_dir,
-            guest_path="/Users/Shared/clawbox-sync/openclaw-source",
+@pytest.mark.parametrize(
+    ("kinds", "ready_kinds", "vm_name", "expected_missing", "error_fragments"),
+    [
+        pytest.param(
+            ("openclaw-source", "openclaw-payload"),
+            ("openclaw-source", "openclaw-payload"),
+            "",
+            [],
+            (),
+            id="success",
         ),
-        orchestrator.SessionSpec(
-            kind="openclaw-payload",
-            host_path=payload_dir,
-            guest_path="/Users/Shared/clawbox-sync/openclaw-payload",
+        pytest.param(
+            ("openclaw-source",),
+            (),
+            "",
+            None,
+            ("Mutagen sync did not become ready before timeout", "probe failed"),
+            id="timeout",
         ),
-    ]
-
-    monkeypatch.setattr(
-        orchestrator,
-        "_parse_mount_statuses",
-        lambda _stdout, paths: {path: "ok" for path in paths},
-    )
-    monkeypatch.setattr(
-        orchestrator,
-        "_ansible_shell",
-        lambda *_args, **_kwargs: subprocess.CompletedProcess(
-            args=["ansible"], returncode=0, stdout="", stderr=""
+        pytest.param(
+            ("openclaw-source",),
+            (),
+            "clawbox-91",
+            None,
+            ("mutagen session diagnostics", "mutagen status for clawbox-91"),
+            id="timeout_with_diagnostics",
         ),
-    )
-
-    optional_missing = orchestrator._wait_for_mutagen_sync_ready(
-        "192.168.64.10",
-        specs,
-        ansible_user="clawbox-91",
-        ansible_password="clawbox",
-        timeout_seconds=2,
-    )
-    assert optional_missing == []
-    assert not list(source_dir.glob(".clawbox-sync-ready-*"))
-    assert not list(payload_dir.glob(".clawbox-sync-ready-*"))
-
-
-def test_wait_for_mutagen_sync_ready_timeout_cleans_markers(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        pytest.param(
+            ("openclaw-source", "signal-payload"),
+            ("openclaw-source",),
+            "",
+            ["signal-cli-payload/.clawbox-sync-ready-signal-payload-"],
+            (),
+            id="optional_missing",
+        ),
+    ],
+)
+def test_wait_for_mutagen_sync_ready(
+    base_specs: tuple[SessionSpec, ...],
+    sync_dirs,
+    monkeypatch: pytest.MonkeyPatch,
+    kinds: tuple[str, ...],
+    ready_kinds: tuple[str, ...],
+    vm_name: str,
+    expected_missing: list[str] | None,
+    error_fragments: tuple[str, ...],
 ) -> None:
-    source_dir = tmp_path / "source"
-    source_dir.mkdir(parents=True, exist_ok=True)
-    specs = [
-        orchestrator.SessionSpec(
-            kind="openclaw-source",
-            host_path=source_dir,
-            guest_path="/Users/Shared/clawbox-sync/openclaw-source",
-        )
-    ]
+    host_dirs = {
+        "openclaw-source": sync_dirs.source,
+        "openclaw-payload": sync_dirs.payload,
+        "signal-payload": sync_dirs.signal,
+    }
+    specs_by_kind = {spec.kind: spec for spec in base_specs}
+    specs = [replace(specs_by_kind[kind], host_path=host_dirs[kind]) for kind in kinds]
+    ready_prefixes = tuple(f".clawbox-sync-ready-{kind}-" for kind in ready_kinds)
+
+    def parse_statuses(_stdout: str, paths: list[str]) -> dict[str, str]:
+        return {
+            path: "ok" if path.rsplit("/", 1)[-1].startswith(ready_prefixes) else "missing"
+            for path in paths
+        }
 
+    returncode = 0 if set(ready_kinds) == set(kinds) else 1
     monkeypatch.setattr(orchestrator.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(orchestrator, "_parse_mount_statuses", parse_statuses)
     monkeypatch.setattr(
-        orchestrator,
-        "_parse_mount_statuses",
-        lambda _stdout, paths: {path: "missing" for path in paths},
+        orchestrator, "_ansible_shell", make_ansible_shell(returncode, "probe failed" if returncode else "")
     )
     monkeypatch.setattr(
         orchestrator,
-        "_ansible_shell",
-        lambda *_args, **_kwargs: subprocess.CompletedProcess(
-            args=["ansible"], returncode=1, stdout="", stderr="probe failed"
-        ),
+        "vm_sessions_status",
+        lambda name: f"mutagen status for {name}",
     )
 
-    with pytest.raises(UserFacingError, match="Mutagen sync did not become ready before timeout"):
-        orchestrator._wait_for_mutagen_sync_ready(
-            "192.168.64.10",
-            specs,
-            ansible_user="clawbox-91",
-            ansible_password="clawbox",
-            timeout_seconds=2,
-        )
-    assert not list(source_dir.glob(".clawbox-sync-ready-*"))
+    written_markers: list[Path] = []
+    live_markers: set[Path] = set()
 
+    def write_marker(path: Path) -> None:
+        written_markers.append(path)
+        live_markers.add(path)
 
-def test_wait_for_mutagen_sync_ready_timeout_includes_mutagen_diagnostics(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    source_dir = tmp_path / "source"
-    source_dir.mkdir(parents=True, exist_ok=True)
-    specs = [
-        orchestrator.SessionSpec(
-            kind="openclaw-source",
-            host_path=source_dir,
-            guest_path="/Users/Shared/clawbox-sync/openclaw-source",
-        )
-    ]
+    monkeypatch.setattr(orchestrator, "_write_sync_marker", write_marker)
+    monkeypatch.setattr(orchestrator, "_delete_sync_marker", live_markers.discard)
 
-    monkeypatch.setattr(orchestrator.time, "sleep", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(
-        orchestrator,
-        "_parse_mount_statuses",
-        lambda _stdout, paths: {path: "missing" for path in paths},
-    )
-    monkeypatch.setattr(
-        orchestrator,
-        "_ansible_shell",
-        lambda *_args, **_kwargs: subprocess.CompletedProcess(
-            args=["ansible"], returncode=1, stdout="", stderr="probe failed"
-        ),
-    )
-    monkeypatch.setattr(
-        orchestrator,
-        "vm_sessions_status",
-        lambda vm_name: f"mutagen status for {vm_name}",
-    )
-
-    with pytest.raises(UserFacingError) as exc_info:
-        orchestrator._wait_for_mutagen_sync_ready(
+    def wait() -> list[str]:
+        return orchestrator._wait_for_mutagen_sync_ready(
             "192.168.64.10",
             specs,
-            vm_name="clawbox-91",
+            vm_name=vm_name,
             ansible_user="clawbox-91",
             ansible_password="clawbox",
             timeout_seconds=2,
         )
-    msg = str(exc_info.value)
-    assert "mutagen session diagnostics" in msg
-    assert "mutagen status for clawbox-91" in msg
-
-
-def test_wait_for_mutagen_sync_ready_allows_optional_missing(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    source_dir = tmp_path / "source"
-    signal_dir = tmp_path / "signal"
-    source_dir.mkdir(parents=True, exist_ok=True)
-    signal_dir.mkdir(parents=True, exist_ok=True)
-    specs = [
-        orchestrator.SessionSpec(
-            kind="openclaw-source",
-            host_path=source_dir,
-            guest_path="/Users/Shared/clawbox-sync/openclaw-source",
-            ready_required=True,
-        ),
-        orchestrator.SessionSpec(
-            kind="signal-payload",
-            host_path=signal_dir,
-            guest_path="/Users/Shared/clawbox-sync/signal-cli-payload",
-            ready_required=False,
-        ),
-    ]
-
-    def parse_statuses(_stdout: str, paths: list[str]) -> dict[str, str]:
-        return {
-            path: (
-                "ok"
-                if "openclaw-source/.clawbox-sync-ready-openclaw-source-" in path
-                else "missing"
-            )
-            for path in paths
-        }
-
-    monkeypatch.setattr(orchestrator, "_parse_mount_statuses", parse_statuses)
-    monkeypatch.setattr(
-        orchestrator,
-        "_ansible_shell",
-        lambda *_args, **_kwargs: subprocess.CompletedProcess(
-            args=["ansible"], returncode=1, stdout="", stderr="optional missing"
-        ),
-    )
-
-    optional_missing = orchestrator._wait_for_mutagen_sync_ready(
-        "192.168.64.10",
-        specs,
-        ansible_user="clawbox-91",
-        ansible_password="clawbox",
-        timeout_seconds=2,
-    )
-    assert len(optional_missing) == 1
-    assert "signal-cli-payload/.clawbox-sync-ready-signal-payload-" in optional_missing[0]
-    assert not list(source_dir.glob(".clawbox-sync-ready-*"))
-    assert not list(signal_dir.glob(".clawbox-sync-ready-*"))
 
+    if expected_missing is None:
+        with pytest.raises(UserFacingError) as exc_info:
+            wait()
+        for fragment in error_fragments:
+            assert fragment in str(exc_info.value)
+    else:
+        optional_missing = wait()
+        assert len(optional_missing) == len(expected_missing)
+        for path, fragment in zip(optional_missing, expected_missing):
+            assert fragment in path
+    assert written_markers
+    assert live_markers == set()
+
+
+def test_sync_marker_seams_write_and_delete(tmp_path: Path):
+    marker = tmp_path / ".clawbox-sync-ready-openclaw-source-1"
+    orchestrator._write_sync_marker(marker)
+    assert marker.read_text(encoding="utf-8") == "ready\n"
+    orchestrator._delete_sync_marker(marker)
+    orchestrator._delete_sync_marker(marker)
+    assert not marker.exists()
 
-def test_preflight_developer_mounts_success(isolated_paths, monkeypatch: pytest.MonkeyPatch):
-    payload_dir = isolated_paths / "payload"
-    payload_dir.mkdir(parents=True, exist_ok=True)
 
+def test_preflight_developer_mounts_success(isolated_paths, sync_dirs, monkeypatch: pytest.MonkeyPatch, capsys):
     def fake_wait(*_args, **_kwargs):
         statuses = {path: "ok" for path in _kwargs["paths"]}
         return True, statuses, ""
 
     monkeypatch.setattr(orchestrator, "_wait_for_remote_probe", fake_wait)
-    out = _capture_stdout(
-        lambda: orchestrator._preflight_developer_mounts(
-            "clawbox-91",
-            vm_number=91,
-            openclaw_payload_host=str(payload_dir),
-            signal_payload_host="",
-            include_signal_payload=False,
-            timeout_seconds=3,
-        )
+    orchestrator._preflight_developer_mounts(
+        "clawbox-91",
+        vm_number=91,
+        openclaw_payload_host=str(sync_dirs.payload),
+        signal_payload_host="",
+        include_signal_payload=False,
+        timeout_seconds=3,
     )
+    out = capsys.readouterr().out
     assert "synced developer paths verified" in out
 
 
 def test_preflight_developer_mounts_failure_contains_diagnostics(
-    isolated_paths, monkeypatch: pytest.MonkeyPatch
+    isolated_paths, sync_dirs, monkeypatch: pytest.MonkeyPatch
 ):
-    payload_dir = isolated_paths / "payload"
-    payload_dir.mkdir(parents=True, exist_ok=True)
 
     monkeypatch.setattr(
         orchestrator,
@@ -883,50 +805,48 @@ def test_preflight_developer_mounts_failure_contains_diagnostics(
             "",
         ),
     )
-    with pytest.raises(UserFacingError, match="Required synced developer paths failed preflight checks"):
+    with pytest.raises(UserFacingError, match=SYNC_PREFLIGHT_RE):
         orchestrator._preflight_developer_mounts(
             "clawbox-91",
             vm_number=91,
-            openclaw_payload_host=str(payload_dir),
+            openclaw_payload_host=str(sync_dirs.payload),
             signal_payload_host="",
             include_signal_payload=False,
             timeout_seconds=3,
         )
 
 
-def test_preflight_signal_payload_marker_success(monkeypatch: pytest.MonkeyPatch):
+def test_preflight_signal_payload_marker_success(monkeypatch: pytest.MonkeyPatch, capsys):
     marker_path = f"{orchestrator.SIGNAL_PAYLOAD_MOUNT}/{orchestrator.SIGNAL_PAYLOAD_MARKER_FILENAME}"
     monkeypatch.setattr(
         orchestrator,
         "_wait_for_remote_probe",
         lambda *_args, **_kwargs: (True, {marker_path: "ok"}, ""),
     )
-    out = _capture_stdout(
-        lambda: orchestrator._preflight_signal_payload_marker(
-            "clawbox-91",
-            vm_number=91,
-            timeout_seconds=3,
-            inventory_path="192.168.64.1,",
-            target_host="192.168.64.1",
-        )
+    orchestrator._preflight_signal_payload_marker(
+        "clawbox-91",
+        vm_number=91,
+        timeout_seconds=3,
+        inventory_path="192.168.64.1,",
+        target_host="192.168.64.1",
     )
+    out = capsys.readouterr().out
     assert "signal-cli payload marker verified" in out
 
 
-def test_provision_vm_maps_missing_ansible_playbook(isolated_paths, monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_provision_vm_maps_missing_ansible_playbook(
+    isolated_paths, monkeypatch: pytest.MonkeyPatch, tart: FakeTart
+):
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
     tart.running[vm_name] = True
     tart.ip_map[vm_name] = "192.168.64.10"
 
-    monkeypatch.setattr(orchestrator, "ensure_secrets_file", lambda *_args, **_kwargs: None)
-
-    def raise_not_found(*_args, **_kwargs):
-        raise FileNotFoundError("missing ansible-playbook")
-
-    monkeypatch.setattr(orchestrator.subprocess, "run", raise_not_found)
-    with pytest.raises(UserFacingError, match="Command not found: ansible-playbook"):
+    monkeypatch.setattr(orchestrator, "ensure_secrets_file", _noop)
+    monkeypatch.setattr(
+        orchestrator.subprocess, "run", _raiser(FileNotFoundError("missing ansible-playbook"))
+    )
+    with pytest.raises(UserFacingError, match=ANSIBLE_MISSING_RE):
         orchestrator.provision_vm(
             ProvisionOptions(
                 vm_number=91,
@@ -953,8 +873,7 @@ def test_stop_vm_and_wait_timeout(monkeypatch: pytest.MonkeyPatch):
     assert orchestrator._stop_vm_and_wait(tart, "clawbox-91", timeout_seconds=2) is False
 
 
-def test_stop_vm_and_wait_stops_watcher(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_stop_vm_and_wait_stops_watcher(monkeypatch: pytest.MonkeyPatch, tart: FakeTart):
     tart.running["clawbox-91"] = True
     stopped: list[str] = []
     monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
@@ -982,24 +901,16 @@ def test_render_up_command_includes_optional_flags():
             enable_signal_cli=True,
         )
     )
-    assert "--add-playwright-provisioning" in cmd
-    assert "--add-tailscale-provisioning" in cmd
-    assert "--add-signal-cli-provisioning" in cmd
-    assert "--signal-cli-payload" in cmd
+    assert cmd == (
+        "clawbox up 92 --developer --openclaw-source /src --openclaw-payload /payload "
+        "--add-playwright-provisioning --add-tailscale-provisioning --add-signal-cli-provisioning "
+        "--signal-cli-payload /signal"
+    )
+    assert orchestrator._render_up_command(STANDARD_OPTS) == "clawbox up 91"
 
 
 def test_compute_up_provision_reason_created_vm():
-    opts = UpOptions(
-        vm_number=91,
-        profile="standard",
-        openclaw_source="",
-        openclaw_payload="",
-        signal_payload="",
-        enable_playwright=False,
-        enable_tailscale=False,
-        enable_signal_cli=False,
-    )
-    reason = orchestrator._compute_up_provision_reason(opts, Path("/tmp/nope"), True, False)
+    reason = orchestrator._compute_up_provision_reason(STANDARD_OPTS, Path("/tmp/nope"), True, False)
     assert reason == "VM was created in this run"
 
 
@@ -1007,90 +918,59 @@ def test_compute_up_provision_reason_parse_failure(isolated_paths):
     marker_file = orchestrator.STATE_DIR / "clawbox-91.provisioned"
     marker_file.parent.mkdir(parents=True, exist_ok=True)
     marker_file.write_text("bad content\n", encoding="utf-8")
-    opts = UpOptions(
-        vm_number=91,
-        profile="standard",
-        openclaw_source="",
-        openclaw_payload="",
-        signal_payload="",
-        enable_playwright=False,
-        enable_tailscale=False,
-        enable_signal_cli=False,
-    )
-    with pytest.raises(UserFacingError, match="could not be parsed"):
-        orchestrator._compute_up_provision_reason(opts, marker_file, False, False)
+    with pytest.raises(UserFacingError, match=UNPARSEABLE_RE):
+        orchestrator._compute_up_provision_reason(STANDARD_OPTS, marker_file, False, False)
 
 
-def test_ensure_vm_running_for_up_timeout(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
-    monkeypatch.setattr(orchestrator, "launch_vm", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "wait_for_vm_running", lambda *_args, **_kwargs: False)
-    with pytest.raises(UserFacingError, match="did not transition to running state"):
-        orchestrator._ensure_vm_running_for_up(
-            "clawbox-91",
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            "needs provision",
-            tart,
-        )
+def _never(*_args, **_kwargs) -> bool:
+    return False
 
 
-def test_relaunch_gui_after_headless_provision_stop_timeout(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
-    tart.running["clawbox-91"] = True
-    monkeypatch.setattr(orchestrator, "_stop_vm_and_wait", lambda *_args, **_kwargs: False)
-    with pytest.raises(UserFacingError, match="Timed out stopping headless VM"):
-        orchestrator._relaunch_gui_after_headless_provision(
-            "clawbox-91",
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-            launched_headless=True,
-        )
+def _always(*_args, **_kwargs) -> bool:
+    return True
 
 
-def test_relaunch_gui_after_headless_provision_relaunch_timeout(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
-    tart.running["clawbox-91"] = True
-    monkeypatch.setattr(orchestrator, "_stop_vm_and_wait", lambda *_args, **_kwargs: True)
-    monkeypatch.setattr(orchestrator, "launch_vm", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "wait_for_vm_running", lambda *_args, **_kwargs: False)
-    with pytest.raises(UserFacingError, match="after GUI relaunch"):
-        orchestrator._relaunch_gui_after_headless_provision(
-            "clawbox-91",
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
+@pytest.mark.parametrize(
+    ("running", "patches", "call", "exc_match"),
+    [
+        (
+            False,
+            {"launch_vm": _noop, "wait_for_vm_running": _never},
+            lambda tart: orchestrator._ensure_vm_running_for_up(
+                "clawbox-91", STANDARD_OPTS, "needs provision", tart
             ),
-            tart,
-            launched_headless=True,
-        )
+            NOT_RUNNING_RE,
+        ),
+        (
+            True,
+            {"_stop_vm_and_wait": _never},
+            lambda tart: orchestrator._relaunch_gui_after_headless_provision(
+                "clawbox-91", STANDARD_OPTS, tart, launched_headless=True
+            ),
+            HEADLESS_STOP_TIMEOUT_RE,
+        ),
+        (
+            True,
+            {"_stop_vm_and_wait": _always, "launch_vm": _noop, "wait_for_vm_running": _never},
+            lambda tart: orchestrator._relaunch_gui_after_headless_provision(
+                "clawbox-91", STANDARD_OPTS, tart, launched_headless=True
+            ),
+            GUI_RELAUNCH_RE,
+        ),
+    ],
+    ids=["ensure_running_timeout", "headless_stop_timeout", "gui_relaunch_timeout"],
+)
+def test_up_launch_failure_paths(
+    monkeypatch: pytest.MonkeyPatch, tart: FakeTart, running: bool, patches, call, exc_match: re.Pattern[str]
+):
+    tart.running["clawbox-91"] = running
+    for name, stub in patches.items():
+        monkeypatch.setattr(orchestrator, name, stub)
+    with pytest.raises(UserFacingError, match=exc_match):
+        call(tart)
 
 
-def test_ensure_running_after_provision_launches(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_ensure_running_after_provision_launches(monkeypatch: pytest.MonkeyPatch, tart: FakeTart):
     calls = {"launch": 0, "wait": 0}
 
     def fake_wait(*_args, **_kwargs):
@@ -1101,184 +981,128 @@ def test_ensure_running_after_provision_launches(monkeypatch: pytest.MonkeyPatch
     monkeypatch.setattr(orchestrator, "launch_vm", lambda *_args, **_kwargs: calls.update(launch=1))
     orchestrator._ensure_running_after_provision_if_needed(
         "clawbox-91",
-        UpOptions(
-            vm_number=91,
-            profile="standard",
-            openclaw_source="",
-            openclaw_payload="",
-            signal_payload="",
-            enable_playwright=False,
-            enable_tailscale=False,
-            enable_signal_cli=False,
-        ),
+        STANDARD_OPTS,
         tart,
         provision_ran=True,
     )
     assert calls["launch"] == 1
 
 
-def test_up_errors_when_vm_missing_after_create(isolated_paths, monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
-    monkeypatch.setattr(orchestrator, "ensure_secrets_file", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "create_vm", lambda *_args, **_kwargs: None)
-    with pytest.raises(UserFacingError, match="was not found after create_vm completed"):
-        orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
-
-
-def test_up_errors_when_not_running_after_orchestration(isolated_paths, monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
-    tart.exists["clawbox-91"] = True
-    monkeypatch.setattr(orchestrator, "ensure_secrets_file", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_compute_up_provision_reason", lambda *_args, **_kwargs: "")
-    monkeypatch.setattr(orchestrator, "_ensure_vm_running_for_up", lambda *_args, **_kwargs: False)
-    monkeypatch.setattr(orchestrator, "_ensure_running_after_provision_if_needed", lambda *_args, **_kwargs: None)
-    with pytest.raises(UserFacingError, match="is not running after orchestration"):
-        orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+@pytest.mark.parametrize(
+    ("exists", "overrides", "exc_match"),
+    [
+        (False, {"create_vm": _noop}, CREATE_MISSING_RE),
+        (True, {}, NOT_RUNNING_AFTER_UP_RE),
+    ],
+    ids=["missing_after_create", "not_running_after_orchestration"],
+)
+def test_up_failure_paths(
+    isolated_paths, patched_orchestrator, tart: FakeTart, exists: bool, overrides, exc_match: re.Pattern[str]
+):
+    tart.exists["clawbox-91"] = exists
+    patched_orchestrator(**overrides)
+    with pytest.raises(UserFacingError, match=exc_match):
+        orchestrator.up(STANDARD_OPTS, tart)
 
 
-def test_up_mutagen_activates_sync(isolated_paths, monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_up_mutagen_activates_sync(
+    isolated_paths, patched_orchestrator, capsys, tart: FakeTart, developer_marker_text: str
+):
     tart.exists["clawbox-91"] = True
     tart.running["clawbox-91"] = True
     marker = orchestrator.STATE_DIR / "clawbox-91.provisioned"
     marker.parent.mkdir(parents=True, exist_ok=True)
-    orchestrator.ProvisionMarker(
-        vm_name="clawbox-91",
-        profile="developer",
-        playwright=False,
-        tailscale=False,
-        signal_cli=False,
-        signal_payload=False,
-        provisioned_at="2026-01-01T00:00:00Z",
-    ).write(marker)
+    marker.write_text(developer_marker_text, encoding="utf-8")
 
     activated: list[str] = []
-    monkeypatch.setattr(orchestrator, "ensure_secrets_file", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_compute_up_provision_reason", lambda *_args, **_kwargs: "")
-    monkeypatch.setattr(orchestrator, "_ensure_vm_running_for_up", lambda *_args, **_kwargs: False)
-    monkeypatch.setattr(orchestrator, "_ensure_running_after_provision_if_needed", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(
-        orchestrator,
-        "_activate_mutagen_sync",
-        lambda **kwargs: activated.append(kwargs["vm_name"]),
-    )
+    patched_orchestrator(_activate_mutagen_sync=lambda **kwargs: activated.append(kwargs["vm_name"]))
 
-    out = _capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="developer",
-                openclaw_source=str(isolated_paths),
-                openclaw_payload=str(isolated_paths),
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    orchestrator.up(
+        UpOptions(
+            vm_number=91,
+            profile="developer",
+            openclaw_source=str(isolated_paths),
+            openclaw_payload=str(isolated_paths),
+            signal_payload="",
+            enable_playwright=False,
+            enable_tailscale=False,
+            enable_signal_cli=False,
+        ),
+        tart,
     )
+    out = capsys.readouterr().out
     assert activated == ["clawbox-91"]
     assert "Clawbox is running: clawbox-91 (provisioning skipped)" in out
 
 
-def test_wait_for_vm_absent_timeout(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_wait_for_vm_absent_timeout(monkeypatch: pytest.MonkeyPatch, tart: FakeTart):
     tart.exists["clawbox-91"] = True
     monkeypatch.setattr(orchestrator.time, "sleep", lambda *_args, **_kwargs: None)
     assert orchestrator._wait_for_vm_absent(tart, "clawbox-91", timeout_seconds=2) is False
 
 
-def test_down_vm_nonexistent_cleans_locks(isolated_paths, monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_down_vm_nonexistent_cleans_locks(
+    isolated_paths, monkeypatch: pytest.MonkeyPatch, capsys, tart: FakeTart
+):
     cleaned: list[str] = []
     monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda vm_name: cleaned.append(vm_name))
-    out = _capture_stdout(lambda: orchestrator.down_vm(91, tart))
+    orchestrator.down_vm(91, tart)
+    out = capsys.readouterr().out
     assert "does not exist" in out
     assert cleaned == ["clawbox-91"]
 
 
-def test_down_vm_timeout_raises(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_down_vm_timeout_raises(patched_orchestrator, tart: FakeTart):
     tart.exists["clawbox-91"] = True
     tart.running["clawbox-91"] = True
-    monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_stop_vm_and_wait", lambda *_args, **_kwargs: False)
-    with pytest.raises(UserFacingError, match="Timed out waiting for VM 'clawbox-91' to stop"):
+    patched_orchestrator(_stop_vm_and_wait=lambda *_args, **_kwargs: False)
+    with pytest.raises(UserFacingError, match=STOP_TIMEOUT_RE):
         orchestrator.down_vm(91, tart)
 
 
-def test_down_vm_already_stopped_message(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_down_vm_already_stopped_message(patched_orchestrator, capsys, tart: FakeTart):
     tart.exists["clawbox-91"] = True
     tart.running["clawbox-91"] = False
-    monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda *_args, **_kwargs: None)
-    out = _capture_stdout(lambda: orchestrator.down_vm(91, tart))
+    patched_orchestrator()
+    orchestrator.down_vm(91, tart)
+    out = capsys.readouterr().out
     assert "already stopped" in out
 
 
-def test_delete_vm_nonexistent_cleans_state(isolated_paths, monkeypatch: pytest.MonkeyPatch):
+def test_delete_vm_nonexistent_cleans_state(
+    isolated_paths, monkeypatch: pytest.MonkeyPatch, capsys, tart: FakeTart
+):
     marker = orchestrator.STATE_DIR / "clawbox-91.provisioned"
     marker.parent.mkdir(parents=True, exist_ok=True)
     marker.write_text("profile: standard\n", encoding="utf-8")
-    tart = FakeTart()
     cleaned: list[str] = []
     monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda vm_name: cleaned.append(vm_name))
-    out = _capture_stdout(lambda: orchestrator.delete_vm(91, tart))
+    orchestrator.delete_vm(91, tart)
+    out = capsys.readouterr().out
     assert "does not exist" in out
     assert not marker.exists()
     assert cleaned == ["clawbox-91"]
 
 
-def test_delete_vm_timeout_before_delete(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_delete_vm_timeout_before_delete(patched_orchestrator, tart: FakeTart):
     tart.exists["clawbox-91"] = True
     tart.running["clawbox-91"] = True
-    monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_stop_vm_and_wait", lambda *_args, **_kwargs: False)
-    with pytest.raises(UserFacingError, match="Timed out waiting for VM 'clawbox-91' to stop before deletion"):
+    patched_orchestrator(_stop_vm_and_wait=lambda *_args, **_kwargs: False)
+    with pytest.raises(UserFacingError, match=DELETE_STOP_TIMEOUT_RE):
         orchestrator.delete_vm(91, tart)
 
 
-def test_delete_vm_still_exists_after_delete(monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_delete_vm_still_exists_after_delete(patched_orchestrator, tart: FakeTart):
     tart.exists["clawbox-91"] = True
     tart.running["clawbox-91"] = False
-    monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_wait_for_vm_absent", lambda *_args, **_kwargs: False)
-    with pytest.raises(UserFacingError, match="still exists after delete attempt"):
+    patched_orchestrator(_wait_for_vm_absent=lambda *_args, **_kwargs: False)
+    with pytest.raises(UserFacingError, match=STILL_EXISTS_RE):
         orchestrator.delete_vm(91, tart)
 
 
-def test_ip_vm_errors_when_ip_unavailable():
-    tart = FakeTart()
+def test_ip_vm_errors_when_ip_unavailable(tart: FakeTart):
     tart.exists["clawbox-91"] = True
     tart.running["clawbox-91"] = True
     tart.ip_map["clawbox-91"] = None
-    with pytest.raises(UserFacingError, match="Could not resolve IP"):
+    with pytest.raises(UserFacingError, match=IP_UNRESOLVED_RE):
         orchestrator.ip_vm(91, tart)
@@ -33,6 +33,23 @@ def test_read_vm_password_rejects_invalid_content(tmp_path: Path) -> None:
         secrets.read_vm_password(path)
 
 
+def test_read_vm_password_caches_until_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "secrets.yml"
+    path.write_text('vm_password: "secret"\n', encoding="utf-8")
+    parsed: list[str] = []
+    real_parse = secrets.parse_vm_password
+    monkeypatch.setattr(secrets, "parse_vm_password", lambda text: parsed.append(text) or real_parse(text))
+    secrets._read_vm_password_cached.cache_clear()
+
+    assert secrets.read_vm_password(path) == "secret"
+    assert secrets.read_vm_password(path) == "secret"
+    assert len(parsed) == 1
+
+    path.write_text('vm_password: "rotated"\n', encoding="utf-8")
+    assert secrets.read_vm_password(path) == "rotated"
+    assert len(parsed) == 2
+
+
 def test_parse_vm_password_does_not_match_similar_key_names() -> None:
     text = '\n'.join(
         [
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import io
 import json
 import subprocess
-from contextlib import redirect_stdout
+import threading
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
+from clawbox import state as state_mod
 from clawbox import status as status_ops
 from clawbox.state import ProvisionMarker
 
@@ -18,26 +20,26 @@ MUTAGEN_FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "mutag
 class FakeTart:
     def __init__(self, vms: list[dict[str, object]]):
         self.vms = vms
+        self._by_name = {vm["Name"]: vm for vm in vms}
 
     def list_vms_json(self) -> list[dict[str, object]]:
         return self.vms
 
+    def vms_by_name(self) -> dict[str, dict[str, object]]:
+        return self._by_name
+
     def vm_exists(self, vm_name: str) -> bool:
-        return any(vm.get("Name") == vm_name for vm in self.vms)
+        return vm_name in self._by_name
 
     def vm_running(self, vm_name: str) -> bool:
-        for vm in self.vms:
-            if vm.get("Name") == vm_name:
-                running = vm.get("Running")
-                return bool(running) if isinstance(running, bool) else False
-        return False
+        vm = self._by_name.get(vm_name)
+        return vm is not None and vm.get("Running") is True
 
     def ip(self, vm_name: str) -> str | None:
-        for vm in self.vms:
-            if vm.get("Name") == vm_name and self.vm_running(vm_name):
-                ip = vm.get("IP")
-                return ip if isinstance(ip, str) else None
-        return None
+        if not self.vm_running(vm_name):
+            return None
+        ip = self._by_name[vm_name].get("IP")
+        return ip if isinstance(ip, str) else None
 
 
 def _context(tmp_path: Path) -> status_ops.StatusContext:
@@ -53,13 +55,7 @@ def _context(tmp_path: Path) -> status_ops.StatusContext:
     )
 
 
-def _capture(fn) -> str:
-    buf = io.StringIO()
-    with redirect_stdout(buf):
-        fn()
-    return buf.getvalue()
-
-
+@lru_cache(maxsize=None)
 def _mutagen_fixture(name: str) -> str:
     return (MUTAGEN_FIXTURES_DIR / name).read_text(encoding="utf-8")
 
@@ -71,6 +67,31 @@ def test_parse_mount_statuses_tolerates_blank_lines() -> None:
     assert statuses["/b"] == "unknown"
 
 
+def test_build_mount_status_command_reads_mount_table_once(tmp_path: Path) -> None:
+    mounted, plain_dir, missing = tmp_path / "src dir", tmp_path / "payload", tmp_path / "missing"
+    mounted.mkdir()
+    plain_dir.mkdir()
+    fake_mount = tmp_path / "mount"
+    fake_mount.write_text(f"#!/bin/sh\necho 'share on {mounted} (virtiofs, local)'\n", encoding="utf-8")
+    fake_mount.chmod(0o755)
+    paths = [str(mounted), str(plain_dir), str(missing)]
+
+    cmd = status_ops.build_mount_status_command(paths)
+    assert cmd.count("/sbin/mount") == 1
+
+    proc = subprocess.run(
+        ["/bin/sh", "-c", cmd.replace("/sbin/mount", str(fake_mount))],
+        check=True,
+        text=True,
+        capture_output=True,
+    )
+    assert status_ops.parse_mount_statuses(proc.stdout, paths) == {
+        str(mounted): "mounted",
+        str(plain_dir): "dir",
+        str(missing): "missing",
+    }
+
+
 def test_format_mount_statuses_outputs_lines() -> None:
     rendered = status_ops.format_mount_statuses({"/a": "mounted", "/b": "dir"})
     assert "/a: mounted" in rendered
@@ -123,6 +144,42 @@ def test_status_mount_paths_for_standard_marker(tmp_path: Path) -> None:
     assert note is None
 
 
+def test_marker_path_for_reuses_built_path(tmp_path: Path) -> None:
+    path = state_mod.marker_path_for(tmp_path, "clawbox-91")
+    assert path == tmp_path / "clawbox-91.provisioned"
+    assert state_mod.marker_path_for(tmp_path, "clawbox-91") is path
+
+
+def test_provision_marker_from_file_caches_until_rewritten(tmp_path: Path) -> None:
+    marker_file = tmp_path / "clawbox-91.provisioned"
+    assert ProvisionMarker.from_file(marker_file) is None
+
+    marker = ProvisionMarker(
+        vm_name="clawbox-91",
+        profile="standard",
+        playwright=False,
+        tailscale=False,
+        signal_cli=False,
+        signal_payload=False,
+        provisioned_at="2026-01-01T00:00:00Z",
+    )
+    marker.write(marker_file)
+    assert ProvisionMarker.from_file(marker_file) == marker
+    hits = state_mod._read_marker_fields.cache_info().hits
+    assert ProvisionMarker.from_file(marker_file) == marker
+    assert state_mod._read_marker_fields.cache_info().hits == hits + 1
+
+    marker = replace(marker, profile="developer")
+    marker.write(marker_file)
+    assert ProvisionMarker.from_file(marker_file) == marker
+
+    marker_file.write_text("profile: standard\nplaywright: true\n", encoding="utf-8")
+    reread = ProvisionMarker.from_file(marker_file)
+    assert reread is not None
+    assert reread.profile == "standard"
+    assert reread.playwright is True
+
+
 def test_probe_sync_paths_not_applicable(tmp_path: Path) -> None:
     ctx = _context(tmp_path)
     probe, statuses = status_ops._probe_sync_paths(
@@ -202,7 +259,23 @@ def test_summarize_mutagen_status_treats_unstructured_nonempty_output_as_active(
     assert lines == ["unexpected mutagen output line", "another diagnostic line"]
 
 
-def test_render_status_report_text_unavailable_branches(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        ("\n-----\n  \n", (False, ["no active sessions found"])),
+        ("Name: a\n-----\nNo synchronization sessions found\n", (False, ["no active sessions found"])),
+        (
+            "".join(f"Name: s{i}\nStatus: ok\n" for i in range(5)),
+            (True, ["Name: s0", "Status: ok", "Name: s1", "Status: ok", "Name: s2", "Status: ok"]),
+        ),
+    ],
+    ids=["rules_only", "late_no_sessions", "summary_capped"],
+)
+def test_summarize_mutagen_status_edge_cases(output: str, expected: tuple[bool, list[str]]) -> None:
+    assert status_ops._summarize_mutagen_status(output) == expected
+
+
+def test_render_status_report_text_unavailable_branches(tmp_path: Path, capsys) -> None:
     marker_file = tmp_path / "state" / "clawbox-91.provisioned"
     marker_file.parent.mkdir(parents=True, exist_ok=True)
     marker_file.write_text("profile: developer\n", encoding="utf-8")
@@ -229,12 +302,13 @@ def test_render_status_report_text_unavailable_branches(tmp_path: Path) -> None:
             lines=[],
         ),
     )
-    out = _capture(lambda: status_ops._render_status_report_text("clawbox-91", marker_file, marker, report))
+    status_ops._render_status_report_text("clawbox-91", marker_file, marker, report)
+    out = capsys.readouterr().out
     assert "sync paths: unavailable" in out
     assert "signal payload sync daemon:" not in out
 
 
-def test_render_status_report_text_does_not_render_signal_daemon_section(tmp_path: Path) -> None:
+def test_render_status_report_text_does_not_render_signal_daemon_section(tmp_path: Path, capsys) -> None:
     marker_file = tmp_path / "state" / "clawbox-91.provisioned"
     marker_file.parent.mkdir(parents=True, exist_ok=True)
     marker_file.write_text("profile: developer\n", encoding="utf-8")
@@ -251,7 +325,8 @@ def test_render_status_report_text_does_not_render_signal_daemon_section(tmp_pat
             lines=[],
         ),
     )
-    out = _capture(lambda: status_ops._render_status_report_text("clawbox-91", marker_file, None, report))
+    status_ops._render_status_report_text("clawbox-91", marker_file, None, report)
+    out = capsys.readouterr().out
     assert "signal payload sync daemon:" not in out
 
 
@@ -269,6 +344,17 @@ def test_candidate_vm_names_include_tart_vms_and_marker_only(tmp_path: Path) ->
     assert status_ops._candidate_vm_names(tart, ctx) == ["clawbox-92", "clawbox-93"]
 
 
+def test_candidate_vm_names_ignore_non_marker_entries(tmp_path: Path) -> None:
+    ctx = _context(tmp_path)
+    ctx.state_dir.mkdir(parents=True, exist_ok=True)
+    (ctx.state_dir / "clawbox-94.provisioned").mkdir()
+    (ctx.state_dir / "clawbox-x.provisioned").write_text("profile: standard\n", encoding="utf-8")
+    (ctx.state_dir / "clawbox-95.provisioned.tmp").write_text("profile: standard\n", encoding="utf-8")
+    (ctx.state_dir / "clawbox-96.provisioned").write_text("profile: standard\n", encoding="utf-8")
+
+    assert status_ops._candidate_vm_names(FakeTart([]), ctx) == ["clawbox-96"]
+
+
 def test_status_mount_paths_marker_missing_skips_remote_probe(tmp_path: Path) -> None:
     ctx = _context(tmp_path)
     paths, note = status_ops._status_mount_paths(None, ctx)
@@ -276,7 +362,9 @@ def test_status_mount_paths_marker_missing_skips_remote_probe(tmp_path: Path) ->
     assert note == "no marker found; skipping remote sync-path probe"
 
 
-def test_status_vm_no_marker_does_not_call_remote_probe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_status_vm_no_marker_does_not_call_remote_probe(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
     ctx = _context(tmp_path)
     tart = FakeTart([{"Name": "clawbox-91", "Running": True, "IP": "192.168.64.10"}])
     called = {"probe": 0}
@@ -286,27 +374,42 @@ def test_status_vm_no_marker_does_not_call_remote_probe(tmp_path: Path, monkeypa
         lambda *_args, **_kwargs: called.__setitem__("probe", called["probe"] + 1) or ("ok", {}),
     )
 
-    out = _capture(lambda: status_ops.status_vm(91, tart, as_json=False, context=ctx))
+    status_ops.status_vm(91, tart, as_json=False, context=ctx)
+    out = capsys.readouterr().out
     assert called["probe"] == 0
     assert "no marker found; skipping remote sync-path probe" in out
 
 
+def test_status_vm_missing_vm_skips_ip_and_probes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys, developer_marker_text: str
+) -> None:
+    ctx = _context(tmp_path)
+    ctx.state_dir.mkdir(parents=True, exist_ok=True)
+    (ctx.state_dir / "clawbox-91.provisioned").write_text(developer_marker_text, encoding="utf-8")
+
+    class MissingTart(FakeTart):
+        def ip(self, vm_name: str) -> str | None:
+            raise AssertionError("ip lookup for a missing VM")
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("remote probe for a missing VM")
+
+    monkeypatch.setattr(status_ops, "_sync_probe_credentials", fail)
+    monkeypatch.setattr(status_ops, "_probe_mutagen_sync", fail)
+
+    status_ops.status_vm(91, MissingTart([]), as_json=True, context=ctx)
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["exists"] is False
+    assert payload["provision_marker"]["present"] is True
+    assert payload["ip"] is None
+
+
 def test_status_vm_warns_when_mutagen_sessions_missing(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys, developer_marker_text: str
 ) -> None:
     ctx = _context(tmp_path)
     ctx.state_dir.mkdir(parents=True, exist_ok=True)
-    marker = ProvisionMarker(
-        vm_name="clawbox-91",
-        profile="developer",
-        playwright=False,
-        tailscale=False,
-        signal_cli=True,
-        signal_payload=True,
-        provisioned_at="2026-01-01T00:00:00Z",
-        sync_backend="mutagen",
-    )
-    marker.write(ctx.state_dir / "clawbox-91.provisioned")
+    (ctx.state_dir / "clawbox-91.provisioned").write_text(developer_marker_text, encoding="utf-8")
     ctx.secrets_file.parent.mkdir(parents=True, exist_ok=True)
     ctx.secrets_file.write_text("vm_password: admin\n", encoding="utf-8")
 
@@ -332,7 +435,8 @@ def test_status_vm_warns_when_mutagen_sessions_missing(
         lambda _vm_name: _mutagen_fixture("sync-list-no-sessions.txt"),
     )
 
-    out = _capture(lambda: status_ops.status_vm(91, tart, as_json=True, context=ctx))
+    status_ops.status_vm(91, tart, as_json=True, context=ctx)
+    out = capsys.readouterr().out
     payload = json.loads(out)
     assert payload["mutagen_sync"]["enabled"] is True
     assert payload["mutagen_sync"]["probe"] == "ok"
@@ -341,17 +445,18 @@ def test_status_vm_warns_when_mutagen_sessions_missing(
     assert any("no active Mutagen sessions were found" in warning for warning in payload["warnings"])
 
 
-def test_status_environment_json_no_vms(tmp_path: Path) -> None:
+def test_status_environment_json_no_vms(tmp_path: Path, capsys) -> None:
     ctx = _context(tmp_path)
     tart = FakeTart([])
-    out = _capture(lambda: status_ops.status_environment(tart, as_json=True, context=ctx))
+    status_ops.status_environment(tart, as_json=True, context=ctx)
+    out = capsys.readouterr().out
     payload = json.loads(out)
     assert payload["mode"] == "environment"
     assert payload["vm_count"] == 0
     assert payload["vms"] == []
 
 
-def test_status_environment_text_includes_vm_sections(tmp_path: Path) -> None:
+def test_status_environment_text_includes_vm_sections(tmp_path: Path, capsys) -> None:
     ctx = _context(tmp_path)
     ctx.state_dir.mkdir(parents=True, exist_ok=True)
     marker = ProvisionMarker(
@@ -365,7 +470,63 @@ def test_status_environment_text_includes_vm_sections(tmp_path: Path) -> None:
     )
     marker.write(ctx.state_dir / "clawbox-92.provisioned")
     tart = FakeTart([{"Name": "clawbox-92", "Running": False}])
-    out = _capture(lambda: status_ops.status_environment(tart, as_json=False, context=ctx))
+    status_ops.status_environment(tart, as_json=False, context=ctx)
+    out = capsys.readouterr().out
     assert "Clawbox environment:" in out
     assert "VM: clawbox-92" in out
     assert "vms discovered: 1" in out
+
+
+def test_status_environment_lists_tart_vms_once(tmp_path: Path, capsys) -> None:
+    class CountingTart(FakeTart):
+        def __init__(self, vms: list[dict[str, object]]):
+            super().__init__(vms)
+            self.list_calls = 0
+
+        def vms_by_name(self) -> dict[str, dict[str, object]]:
+            self.list_calls += 1
+            return super().vms_by_name()
+
+        def vm_exists(self, vm_name: str) -> bool:
+            raise AssertionError("status_environment should use the tart snapshot")
+
+        vm_running = vm_exists
+
+        def ip(self, vm_name: str) -> str | None:
+            return "192.168.64.10" if vm_name == "clawbox-91" else None
+
+    ctx = _context(tmp_path)
+    tart = CountingTart(
+        [
+            {"Name": "clawbox-91", "Running": True, "IP": "192.168.64.10"},
+            {"Name": "clawbox-92", "Running": False},
+        ]
+    )
+    status_ops.status_environment(tart, as_json=True, context=ctx)
+    out = capsys.readouterr().out
+    payload = json.loads(out)
+    assert tart.list_calls == 1
+    assert [(vm["vm"], vm["exists"], vm["running"]) for vm in payload["vms"]] == [
+        ("clawbox-91", True, True),
+        ("clawbox-92", True, False),
+    ]
+
+
+def test_status_environment_builds_vm_reports_concurrently(tmp_path: Path, capsys) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    class RendezvousTart(FakeTart):
+        def ip(self, vm_name: str) -> str | None:
+            barrier.wait()
+            return super().ip(vm_name)
+
+    ctx = _context(tmp_path)
+    tart = RendezvousTart(
+        [
+            {"Name": "clawbox-92", "Running": False},
+            {"Name": "clawbox-91", "Running": False},
+        ]
+    )
+    status_ops.status_environment(tart, as_json=True, context=ctx)
+    payload = json.loads(capsys.readouterr().out)
+    assert [vm["vm"] for vm in payload["vms"]] == ["clawbox-91", "clawbox-92"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -9,11 +10,12 @@ from clawbox import sync_events
 
 
 def _read_json_lines(path: Path) -> list[dict[str, object]]:
-    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    with path.open(encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
 
 
-def test_emit_sync_event_appends_structured_json(tmp_path: Path) -> None:
-    state_dir = tmp_path / "state"
+def test_emit_sync_event_appends_structured_json(ram_tmp_path: Path) -> None:
+    state_dir = ram_tmp_path / "state"
     sync_events.emit_sync_event(
         state_dir,
         "clawbox-91",
@@ -36,9 +38,9 @@ def test_emit_sync_event_appends_structured_json(tmp_path: Path) -> None:
 
 
 def test_emit_sync_event_rotates_when_size_limit_exceeded(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ram_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    state_dir = tmp_path / "state"
+    state_dir = ram_tmp_path / "state"
     log_dir = state_dir / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
     active = log_dir / "sync-events.jsonl"
@@ -62,3 +64,160 @@ def test_emit_sync_event_rotates_when_size_limit_exceeded(
     assert len(active_records) == 1
     assert active_records[0]["event"] == "teardown_ok"
 
+
+def test_emit_sync_events_appends_batch_in_order(tmp_path: Path) -> None:
+    state_dir = tmp_path / "state"
+    sync_events.emit_sync_events(
+        state_dir,
+        [
+            sync_events.SyncEvent("clawbox-91", "activate_ok", "orchestrator", "launch_vm", {"flush": False}),
+            sync_events.SyncEvent("clawbox-92", "teardown_ok", "watcher", "vm_not_running_confirmed"),
+        ],
+    )
+
+    records = _read_json_lines(state_dir / "logs" / "sync-events.jsonl")
+    assert [(record["vm"], record["event"]) for record in records] == [
+        ("clawbox-91", "activate_ok"),
+        ("clawbox-92", "teardown_ok"),
+    ]
+    assert records[0]["details"] == {"flush": False}
+    assert "details" not in records[1]
+
+
+def test_sync_event_batch_flushes_on_exit_with_single_rotation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    state_dir = tmp_path / "state"
+    log_dir = state_dir / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    active = log_dir / "sync-events.jsonl"
+    active.write_text("x" * 80, encoding="utf-8")
+    monkeypatch.setenv("CLAWBOX_SYNC_EVENT_LOG_MAX_BYTES", "64")
+
+    with sync_events.SyncEventBatch(state_dir) as batch:
+        for event in ("teardown_start", "teardown_ok"):
+            batch.emit("clawbox-91", event=event, actor="orchestrator", reason="down_vm")
+        assert active.read_text(encoding="utf-8") == "x" * 80
+
+    assert (log_dir / "sync-events.jsonl.1").read_text(encoding="utf-8") == "x" * 80
+    assert [record["event"] for record in _read_json_lines(active)] == ["teardown_start", "teardown_ok"]
+
+
+def test_emit_sync_event_writes_compact_ascii_json(tmp_path: Path) -> None:
+    state_dir = tmp_path / "state"
+    sync_events.emit_sync_event(
+        state_dir,
+        "clawbox-91",
+        event="teardown_error",
+        actor="watcher",
+        reason="vm_not_running_confirmed",
+        details={"error": "Zeitüberschreitung", "path": "/tmp/\udcff"},
+    )
+
+    path = state_dir / "logs" / "sync-events.jsonl"
+    raw = path.read_text(encoding="ascii")
+    assert '"details":{"error":"Zeit\\u00fcberschreitung","path":"/tmp/\\udcff"}' in raw
+    assert ", " not in raw
+    assert _read_json_lines(path)[0]["details"] == {"error": "Zeitüberschreitung", "path": "/tmp/\udcff"}
+
+
+def test_emit_sync_event_reuses_append_descriptor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state_dir = tmp_path / "state"
+    opened: list[str] = []
+    real_open = sync_events.os.open
+
+    def counting_open(path: object, *args: object) -> int:
+        opened.append(str(path))
+        return real_open(path, *args)
+
+    monkeypatch.setattr(sync_events.os, "open", counting_open)
+    for event in ("activate_start", "activate_ok", "teardown_ok"):
+        sync_events.emit_sync_event(state_dir, "clawbox-91", event=event, actor="orchestrator", reason="up")
+
+    path = state_dir / "logs" / "sync-events.jsonl"
+    assert opened == [str(path)]
+    events = [record["event"] for record in _read_json_lines(path)]
+    assert events == ["activate_start", "activate_ok", "teardown_ok"]
+
+
+def test_emit_sync_event_reopens_after_external_rotation(tmp_path: Path) -> None:
+    state_dir = tmp_path / "state"
+    path = state_dir / "logs" / "sync-events.jsonl"
+    sync_events.emit_sync_event(state_dir, "clawbox-91", event="activate_ok", actor="orchestrator", reason="up")
+    path.replace(path.with_name("sync-events.jsonl.1"))
+
+    sync_events.emit_sync_event(state_dir, "clawbox-91", event="teardown_ok", actor="watcher", reason="down_vm")
+
+    assert [record["event"] for record in _read_json_lines(path)] == ["teardown_ok"]
+
+
+def test_emit_sync_event_reopens_after_external_removal(tmp_path: Path) -> None:
+    state_dir = tmp_path / "state"
+    path = state_dir / "logs" / "sync-events.jsonl"
+    sync_events.emit_sync_event(state_dir, "clawbox-91", event="activate_ok", actor="orchestrator", reason="up")
+    path.unlink()
+
+    sync_events.emit_sync_event(state_dir, "clawbox-91", event="teardown_ok", actor="watcher", reason="down_vm")
+
+    assert [record["event"] for record in _read_json_lines(path)] == ["teardown_ok"]
+
+
+def test_close_active_logs_closes_cached_descriptors(tmp_path: Path) -> None:
+    state_dir = tmp_path / "state"
+    path = state_dir / "logs" / "sync-events.jsonl"
+    sync_events.emit_sync_event(state_dir, "clawbox-91", event="activate_ok", actor="orchestrator", reason="up")
+    fd = sync_events._active_logs[path].fd
+
+    sync_events._close_active_logs()
+
+    assert path not in sync_events._active_logs
+    with pytest.raises(OSError):
+        os.fstat(fd)
+
+
+@pytest.mark.parametrize(
+    "details",
+    [None, {}, {"flush": False, "error": 'quote " ü \udcff', "nested": {"b": 1, "a": None}}],
+)
+def test_encode_event_matches_sorted_compact_json(details: dict[str, object] | None) -> None:
+    sync_event = sync_events.SyncEvent(
+        "clawbox-91", "teardown_error", "watcher", "vm_not_running_confirmed", details
+    )
+    payload: dict[str, object] = {
+        "timestamp": "2026-01-01T00:00:00Z",
+        "vm": "clawbox-91",
+        "event": "teardown_error",
+        "actor": "watcher",
+        "reason": "vm_not_running_confirmed",
+    }
+    if details:
+        payload["details"] = details
+    expected = json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n"
+
+    encoded = sync_events._encode_event(sync_event, b'"2026-01-01T00:00:00Z"')
+
+    assert encoded == expected.encode("utf-8")
+
+
+def test_emit_sync_events_gathers_batch_into_one_writev(
+    ram_tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if not hasattr(sync_events.os, "writev"):
+        pytest.skip("os.writev is not available on this platform")
+    state_dir = ram_tmp_path / "state"
+    gathered: list[int] = []
+    real_writev = sync_events.os.writev
+
+    def recording_writev(fd: int, buffers: list[bytes]) -> int:
+        gathered.append(len(buffers))
+        return real_writev(fd, buffers)
+
+    monkeypatch.setattr(sync_events.os, "writev", recording_writev)
+    sync_events.emit_sync_events(
+        state_dir,
+        [sync_events.SyncEvent("clawbox-91", event, "orchestrator", "up") for event in ("a", "b", "c")],
+    )
+
+    assert gathered == [3]
+    records = _read_json_lines(state_dir / "logs" / "sync-events.jsonl")
+    assert [record["event"] for record in records] == ["a", "b", "c"]
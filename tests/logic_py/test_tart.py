@@ -88,6 +88,83 @@ def test_vm_exists_and_running(monkeypatch: pytest.MonkeyPatch):
     assert client.vm_running("clawbox-92") is False
 
 
+def test_vms_by_name_indexes_one_listing(monkeypatch: pytest.MonkeyPatch):
+    client = TartClient()
+    calls: list[int] = []
+    vms = [
+        {"Name": "clawbox-91", "Running": True},
+        {"Name": "clawbox-91", "Running": False},
+        {"Running": True},
+        {"Name": "clawbox-92", "Running": "yes"},
+    ]
+    monkeypatch.setattr(client, "list_vms_json", lambda: calls.append(1) or vms)
+
+    by_name = client.vms_by_name()
+    assert list(by_name) == ["clawbox-91", "clawbox-92"]
+    assert by_name["clawbox-91"]["Running"] is True
+    assert len(calls) == 1
+    assert client.vm_running("clawbox-92") is False
+
+
+def test_list_vms_json_reuses_recent_listing_until_mutation(monkeypatch: pytest.MonkeyPatch):
+    client = TartClient()
+    calls: list[list[str]] = []
+    now = [100.0]
+    monkeypatch.setattr(tart_mod.time, "monotonic", lambda: now[0])
+
+    def fake_run(args, **kwargs):
+        calls.append(list(args))
+        return _cp(args=args, stdout=json.dumps([{"Name": "clawbox-91", "Running": True}]))
+
+    monkeypatch.setattr(client, "_run", fake_run)
+    assert client.vm_exists("clawbox-91") is True
+    assert client.vm_running("clawbox-91") is True
+    assert len(calls) == 1
+
+    now[0] += 0.3
+    client.vm_running("clawbox-91")
+    assert len(calls) == 2
+
+    client.stop("clawbox-91")
+    client.vm_running("clawbox-91")
+    assert calls[-2:] == [["tart", "stop", "clawbox-91"], ["tart", "list", "--format", "json"]]
+
+
+def test_list_vms_json_does_not_cache_listing_raced_by_mutation(monkeypatch: pytest.MonkeyPatch):
+    client = TartClient()
+    listings: list[int] = []
+
+    def fake_run(args, **kwargs):
+        if args[1] == "list":
+            listings.append(1)
+            if len(listings) == 1:
+                client._invalidate_list_cache()
+            return _cp(args=args, stdout=json.dumps([{"Name": "clawbox-91", "Running": False}]))
+        return _cp(args=args)
+
+    monkeypatch.setattr(client, "_run", fake_run)
+    first = client.vms_by_name()
+    assert client.vms_by_name() == first
+    assert client.vms_by_name() is client.vms_by_name()
+    assert len(listings) == 2
+
+
+def test_cached_listing_is_read_only(monkeypatch: pytest.MonkeyPatch):
+    client = TartClient()
+    listing = json.dumps([{"Name": "clawbox-91", "Running": True}])
+    monkeypatch.setattr(client, "_run", lambda args, **_kwargs: _cp(args=args, stdout=listing))
+
+    with pytest.raises(TypeError):
+        client.list_vms_json()[0]["Running"] = False
+    with pytest.raises(TypeError):
+        client.vms_by_name()["clawbox-92"] = {}
+    with pytest.raises(AttributeError):
+        client.list_vms_json().append({"Name": "clawbox-92"})
+
+    assert client.vm_running("clawbox-91") is True
+    assert list(client.vms_by_name()) == ["clawbox-91"]
+
+
 def test_ip_uses_agent_then_default(monkeypatch: pytest.MonkeyPatch):
     client = TartClient()
     calls: list[list[str]] = []
@@ -110,6 +187,31 @@ def test_ip_returns_none_when_all_resolvers_fail(monkeypatch: pytest.MonkeyPatch
     assert client.ip("clawbox-91") is None
 
 
+def test_vm_pid_matches_single_tart_run_process(monkeypatch: pytest.MonkeyPatch):
+    client = TartClient()
+    calls: list[list[str]] = []
+    outputs = iter(
+        [
+            _cp(args=["pgrep"], stdout="4321\n"),
+            _cp(args=["pgrep"], stdout="1\n2\n"),
+            _cp(args=["pgrep"], rc=1),
+        ]
+    )
+
+    def fake_run(args, **kwargs):
+        calls.append(list(args))
+        return next(outputs)
+
+    monkeypatch.setattr(client, "_run", fake_run)
+    assert client.vm_pid("clawbox-91") == 4321
+    assert calls[0] == ["pgrep", "-f", "(^|/)tart run clawbox-91( |$)"]
+    assert client.vm_pid("clawbox-91") is None
+    assert client.vm_pid("clawbox-91") is None
+
+    monkeypatch.setattr(client, "_run", lambda *args, **kwargs: (_ for _ in ()).throw(TartError("no pgrep")))
+    assert client.vm_pid("clawbox-91") is None
+
+
 def test_run_in_background_starts_tart(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     client = TartClient()
 
@@ -154,3 +256,18 @@ def test_wait_for_vm_running_success_and_timeout(monkeypatch: pytest.MonkeyPatch
             return False
 
     assert wait_for_vm_running(AlwaysOffTart(), "clawbox-91", timeout_seconds=1, poll_seconds=1) is False
+
+
+def test_poll_with_backoff_grows_interval_and_respects_timeout(monkeypatch: pytest.MonkeyPatch):
+    delays: list[float] = []
+    monkeypatch.setattr(tart_mod.time, "sleep", delays.append)
+
+    assert tart_mod.poll_with_backoff(lambda: False, 3, max_interval=1.0) is False
+    assert delays[:3] == pytest.approx([0.5, 0.8, 1.0])
+    assert max(delays) == 1.0
+    assert sum(delays) == pytest.approx(3)
+
+    delays.clear()
+    calls = iter([False, False, True])
+    assert tart_mod.poll_with_backoff(lambda: next(calls), 60) is True
+    assert delays == pytest.approx([0.5, 0.8])
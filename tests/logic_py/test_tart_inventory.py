@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -9,6 +11,7 @@ import pytest
 from clawbox.tart import TartError
 
 
+@lru_cache(maxsize=1)
 def _load_inventory_module():
     module_path = Path(__file__).resolve().parents[2] / "ansible" / "inventory" / "tart_inventory.py"
     spec = importlib.util.spec_from_file_location("tart_inventory_test_module", module_path)
@@ -49,6 +52,52 @@ def test_build_inventory_uses_tart_client_data():
     assert inventory["_meta"]["hostvars"]["clawbox-91"]["vm_number"] == 91
 
 
+def test_build_inventory_resolves_ips_concurrently_in_listing_order():
+    inventory_mod = _load_inventory_module()
+    barrier = threading.Barrier(2, timeout=5)
+
+    class ConcurrentIpTart(FakeTart):
+        def ip(self, vm_name: str):
+            barrier.wait()
+            return super().ip(vm_name)
+
+    tart = ConcurrentIpTart(
+        vm_rows=[{"Name": "clawbox-93", "Running": True}, {"Name": "clawbox-91", "Running": True}],
+        ip_map={"clawbox-91": "192.168.64.10", "clawbox-93": "192.168.64.12"},
+    )
+
+    inventory = inventory_mod.build_inventory(tart=tart)
+
+    assert inventory["all"]["hosts"] == ["clawbox-93", "clawbox-91"]
+    assert inventory["_meta"]["hostvars"]["clawbox-93"] == {"ansible_host": "192.168.64.12", "vm_number": 93}
+
+
+def test_build_inventory_resolves_each_running_vm_ip_once():
+    inventory_mod = _load_inventory_module()
+    looked_up: list[str] = []
+
+    class RecordingTart(FakeTart):
+        def ip(self, vm_name: str):
+            looked_up.append(vm_name)
+            return super().ip(vm_name)
+
+    tart = RecordingTart(
+        vm_rows=[
+            {"Name": "clawbox-91", "Running": True},
+            {"Name": "clawbox-92", "Running": False},
+            {"Name": "clawbox-93", "Running": True},
+            {"Name": "clawbox-94", "Running": True},
+            {"Name": "other-vm", "Running": True},
+        ],
+        ip_map={"clawbox-91": "192.168.64.10", "clawbox-94": "192.168.64.13"},
+    )
+
+    inventory = inventory_mod.build_inventory(tart=tart)
+
+    assert sorted(looked_up) == ["clawbox-91", "clawbox-93", "clawbox-94"]
+    assert inventory["all"]["hosts"] == ["clawbox-91", "clawbox-94"]
+
+
 def test_get_tart_vms_handles_tart_error():
     inventory_mod = _load_inventory_module()
 
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
 import ast
+import bisect
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
 
-RESERVED_TEST_VM_NUMBERS = set(range(90, 100))
+
+RESERVED_TEST_VM_NUMBERS = frozenset(range(90, 100))
 TESTS_DIR = Path(__file__).resolve().parents[1]
 VM_NAME_RE = re.compile(r"clawbox-(\d+)(?!\.\d)")
-VM_NUMBER_KEYWORDS = {
+VM_NUMBER_KEYWORDS = frozenset({
     "vm_number",
     "number",
     "number_final",
     "standard_vm_number",
     "developer_vm_number",
     "optional_vm_number",
-}
-VM_NUMBER_CALLS = {
+})
+VM_NUMBER_CALLS = frozenset({
     "create_vm",
     "launch_vm",
     "provision_vm",
@@ -27,22 +32,47 @@ VM_NUMBER_CALLS = {
     "ip_vm",
     "status_vm",
     "vm_name_for",
-}
+})
 VM_NUMBER_ENV_SUFFIX = "_VM_NUMBER"
-
-
-def _line_number(text: str, offset: int) -> int:
-    return text.count("\n", 0, offset) + 1
+VM_NAME_PREFIX = "clawbox-"
+
+
+def _line_starts(text: str) -> list[int]:
+    starts = [0]
+    newline = text.find("\n")
+    while newline != -1:
+        starts.append(newline + 1)
+        newline = text.find("\n", newline + 1)
+    return starts
+
+
+def _iter_vm_name_literals(text: str) -> Iterator[tuple[int, str]]:
+    # Literal search plus a digit walk; yields exactly what VM_NAME_RE.finditer matches, including its
+    # backtracking on version-like suffixes such as "12.3".
+    digits_start = len(VM_NAME_PREFIX)
+    start = text.find(VM_NAME_PREFIX)
+    while start != -1:
+        end = start + digits_start
+        while end < len(text) and text[end].isdecimal():
+            end += 1
+        if end + 1 < len(text) and text[end] == "." and text[end + 1].isdecimal():
+            end -= 1
+        if end > start + digits_start:
+            yield start, text[start:end]
+        start = text.find(VM_NAME_PREFIX, start + digits_start)
 
 
 def _scan_vm_name_literals(path: Path, text: str) -> list[str]:
     violations: list[str] = []
-    for match in VM_NAME_RE.finditer(text):
-        vm_number = int(match.group(1))
+    line_starts: list[int] | None = None
+    for start, vm_name in _iter_vm_name_literals(text):
+        vm_number = int(vm_name[len(VM_NAME_PREFIX):])
         if vm_number in RESERVED_TEST_VM_NUMBERS:
             continue
-        line = _line_number(text, match.start())
-        violations.append(f"{path}:{line} uses non-reserved VM name '{match.group(0)}'")
+        if line_starts is None:
+            line_starts = _line_starts(text)
+        line = bisect.bisect_right(line_starts, start)
+        violations.append(f"{path}:{line} uses non-reserved VM name '{vm_name}'")
     return violations
 
 
@@ -54,75 +84,126 @@ def _call_name(node: ast.Call) -> str | None:
     return None
 
 
-def _scan_vm_number_constants(path: Path, tree: ast.AST) -> list[str]:
+def _scan_keyword_constants(path: Path, node: ast.Call) -> list[str]:
     violations: list[str] = []
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call):
-            continue
-
-        for keyword in node.keywords:
-            if keyword.arg not in VM_NUMBER_KEYWORDS:
-                continue
-            if not isinstance(keyword.value, ast.Constant) or not isinstance(keyword.value.value, int):
-                continue
-            vm_number = keyword.value.value
-            if vm_number in RESERVED_TEST_VM_NUMBERS:
-                continue
-            violations.append(
-                f"{path}:{keyword.value.lineno} uses non-reserved {keyword.arg}={vm_number}"
-            )
-
-        call_name = _call_name(node)
-        if call_name not in VM_NUMBER_CALLS:
-            continue
-        if not node.args:
+    for keyword in node.keywords:
+        if keyword.arg not in VM_NUMBER_KEYWORDS:
             continue
-        first_arg = node.args[0]
-        if not isinstance(first_arg, ast.Constant) or not isinstance(first_arg.value, int):
+        if not isinstance(keyword.value, ast.Constant) or not isinstance(keyword.value.value, int):
             continue
-        vm_number = first_arg.value
+        vm_number = keyword.value.value
         if vm_number in RESERVED_TEST_VM_NUMBERS:
             continue
-        violations.append(f"{path}:{first_arg.lineno} calls {call_name} with non-reserved VM number {vm_number}")
-
+        violations.append(f"{path}:{keyword.value.lineno} uses non-reserved {keyword.arg}={vm_number}")
     return violations
 
 
-def _scan_vm_env_defaults(path: Path, tree: ast.AST) -> list[str]:
-    violations: list[str] = []
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call):
-            continue
+def _scan_call_argument(path: Path, node: ast.Call, call_name: str | None) -> str | None:
+    if call_name not in VM_NUMBER_CALLS or not node.args:
+        return None
+    first_arg = node.args[0]
+    if not isinstance(first_arg, ast.Constant) or not isinstance(first_arg.value, int):
+        return None
+    vm_number = first_arg.value
+    if vm_number in RESERVED_TEST_VM_NUMBERS:
+        return None
+    return f"{path}:{first_arg.lineno} calls {call_name} with non-reserved VM number {vm_number}"
+
+
+def _scan_env_default(path: Path, node: ast.Call, call_name: str | None) -> str | None:
+    if call_name != "vm_i" or len(node.args) < 2:
+        return None
+    env_name_node = node.args[0]
+    default_node = node.args[1]
+    if not isinstance(env_name_node, ast.Constant) or not isinstance(env_name_node.value, str):
+        return None
+    if not env_name_node.value.endswith(VM_NUMBER_ENV_SUFFIX):
+        return None
+    if not isinstance(default_node, ast.Constant) or not isinstance(default_node.value, int):
+        return None
+    vm_number = default_node.value
+    if vm_number in RESERVED_TEST_VM_NUMBERS:
+        return None
+    return f"{path}:{default_node.lineno} uses non-reserved default for {env_name_node.value}: {vm_number}"
+
+
+class _VmNumberVisitor(ast.NodeVisitor):
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.violations: list[str] = []
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self.violations.extend(_scan_keyword_constants(self.path, node))
         call_name = _call_name(node)
-        if call_name != "vm_i":
-            continue
-        if len(node.args) < 2:
-            continue
-        env_name_node = node.args[0]
-        default_node = node.args[1]
-        if not isinstance(env_name_node, ast.Constant) or not isinstance(env_name_node.value, str):
-            continue
-        if not env_name_node.value.endswith(VM_NUMBER_ENV_SUFFIX):
-            continue
-        if not isinstance(default_node, ast.Constant) or not isinstance(default_node.value, int):
-            continue
-        vm_number = default_node.value
-        if vm_number in RESERVED_TEST_VM_NUMBERS:
-            continue
-        violations.append(
-            f"{path}:{default_node.lineno} uses non-reserved default for {env_name_node.value}: {vm_number}"
-        )
+        for violation in (
+            _scan_call_argument(self.path, node, call_name),
+            _scan_env_default(self.path, node, call_name),
+        ):
+            if violation is not None:
+                self.violations.append(violation)
+        self.generic_visit(node)
+
+
+def _scan_ast(path: Path, tree: ast.AST) -> list[str]:
+    visitor = _VmNumberVisitor(path)
+    visitor.visit(tree)
+    return visitor.violations
+
+
+def _parse_source(source: bytes, filename: str) -> ast.AST:
+    return compile(source, filename, "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+
+
+def _scan_one(path_str: str) -> list[str]:
+    path = Path(path_str)
+    source = path.read_bytes()
+    text = source.decode("utf-8")
+    violations = _scan_vm_name_literals(path, text) if VM_NAME_PREFIX in text else []
+    violations.extend(_scan_ast(path, _parse_source(source, path_str)))
     return violations
 
 
+def _iter_py_files(root: Path) -> Iterator[str]:
+    pending = [str(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+
+
 def test_all_tests_use_reserved_vm_numbers_only() -> None:
     violations: list[str] = []
-    for path in sorted(TESTS_DIR.rglob("*.py")):
-        text = path.read_text(encoding="utf-8")
-        tree = ast.parse(text, filename=str(path))
-        violations.extend(_scan_vm_name_literals(path, text))
-        violations.extend(_scan_vm_number_constants(path, tree))
-        violations.extend(_scan_vm_env_defaults(path, tree))
+    for path_str in sorted(_iter_py_files(TESTS_DIR)):
+        violations.extend(_scan_one(path_str))
 
     assert not violations, "VM number policy violations:\n" + "\n".join(violations)
+
+
+def test_scan_vm_name_literals_reports_line_numbers() -> None:
+    name = VM_NAME_PREFIX
+    text = f'a = "{name}91"\n\nb = "{name}12"\nc = "{name}7" + "{name}3"\n"{name}1"'
+
+    assert _scan_vm_name_literals(Path("p.py"), text) == [
+        f"p.py:3 uses non-reserved VM name '{name}12'",
+        f"p.py:4 uses non-reserved VM name '{name}7'",
+        f"p.py:4 uses non-reserved VM name '{name}3'",
+        f"p.py:5 uses non-reserved VM name '{name}1'",
+    ]
+
+
+@pytest.mark.parametrize(
+    "suffix",
+    ["91", "12", "7.", "1.2.3", "12.3", "93.x", "", "-91", "٣", "99\n", "9" * 30],
+)
+def test_iter_vm_name_literals_matches_vm_name_regex(suffix: str) -> None:
+    text = f"x {VM_NAME_PREFIX}{suffix} {VM_NAME_PREFIX}{VM_NAME_PREFIX}{suffix}"
+
+    expected = [(match.start(), match.group(0)) for match in VM_NAME_RE.finditer(text)]
+    assert list(_iter_vm_name_literals(text)) == expected
+
+
+def test_iter_py_files_matches_rglob() -> None:
+    assert sorted(_iter_py_files(TESTS_DIR)) == sorted(str(path) for path in TESTS_DIR.rglob("*.py"))
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import signal
+import sys
 from pathlib import Path
 
 import pytest
@@ -32,13 +34,16 @@ def _read_json(path: Path) -> dict[str, object]:
 def test_start_vm_watcher_launches_and_writes_record(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
+    probed: list[int] = []
     monkeypatch.setattr(watcher_mod.subprocess, "Popen", lambda *_args, **_kwargs: _Proc(pid=4242))
-    monkeypatch.setattr(watcher_mod.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(watcher_mod, "_child_exited_fast", lambda pid: probed.append(pid) or False)
     pid = watcher_mod.start_vm_watcher(tmp_path, "clawbox-91", poll_seconds=3)
+    assert probed == [4242]
     assert pid == 4242
     record = _read_json(_record_path(tmp_path, "clawbox-91"))
     assert record["pid"] == 4242
     assert record["poll_seconds"] == 3
+    assert record["parent_pid"] == watcher_mod.os.getpid()
 
 
 def test_start_vm_watcher_reuses_live_existing_record(
@@ -98,6 +103,7 @@ def test_stop_vm_watcher_signals_and_removes_record(
         running_checks["count"] += 1
         return running_checks["count"] == 1
 
+    monkeypatch.setattr(watcher_mod, "_HAS_PIDFD", False)
     monkeypatch.setattr(watcher_mod, "_pid_running", _pid_running)
     monkeypatch.setattr(watcher_mod, "_is_watcher_pid", lambda _pid, _vm_name: True)
     monkeypatch.setattr(watcher_mod, "_signal_watcher_pid", lambda _pid, sig: signals.append(sig))
@@ -109,6 +115,45 @@ def test_stop_vm_watcher_signals_and_removes_record(
     assert not record_file.exists()
 
 
+def test_stop_vm_watcher_reaps_own_child_with_waitpid(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    record_file = _record_path(tmp_path, "clawbox-91")
+    record_file.parent.mkdir(parents=True, exist_ok=True)
+    record_file.write_text(
+        json.dumps(
+            {
+                "vm_name": "clawbox-91",
+                "pid": 7777,
+                "poll_seconds": 2,
+                "started_at": "2026-01-01T00:00:00Z",
+                "parent_pid": watcher_mod.os.getpid(),
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    signals: list[signal.Signals] = []
+    waited: list[tuple[int, int]] = []
+    outcomes = iter([(0, 0), (7777, 0)])
+
+    def fake_waitpid(pid: int, options: int) -> tuple[int, int]:
+        waited.append((pid, options))
+        return next(outcomes)
+
+    monkeypatch.setattr(watcher_mod, "_HAS_PIDFD", False)
+    monkeypatch.setattr(watcher_mod.os, "waitpid", fake_waitpid)
+    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: pytest.fail("_pid_running called"))
+    monkeypatch.setattr(watcher_mod, "_is_watcher_pid", lambda _pid, _vm_name: True)
+    monkeypatch.setattr(watcher_mod, "_signal_watcher_pid", lambda _pid, sig: signals.append(sig))
+    monkeypatch.setattr(watcher_mod.time, "sleep", lambda *_args, **_kwargs: None)
+
+    assert watcher_mod.stop_vm_watcher(tmp_path, "clawbox-91") is True
+    assert signals == [signal.SIGTERM]
+    assert waited == [(7777, watcher_mod.os.WNOHANG), (7777, watcher_mod.os.WNOHANG)]
+    assert not record_file.exists()
+
+
 def test_reconcile_vm_watchers_stops_dead_vm_watchers(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -134,7 +179,7 @@ def test_reconcile_vm_watchers_stops_dead_vm_watchers(
 
     stopped: list[str] = []
     cleaned: list[str] = []
-    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: True)
+    monkeypatch.setattr(watcher_mod, "_live_pids", lambda: frozenset({3333}))
     monkeypatch.setattr(watcher_mod, "stop_vm_watcher", lambda _state_dir, name: stopped.append(name) or True)
     monkeypatch.setattr(watcher_mod, "cleanup_locks_for_vm", lambda name: cleaned.append(name))
 
@@ -166,6 +211,9 @@ def test_run_vm_watcher_loop_cleans_locks_and_removes_own_record(
         def __init__(self):
             self.calls = 0
 
+        def vm_pid(self, _vm_name: str) -> int | None:
+            return None
+
         def vm_running(self, _vm_name: str) -> bool:
             self.calls += 1
             return self.calls == 1
@@ -198,9 +246,90 @@ def test_read_record_invalid_payloads_return_none(tmp_path: Path) -> None:
     assert watcher_mod._read_record(record_file) is None
 
 
+def test_write_record_round_trips_through_bytes(tmp_path: Path) -> None:
+    record = watcher_mod.WatcherRecord(
+        vm_name="clawbox-91",
+        pid=4242,
+        poll_seconds=2,
+        started_at="2026-01-01T00:00:00Z",
+        parent_pid=77,
+    )
+
+    watcher_mod._write_record(tmp_path, record)
+
+    raw = _record_path(tmp_path, "clawbox-91").read_bytes()
+    assert raw.endswith(b"}\n")
+    assert watcher_mod._read_record(_record_path(tmp_path, "clawbox-91")) == record
+    assert list(json.loads(raw)) == sorted(json.loads(raw))
+
+
+def test_write_record_creates_watchers_dir_once_and_recovers_if_removed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(watcher_mod, "_ENSURED_DIRS", set())
+    created: list[Path] = []
+    real_mkdir = Path.mkdir
+
+    def recording_mkdir(self: Path, *args, **kwargs) -> None:
+        created.append(self)
+        real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+    record = watcher_mod.WatcherRecord(
+        vm_name="clawbox-91", pid=4242, poll_seconds=2, started_at="2026-01-01T00:00:00Z"
+    )
+
+    watcher_mod._write_record(tmp_path, record)
+    watcher_mod._write_record(tmp_path, record)
+    assert created == [tmp_path / "watchers"]
+
+    _record_path(tmp_path, "clawbox-91").unlink()
+    (tmp_path / "watchers").rmdir()
+    watcher_mod._write_record(tmp_path, record)
+    assert created == [tmp_path / "watchers", tmp_path / "watchers"]
+    assert watcher_mod._read_record(_record_path(tmp_path, "clawbox-91")) == record
+
+
+@pytest.mark.parametrize("has_tmpfile", [True, False])
+def test_atomic_write_bytes_replaces_record_without_leftovers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, has_tmpfile: bool
+) -> None:
+    monkeypatch.setattr(watcher_mod, "_HAS_O_TMPFILE", has_tmpfile and watcher_mod._HAS_O_TMPFILE)
+    target = tmp_path / "records" / "record.json"
+    target.parent.mkdir()
+
+    watcher_mod._atomic_write_bytes(target, b"first\n")
+    watcher_mod._atomic_write_bytes(target, b"second\n")
+
+    assert target.read_bytes() == b"second\n"
+    assert [path.name for path in target.parent.iterdir()] == ["record.json"]
+
+
+@pytest.mark.skipif(not watcher_mod._HAS_O_TMPFILE, reason="O_TMPFILE is Linux-only")
+def test_atomic_write_bytes_closes_tmpfile_when_link_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    linked_fds: list[int] = []
+
+    def failing_link(fd: int, _path: Path) -> None:
+        linked_fds.append(fd)
+        raise OSError("link failed")
+
+    monkeypatch.setattr(watcher_mod, "_link_tmpfile", failing_link)
+
+    with pytest.raises(OSError, match="link failed"):
+        watcher_mod._atomic_write_bytes(tmp_path / "record.json", b"payload\n")
+    assert len(linked_fds) == 1
+    with pytest.raises(OSError):
+        os.fstat(linked_fds[0])
+    assert not (tmp_path / "record.json").exists()
+
+
 def test_pid_running_branches(monkeypatch: pytest.MonkeyPatch) -> None:
     assert watcher_mod._pid_running(0) is False
 
+    monkeypatch.setattr(watcher_mod, "_USE_PROCFS", False)
+
     monkeypatch.setattr(watcher_mod.os, "kill", lambda *_args, **_kwargs: (_ for _ in ()).throw(ProcessLookupError()))
     assert watcher_mod._pid_running(1234) is False
 
@@ -211,11 +340,32 @@ def test_pid_running_branches(monkeypatch: pytest.MonkeyPatch) -> None:
     assert watcher_mod._pid_running(1234) is False
 
 
+def test_pid_running_prefers_procfs_on_linux(monkeypatch: pytest.MonkeyPatch) -> None:
+    stat_paths: list[str] = []
+    present = {"/proc/1234"}
+
+    def fake_stat(path: str):
+        stat_paths.append(path)
+        if path not in present:
+            raise FileNotFoundError(path)
+        return object()
+
+    monkeypatch.setattr(watcher_mod, "_USE_PROCFS", True)
+    monkeypatch.setattr(watcher_mod.os, "stat", fake_stat)
+    monkeypatch.setattr(watcher_mod.os, "kill", lambda *_args: pytest.fail("os.kill called"))
+
+    assert watcher_mod._pid_running(1234) is True
+    assert watcher_mod._pid_running(4321) is False
+    assert watcher_mod._pid_running(0) is False
+    assert stat_paths == ["/proc/1234", "/proc/4321"]
+
+
 def test_pid_cmdline_and_is_watcher_pid_fallbacks(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: False)
     assert watcher_mod._pid_cmdline(101) == ""
 
     monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: True)
+    monkeypatch.setattr(watcher_mod, "_read_cmdline_proc", lambda _pid: None)
     monkeypatch.setattr(
         watcher_mod.subprocess,
         "run",
@@ -223,6 +373,33 @@ def test_pid_cmdline_and_is_watcher_pid_fallbacks(monkeypatch: pytest.MonkeyPatc
     )
     assert watcher_mod._pid_cmdline(101) == ""
 
+    monkeypatch.setattr(watcher_mod, "_CMDLINE_CACHE", {})
+    monkeypatch.setattr(watcher_mod, "_proc_start_ticks", lambda _pid: 424242)
+    ps_calls: list[list[str]] = []
+
+    def fake_ps(args, **_kwargs):
+        ps_calls.append(list(args))
+        return subprocess.CompletedProcess(args, 0, stdout="python -m clawbox.main _watch-vm clawbox-91\n")
+
+    monkeypatch.setattr(watcher_mod.subprocess, "run", fake_ps)
+    assert watcher_mod._pid_cmdline(101) == "python -m clawbox.main _watch-vm clawbox-91"
+    assert watcher_mod._pid_cmdline(101) == "python -m clawbox.main _watch-vm clawbox-91"
+    assert len(ps_calls) == 1
+
+    monkeypatch.setattr(watcher_mod, "_proc_start_ticks", lambda _pid: 434343)
+    watcher_mod._pid_cmdline(101)
+    assert len(ps_calls) == 2
+
+    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: False)
+    assert watcher_mod._pid_cmdline(101) == ""
+    assert watcher_mod._CMDLINE_CACHE == {}
+
+    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: True)
+    monkeypatch.setattr(watcher_mod, "_CMDLINE_CACHE_MAX_ENTRIES", 2)
+    for pid in (201, 202, 203):
+        watcher_mod._pid_cmdline(pid)
+    assert list(watcher_mod._CMDLINE_CACHE) == [(202, 434343), (203, 434343)]
+
     monkeypatch.setattr(
         watcher_mod,
         "_pid_cmdline",
@@ -231,6 +408,71 @@ def test_pid_cmdline_and_is_watcher_pid_fallbacks(monkeypatch: pytest.MonkeyPatc
     assert watcher_mod._is_watcher_pid(101, "clawbox-91") is True
 
 
+def test_pid_cmdline_prefers_proc_cmdline(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: True)
+    monkeypatch.setattr(
+        watcher_mod,
+        "_read_cmdline_proc",
+        lambda _pid: "/usr/bin/python3 -m clawbox.main _watch-vm clawbox-91 --poll-seconds 2",
+    )
+    monkeypatch.setattr(
+        watcher_mod.subprocess,
+        "run",
+        lambda *_args, **_kwargs: pytest.fail("ps should not run when /proc cmdline is readable"),
+    )
+
+    assert watcher_mod._is_watcher_pid(101, "clawbox-91") is True
+    assert watcher_mod._is_watcher_pid(101, "clawbox-92") is False
+
+
+@pytest.mark.skipif(not Path("/proc/self/cmdline").exists(), reason="requires /proc")
+def test_read_cmdline_proc_reads_own_process() -> None:
+    cmdline = watcher_mod._read_cmdline_proc(watcher_mod.os.getpid())
+    assert cmdline
+    assert "\x00" not in cmdline
+    assert isinstance(watcher_mod._proc_start_ticks(watcher_mod.os.getpid()), int)
+
+
+def test_reconcile_vm_watchers_uses_proc_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for vm_name, pid in (("clawbox-91", 4101), ("clawbox-92", 4102)):
+        record_file = _record_path(tmp_path, vm_name)
+        record_file.parent.mkdir(parents=True, exist_ok=True)
+        record_file.write_text(
+            json.dumps({"vm_name": vm_name, "pid": pid, "poll_seconds": 2, "started_at": "2026-01-01T00:00:00Z"})
+            + "\n",
+            encoding="utf-8",
+        )
+
+    class _Tart:
+        def vm_running(self, vm_name: str) -> bool:
+            return vm_name == "clawbox-91"
+
+    listed: list[str] = []
+    real_listdir = watcher_mod.os.listdir
+
+    def fake_listdir(path: str):
+        if path == "/proc":
+            listed.append(path)
+            return ["1", "self", "4101", "net"]
+        return real_listdir(path)
+
+    monkeypatch.setattr(watcher_mod.os, "listdir", fake_listdir)
+    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: pytest.fail("_pid_running called"))
+    monkeypatch.setattr(watcher_mod, "_CMDLINE_CACHE", {(4101, 7): "watcher 91", (4102, 7): "watcher 92"})
+    cleaned: list[str] = []
+    monkeypatch.setattr(watcher_mod, "cleanup_locks_for_vm", lambda name: cleaned.append(name))
+
+    watcher_mod.reconcile_vm_watchers(_Tart(), tmp_path)
+
+    assert listed == ["/proc"]
+    assert list(watcher_mod._CMDLINE_CACHE) == [(4101, 7)]
+    assert cleaned == ["clawbox-92"]
+    assert _record_path(tmp_path, "clawbox-91").exists()
+    assert not _record_path(tmp_path, "clawbox-92").exists()
+
+
 def test_signal_watcher_pid_error_branches(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(watcher_mod.os, "getpgid", lambda _pid: (_ for _ in ()).throw(ProcessLookupError()))
     watcher_mod._signal_watcher_pid(1234, signal.SIGTERM)
@@ -270,13 +512,32 @@ def test_start_vm_watcher_surfaces_early_exit_tail(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     monkeypatch.setattr(watcher_mod.subprocess, "Popen", lambda *_args, **_kwargs: _Proc(pid=55, poll_value=1))
-    monkeypatch.setattr(watcher_mod.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(watcher_mod.os, "waitid", lambda *_args: (55, 1))
+    monkeypatch.setattr(watcher_mod.time, "sleep", lambda *_args: pytest.fail("slept after early exit"))
     monkeypatch.setattr(watcher_mod, "tail_lines", lambda *_args, **_kwargs: "watcher failed")
 
     with pytest.raises(watcher_mod.WatcherError, match="watcher failed to start"):
         watcher_mod.start_vm_watcher(tmp_path, "clawbox-91")
 
 
+@pytest.mark.skipif(not hasattr(watcher_mod.os, "waitid"), reason="os.waitid is unavailable")
+def test_child_exited_fast_detects_exit_without_reaping() -> None:
+    child = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+    try:
+        assert watcher_mod._child_exited_fast(child.pid, budget_seconds=5) is True
+        assert child.poll() == 3
+    finally:
+        child.kill()
+        child.wait()
+
+    sleeper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        assert watcher_mod._child_exited_fast(sleeper.pid, budget_seconds=0.05) is False
+    finally:
+        sleeper.kill()
+        sleeper.wait()
+
+
 def test_stop_vm_watcher_no_record_returns_false(tmp_path: Path) -> None:
     assert watcher_mod.stop_vm_watcher(tmp_path, "clawbox-99") is False
 
@@ -299,13 +560,91 @@ def test_stop_vm_watcher_escalates_to_sigkill(
         encoding="utf-8",
     )
     seen_signals: list[signal.Signals] = []
-    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: True)
+    waits: list[tuple[int, float]] = []
+    pid_running_calls: list[int] = []
     monkeypatch.setattr(watcher_mod, "_is_watcher_pid", lambda _pid, _vm_name: True)
     monkeypatch.setattr(watcher_mod, "_signal_watcher_pid", lambda _pid, sig: seen_signals.append(sig))
-    monkeypatch.setattr(watcher_mod.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(watcher_mod, "_wait_pid_exit", lambda pid, timeout: waits.append((pid, timeout)) or False)
+    monkeypatch.setattr(watcher_mod, "_pid_running", lambda pid: pid_running_calls.append(pid) or True)
 
     assert watcher_mod.stop_vm_watcher(tmp_path, "clawbox-91", timeout_seconds=0) is True
+    assert seen_signals == [signal.SIGKILL]
+    assert waits == []
+    assert pid_running_calls == []
+    assert not record_file.exists()
+
+    watcher_mod._write_record(
+        tmp_path,
+        watcher_mod.WatcherRecord(
+            vm_name="clawbox-91", pid=9999, poll_seconds=2, started_at="2026-01-01T00:00:00Z"
+        ),
+    )
+    seen_signals.clear()
+    assert watcher_mod.stop_vm_watcher(tmp_path, "clawbox-91", timeout_seconds=3) is True
     assert seen_signals == [signal.SIGTERM, signal.SIGKILL]
+    assert waits == [(9999, 3)]
+
+
+def test_stop_vm_watcher_kills_and_reaps_own_child_without_timeout(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)"],
+        start_new_session=True,
+    )
+    try:
+        watcher_mod._write_record(
+            tmp_path,
+            watcher_mod.WatcherRecord(
+                vm_name="clawbox-91",
+                pid=child.pid,
+                poll_seconds=2,
+                started_at="2026-01-01T00:00:00Z",
+                parent_pid=os.getpid(),
+            ),
+        )
+        monkeypatch.setattr(watcher_mod, "_is_watcher_pid", lambda _pid, _vm_name: True)
+
+        assert watcher_mod.stop_vm_watcher(tmp_path, "clawbox-91", timeout_seconds=0) is True
+        with pytest.raises(ChildProcessError):
+            os.waitpid(child.pid, os.WNOHANG)
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_stop_vm_watcher_bounds_reap_of_killed_child(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    watcher_mod._write_record(
+        tmp_path,
+        watcher_mod.WatcherRecord(
+            vm_name="clawbox-91",
+            pid=9999,
+            poll_seconds=2,
+            started_at="2026-01-01T00:00:00Z",
+            parent_pid=os.getpid(),
+        ),
+    )
+    reaps: list[tuple[int, float]] = []
+    monkeypatch.setattr(watcher_mod, "_is_watcher_pid", lambda _pid, _vm_name: True)
+    monkeypatch.setattr(watcher_mod, "_signal_watcher_pid", lambda _pid, _sig: None)
+    monkeypatch.setattr(
+        watcher_mod, "_wait_child_exit", lambda pid, timeout: reaps.append((pid, timeout)) or False
+    )
+
+    assert watcher_mod.stop_vm_watcher(tmp_path, "clawbox-91", timeout_seconds=0) is True
+    assert reaps == [(9999, watcher_mod._KILLED_CHILD_REAP_SECONDS)]
+
+
+@pytest.mark.skipif(not watcher_mod._HAS_PIDFD, reason="pidfd_open is Linux-only")
+def test_wait_pid_exit_waits_on_pidfd() -> None:
+    sleeper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        assert watcher_mod._wait_pid_exit(sleeper.pid, 0.05) is False
+        sleeper.terminate()
+        assert watcher_mod._wait_pid_exit(sleeper.pid, 5) is True
+    finally:
+        sleeper.kill()
+        sleeper.wait()
 
 
 def test_reconcile_vm_watchers_handles_invalid_records_and_dead_pids(
@@ -334,14 +673,23 @@ def test_reconcile_vm_watchers_handles_invalid_records_and_dead_pids(
         def vm_running(self, vm_name: str) -> bool:
             return vm_name == "clawbox-91"
 
-    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: False)
+    monkeypatch.setattr(watcher_mod, "_live_pids", lambda: frozenset())
     cleaned: list[str] = []
     monkeypatch.setattr(watcher_mod, "cleanup_locks_for_vm", lambda name: cleaned.append(name))
 
+    (watchers_dir / "notes.txt").write_text("ignored", encoding="utf-8")
+    (watchers_dir / "nested.json").mkdir()
+    scanned: list[str] = []
+    real_scandir = watcher_mod.os.scandir
+    monkeypatch.setattr(watcher_mod.os, "scandir", lambda path: scanned.append(str(path)) or real_scandir(path))
+
     watcher_mod.reconcile_vm_watchers(_Tart(), tmp_path)
     assert cleaned == ["clawbox-92"]
     assert not bad_record.exists()
     assert not dead_record.exists()
+    assert scanned == [str(watchers_dir)]
+    assert (watchers_dir / "notes.txt").exists()
+    assert (watchers_dir / "nested.json").is_dir()
 
 
 def test_reconcile_vm_watchers_ignores_tart_errors_for_dead_pids(
@@ -366,7 +714,7 @@ def test_reconcile_vm_watchers_ignores_tart_errors_for_dead_pids(
         def vm_running(self, _vm_name: str) -> bool:
             raise TartError("tart unavailable")
 
-    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: False)
+    monkeypatch.setattr(watcher_mod, "_live_pids", lambda: frozenset())
     cleaned: list[str] = []
     monkeypatch.setattr(watcher_mod, "cleanup_locks_for_vm", lambda name: cleaned.append(name))
 
@@ -398,6 +746,9 @@ def test_run_vm_watcher_loop_handles_tart_errors_and_mutagen_errors(
         def __init__(self):
             self.calls = 0
 
+        def vm_pid(self, _vm_name: str) -> int | None:
+            return None
+
         def vm_running(self, _vm_name: str) -> bool:
             self.calls += 1
             if self.calls == 1:
@@ -419,6 +770,71 @@ def test_run_vm_watcher_loop_handles_tart_errors_and_mutagen_errors(
     assert not record_file.exists()
 
 
+def _run_loop_against_exiting_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, running_sequence: list[bool]
+) -> tuple[list[float], list[dict[str, object]], list[int]]:
+    vm_process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    pids: list[int | None] = [vm_process.pid, None]
+
+    class _Tart:
+        def vm_pid(self, _vm_name: str) -> int | None:
+            return pids.pop(0)
+
+        def vm_running(self, _vm_name: str) -> bool:
+            return running_sequence.pop(0)
+
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        if not running_sequence:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(watcher_mod.time, "sleep", fake_sleep)
+    monkeypatch.setattr(watcher_mod.signal, "signal", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(watcher_mod, "teardown_vm_sync", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(watcher_mod, "cleanup_locks_for_vm", lambda _name: None)
+    events: list[dict[str, object]] = []
+
+    def record_event(_state_dir, _vm_name, *, event, actor, reason, details=None) -> None:
+        events.append({"event": event, **(details or {})})
+
+    monkeypatch.setattr(watcher_mod, "emit_sync_event", record_event)
+
+    try:
+        watcher_mod.run_vm_watcher_loop(tart=_Tart(), state_dir=tmp_path, vm_name="clawbox-96", poll_seconds=30)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        vm_process.kill()
+        vm_process.wait()
+    return sleeps, events, pids
+
+
+@pytest.mark.skipif(not watcher_mod._HAS_PIDFD, reason="pidfd_open is Linux-only")
+def test_run_vm_watcher_loop_polls_immediately_when_vm_process_exits(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sleeps, events, _pids = _run_loop_against_exiting_process(tmp_path, monkeypatch, [True, False, False, False])
+
+    assert sleeps == [30, 30]
+    assert events[0]["event"] == "watcher_teardown_triggered"
+    assert events[0]["consecutive_not_running_polls"] == 3
+    assert events[0]["vm_process_exited"] is True
+    assert events[-1]["event"] == "watcher_teardown_complete"
+
+
+@pytest.mark.skipif(not watcher_mod._HAS_PIDFD, reason="pidfd_open is Linux-only")
+def test_run_vm_watcher_loop_keeps_sync_when_exited_process_was_not_the_vm(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sleeps, events, pids = _run_loop_against_exiting_process(tmp_path, monkeypatch, [True, True])
+
+    assert sleeps == [30]
+    assert pids == []
+    assert events == []
+
+
 def test_run_vm_watcher_loop_requires_consecutive_not_running_polls(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -443,6 +859,9 @@ def test_run_vm_watcher_loop_requires_consecutive_not_running_polls(
             self.calls = 0
             self.sequence = [True, False, True, False, False, False]
 
+        def vm_pid(self, _vm_name: str) -> int | None:
+            return None
+
         def vm_running(self, _vm_name: str) -> bool:
             self.calls += 1
             if self.calls <= len(self.sequence):